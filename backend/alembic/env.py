@@ -26,6 +26,11 @@ from app.models.event_log import EventLog  # noqa: F401
 from app.models.message import Message  # noqa: F401
 from app.models.staff_permission import StaffPermission  # noqa: F401
 from app.models.automation_log import AutomationLog  # noqa: F401
+from app.models.workspace_daily_stats import WorkspaceDailyStats  # noqa: F401
+from app.models.automation_idempotency import AutomationIdempotency  # noqa: F401
+from app.models.automation_rule_override import AutomationRuleOverride  # noqa: F401
+from app.models.workspace_flag import WorkspaceFlag  # noqa: F401
+from app.models.cache_version import CacheVersion  # noqa: F401
 
 # Alembic Config object
 config = context.config
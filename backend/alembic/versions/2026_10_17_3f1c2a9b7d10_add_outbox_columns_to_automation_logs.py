@@ -0,0 +1,41 @@
+"""add_outbox_columns_to_automation_logs
+
+Revision ID: 3f1c2a9b7d10
+Revises: 010c9facad0f
+Create Date: 2026-10-17 09:12:40.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import text
+
+revision: str = '3f1c2a9b7d10'
+down_revision: Union[str, None] = '010c9facad0f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('automation_logs', sa.Column('payload', sa.JSON(), nullable=True))
+    op.add_column('automation_logs', sa.Column('attempts', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('automation_logs', sa.Column('next_attempt_at', sa.DateTime(timezone=True), nullable=True))
+    op.add_column('automation_logs', sa.Column('locked_at', sa.DateTime(timezone=True), nullable=True))
+    op.add_column('automation_logs', sa.Column('last_error', sa.Text(), nullable=True))
+    op.create_index('ix_autolog_status_next_attempt', 'automation_logs', ['status', 'next_attempt_at'], unique=False)
+
+    # Rows left "pending" by the old inline dispatcher have no payload to replay
+    op.get_bind().execute(text(
+        "UPDATE automation_logs SET status = 'skipped', "
+        "last_error = 'pending before outbox migration' WHERE status = 'pending'"
+    ))
+
+
+def downgrade() -> None:
+    op.drop_index('ix_autolog_status_next_attempt', table_name='automation_logs')
+    op.drop_column('automation_logs', 'last_error')
+    op.drop_column('automation_logs', 'locked_at')
+    op.drop_column('automation_logs', 'next_attempt_at')
+    op.drop_column('automation_logs', 'attempts')
+    op.drop_column('automation_logs', 'payload')
@@ -0,0 +1,53 @@
+"""add_booking_time_range_exclusion
+
+Revision ID: 5b0e7f3d9a21
+Revises: c72a9e03f4b8
+Create Date: 2026-10-17 16:22:09.584113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy import text
+
+revision: str = '5b0e7f3d9a21'
+down_revision: Union[str, None] = 'c72a9e03f4b8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    conn.execute(text("CREATE EXTENSION IF NOT EXISTS btree_gist"))
+
+    conn.execute(text("""
+        ALTER TABLE bookings ADD COLUMN time_range tstzrange
+        GENERATED ALWAYS AS (
+            CASE WHEN start_time IS NOT NULL AND end_time IS NOT NULL AND end_time > start_time
+                 THEN tstzrange(start_time, end_time, '[)') END
+        ) STORED
+    """))
+
+    # Confirmations that raced past the old check would block the constraint:
+    # keep the earliest confirmed booking and send the later ones back to pending.
+    conn.execute(text("""
+        UPDATE bookings b SET status = 'PENDING'
+        WHERE b.status = 'CONFIRMED' AND EXISTS (
+            SELECT 1 FROM bookings o
+            WHERE o.workspace_id = b.workspace_id
+              AND o.status = 'CONFIRMED'
+              AND o.time_range && b.time_range
+              AND (o.created_at, o.id) < (b.created_at, b.id)
+        )
+    """))
+
+    conn.execute(text("""
+        ALTER TABLE bookings ADD CONSTRAINT ex_booking_confirmed_overlap
+        EXCLUDE USING gist (workspace_id WITH =, time_range WITH &&)
+        WHERE (status = 'CONFIRMED')
+    """))
+
+
+def downgrade() -> None:
+    op.drop_constraint('ex_booking_confirmed_overlap', 'bookings', type_='exclude')
+    op.drop_column('bookings', 'time_range')
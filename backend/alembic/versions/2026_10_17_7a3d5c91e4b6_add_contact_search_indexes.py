@@ -0,0 +1,53 @@
+"""add_contact_search_indexes
+
+Revision ID: 7a3d5c91e4b6
+Revises: e19b4c6d8f02
+Create Date: 2026-10-17 19:30:12.447810
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy import text
+
+revision: str = '7a3d5c91e4b6'
+down_revision: Union[str, None] = 'e19b4c6d8f02'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    # Lets GIN indexes lead with workspace_id
+    conn.execute(text("CREATE EXTENSION IF NOT EXISTS btree_gin"))
+
+    conn.execute(text("""
+        ALTER TABLE contacts ADD COLUMN search_vector tsvector
+        GENERATED ALWAYS AS (
+            to_tsvector('simple'::regconfig, coalesce(name, '') || ' ' || coalesce(email, '') || ' '
+                || translate(coalesce(email, ''), '@._-+', '     '))
+        ) STORED
+    """))
+    conn.execute(text("""
+        ALTER TABLE contacts ADD COLUMN phone_digits varchar(50)
+        GENERATED ALWAYS AS (regexp_replace(coalesce(phone, ''), '[^0-9]', '', 'g')) STORED
+    """))
+
+    conn.execute(text(
+        "CREATE INDEX ix_contacts_search_vector ON contacts USING gin (workspace_id, search_vector)"
+    ))
+    conn.execute(text(
+        "CREATE INDEX ix_contacts_name_trgm ON contacts USING gin (workspace_id, name gin_trgm_ops)"
+    ))
+    conn.execute(text(
+        "CREATE INDEX ix_contacts_phone_digits ON contacts (workspace_id, phone_digits text_pattern_ops)"
+    ))
+
+
+def downgrade() -> None:
+    op.drop_index('ix_contacts_phone_digits', table_name='contacts')
+    op.drop_index('ix_contacts_name_trgm', table_name='contacts')
+    op.drop_index('ix_contacts_search_vector', table_name='contacts')
+    op.drop_column('contacts', 'phone_digits')
+    op.drop_column('contacts', 'search_vector')
@@ -0,0 +1,65 @@
+"""create_workspace_daily_stats
+
+Revision ID: 8d4e6b1a2c55
+Revises: 3f1c2a9b7d10
+Create Date: 2026-10-17 11:40:02.731950
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import text
+
+revision: str = '8d4e6b1a2c55'
+down_revision: Union[str, None] = '3f1c2a9b7d10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('workspace_daily_stats',
+        sa.Column('workspace_id', sa.Integer(), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('new_contacts', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('bookings_created', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('bookings_pending', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('bookings_confirmed', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('bookings_completed', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('bookings_cancelled', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('submissions', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('alerts', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['workspace_id'], ['workspaces.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('workspace_id', 'day')
+    )
+
+    # Backfill from the raw tables so incremental updates start from a correct base
+    op.get_bind().execute(text("""
+        INSERT INTO workspace_daily_stats (
+            workspace_id, day, new_contacts, bookings_created, bookings_pending,
+            bookings_confirmed, bookings_completed, bookings_cancelled, submissions, alerts
+        )
+        SELECT workspace_id, day, SUM(c), SUM(b), SUM(bp), SUM(bcf), SUM(bco), SUM(bca), SUM(s), SUM(a)
+        FROM (
+            SELECT workspace_id, (created_at AT TIME ZONE 'UTC')::date AS day,
+                1 AS c, 0 AS b, 0 AS bp, 0 AS bcf, 0 AS bco, 0 AS bca, 0 AS s, 0 AS a
+            FROM contacts WHERE is_deleted = false
+            UNION ALL
+            SELECT workspace_id, (created_at AT TIME ZONE 'UTC')::date, 0, 1,
+                (status::text = 'PENDING')::int, (status::text = 'CONFIRMED')::int,
+                (status::text = 'COMPLETED')::int, (status::text = 'CANCELLED')::int, 0, 0
+            FROM bookings
+            UNION ALL
+            SELECT workspace_id, (created_at AT TIME ZONE 'UTC')::date, 0, 0, 0, 0, 0, 0, 1, 0
+            FROM form_submissions
+            UNION ALL
+            SELECT workspace_id, (created_at AT TIME ZONE 'UTC')::date, 0, 0, 0, 0, 0, 0, 0, 1
+            FROM alerts
+        ) src
+        GROUP BY workspace_id, day
+    """))
+
+
+def downgrade() -> None:
+    op.drop_table('workspace_daily_stats')
@@ -0,0 +1,90 @@
+"""partition_log_tables
+
+Revision ID: 9c4e1d7b2a68
+Revises: f2b7c4e9a105
+Create Date: 2026-10-17 23:48:05.240917
+
+"""
+from datetime import date
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '9c4e1d7b2a68'
+down_revision: Union[str, None] = 'f2b7c4e9a105'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PREMAKE_MONTHS = 2
+
+_INDEXES = {
+    'event_logs': [
+        ('ix_event_logs_event_type', ['event_type']),
+        ('ix_event_logs_id', ['id']),
+        ('ix_event_logs_workspace_id', ['workspace_id']),
+        ('ix_eventlog_workspace_created', ['workspace_id', 'created_at']),
+    ],
+    'automation_logs': [
+        ('ix_automation_logs_event_type', ['event_type']),
+        ('ix_automation_logs_id', ['id']),
+        ('ix_automation_logs_workspace_id', ['workspace_id']),
+        ('ix_autolog_workspace_created', ['workspace_id', 'created_at']),
+        ('ix_autolog_status_next_attempt', ['status', 'next_attempt_at']),
+    ],
+}
+
+
+def _add_months(month: date, n: int) -> date:
+    index = month.year * 12 + month.month - 1 + n
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _swap_in(table: str, new_table: str, primary_key: list[str]) -> None:
+    """Copy rows into `new_table`, drop `table` and take over its name, sequence and indexes."""
+    seq = op.get_bind().execute(sa.text("SELECT pg_get_serial_sequence(:t, 'id')"), {"t": table}).scalar()
+    op.execute(f"INSERT INTO {new_table} SELECT * FROM {table}")
+    op.execute(f"ALTER SEQUENCE {seq} OWNED BY NONE")
+    op.execute(f"DROP TABLE {table}")
+    op.execute(f"ALTER TABLE {new_table} RENAME TO {table}")
+    op.execute(f"ALTER SEQUENCE {seq} OWNED BY {table}.id")
+    op.create_primary_key(f'{table}_pkey', table, primary_key)
+    op.create_foreign_key(f'{table}_workspace_id_fkey', table, 'workspaces', ['workspace_id'], ['id'], ondelete='CASCADE')
+    for name, columns in _INDEXES[table]:
+        op.create_index(name, table, columns, unique=False)
+
+
+def _partition(table: str) -> None:
+    first = op.get_bind().execute(sa.text(
+        f"SELECT date_trunc('month', min(created_at) AT TIME ZONE 'UTC') FROM {table}"
+    )).scalar()
+    this_month = date.today().replace(day=1)
+    month = first.date() if first else this_month
+    last = _add_months(max(month, this_month), PREMAKE_MONTHS)
+
+    op.execute(f"CREATE TABLE {table}_partitioned (LIKE {table} INCLUDING DEFAULTS) PARTITION BY RANGE (created_at)")
+    while month <= last:
+        op.execute(
+            f"CREATE TABLE {table}_p{month:%Y%m} PARTITION OF {table}_partitioned "
+            f"FOR VALUES FROM ('{month} 00:00:00+00') TO ('{_add_months(month, 1)} 00:00:00+00')"
+        )
+        month = _add_months(month, 1)
+    op.execute(f"CREATE TABLE {table}_default PARTITION OF {table}_partitioned DEFAULT")
+    _swap_in(table, f"{table}_partitioned", ['id', 'created_at'])
+
+
+def _unpartition(table: str) -> None:
+    op.execute(f"CREATE TABLE {table}_plain (LIKE {table} INCLUDING DEFAULTS)")
+    _swap_in(table, f"{table}_plain", ['id'])
+
+
+def upgrade() -> None:
+    op.add_column('workspaces', sa.Column('log_retention_days', sa.Integer(), nullable=True))
+    for table in _INDEXES:
+        _partition(table)
+
+
+def downgrade() -> None:
+    for table in _INDEXES:
+        _unpartition(table)
+    op.drop_column('workspaces', 'log_retention_days')
@@ -0,0 +1,48 @@
+"""create_automation_idempotency
+
+Revision ID: a4c8e2f61b37
+Revises: 7a3d5c91e4b6
+Create Date: 2026-10-17 20:58:41.116203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import text
+
+revision: str = 'a4c8e2f61b37'
+down_revision: Union[str, None] = '7a3d5c91e4b6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('automation_idempotency',
+        sa.Column('workspace_id', sa.Integer(), nullable=False),
+        sa.Column('unique_key', sa.String(length=255), nullable=False),
+        sa.Column('rule_key', sa.String(length=100), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(['workspace_id'], ['workspaces.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('workspace_id', 'unique_key')
+    )
+    op.create_index('ix_automation_idempotency_expires', 'automation_idempotency', ['expires_at'], unique=False)
+
+    # Carry over keys of recent successful runs so they are not repeated
+    op.get_bind().execute(text("""
+        INSERT INTO automation_idempotency (workspace_id, unique_key, rule_key, created_at, expires_at)
+        SELECT workspace_id, payload ->> 'unique_key', split_part(payload ->> 'unique_key', ':', 1),
+               MIN(created_at), MIN(created_at) + interval '30 days'
+        FROM event_logs
+        WHERE event_type = 'automation_executed'
+          AND status = 'success'
+          AND payload ->> 'unique_key' IS NOT NULL
+          AND created_at > now() - interval '30 days'
+        GROUP BY workspace_id, payload ->> 'unique_key'
+    """))
+
+
+def downgrade() -> None:
+    op.drop_index('ix_automation_idempotency_expires', table_name='automation_idempotency')
+    op.drop_table('automation_idempotency')
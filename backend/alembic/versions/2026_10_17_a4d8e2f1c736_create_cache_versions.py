@@ -0,0 +1,28 @@
+"""create_cache_versions
+
+Revision ID: a4d8e2f1c736
+Revises: 9c4e1d7b2a68
+Create Date: 2026-10-17 23:58:12.418305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = 'a4d8e2f1c736'
+down_revision: Union[str, None] = '9c4e1d7b2a68'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('cache_versions',
+        sa.Column('key', sa.String(length=200), nullable=False),
+        sa.Column('version', sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint('key')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('cache_versions')
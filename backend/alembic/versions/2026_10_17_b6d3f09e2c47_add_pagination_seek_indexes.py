@@ -0,0 +1,35 @@
+"""add_pagination_seek_indexes
+
+Revision ID: b6d3f09e2c47
+Revises: a4d8e2f1c736
+Create Date: 2026-10-18 00:21:40.562917
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = 'b6d3f09e2c47'
+down_revision: Union[str, None] = 'a4d8e2f1c736'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Keyset pagination seeks: workspace filter first, then the sort keys in list order
+    op.create_index('ix_alert_workspace_read_created', 'alerts',
+                    ['workspace_id', 'is_read', sa.text('created_at DESC'), sa.text('id DESC')], unique=False)
+    op.create_index('ix_conversation_workspace_last_message', 'conversations',
+                    ['workspace_id', sa.text('last_message_at DESC NULLS LAST'), sa.text('id DESC')], unique=False)
+    op.create_index('ix_form_workspace_created', 'forms',
+                    ['workspace_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_submission_workspace_form_created', 'form_submissions',
+                    ['workspace_id', 'form_id', 'created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_submission_workspace_form_created', table_name='form_submissions')
+    op.drop_index('ix_form_workspace_created', table_name='forms')
+    op.drop_index('ix_conversation_workspace_last_message', table_name='conversations')
+    op.drop_index('ix_alert_workspace_read_created', table_name='alerts')
@@ -0,0 +1,40 @@
+"""create_automation_rule_overrides
+
+Revision ID: c3e9a7d25f80
+Revises: a4c8e2f61b37
+Create Date: 2026-10-17 21:44:19.530287
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = 'c3e9a7d25f80'
+down_revision: Union[str, None] = 'a4c8e2f61b37'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('automation_rule_overrides',
+        sa.Column('workspace_id', sa.Integer(), nullable=False),
+        sa.Column('rule_key', sa.String(length=100), nullable=False),
+        sa.Column('trigger', sa.String(length=100), nullable=True),
+        sa.Column('description', sa.String(length=500), nullable=True),
+        sa.Column('actions', sa.JSON(), nullable=False),
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['workspace_id'], ['workspaces.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('workspace_id', 'rule_key', name='uq_rule_override_workspace_key')
+    )
+    op.create_index(op.f('ix_automation_rule_overrides_id'), 'automation_rule_overrides', ['id'], unique=False)
+    op.create_index(op.f('ix_automation_rule_overrides_workspace_id'), 'automation_rule_overrides', ['workspace_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_automation_rule_overrides_workspace_id'), table_name='automation_rule_overrides')
+    op.drop_index(op.f('ix_automation_rule_overrides_id'), table_name='automation_rule_overrides')
+    op.drop_table('automation_rule_overrides')
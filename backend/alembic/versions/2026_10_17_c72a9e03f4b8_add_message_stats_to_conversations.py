@@ -0,0 +1,45 @@
+"""add_message_stats_to_conversations
+
+Revision ID: c72a9e03f4b8
+Revises: 8d4e6b1a2c55
+Create Date: 2026-10-17 14:05:51.402716
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import text
+
+revision: str = 'c72a9e03f4b8'
+down_revision: Union[str, None] = '8d4e6b1a2c55'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('conversations', sa.Column('message_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('conversations', sa.Column('last_message_preview', sa.String(length=200), nullable=True))
+
+    # Backfill counts and the newest message's preview in one pass
+    op.get_bind().execute(text("""
+        UPDATE conversations c
+        SET message_count = s.cnt,
+            last_message_preview = s.preview
+        FROM (
+            SELECT DISTINCT ON (conversation_id)
+                conversation_id,
+                COUNT(*) OVER (PARTITION BY conversation_id) AS cnt,
+                CASE WHEN length(COALESCE(content, body, '')) > 120
+                     THEN left(COALESCE(content, body, ''), 120) || '…'
+                     ELSE COALESCE(content, body, '') END AS preview
+            FROM messages
+            ORDER BY conversation_id, created_at DESC, id DESC
+        ) s
+        WHERE s.conversation_id = c.id
+    """))
+
+
+def downgrade() -> None:
+    op.drop_column('conversations', 'last_message_preview')
+    op.drop_column('conversations', 'message_count')
@@ -0,0 +1,32 @@
+"""create_workspace_flags
+
+Revision ID: d81f4b6a3c92
+Revises: c3e9a7d25f80
+Create Date: 2026-10-17 22:31:56.804412
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = 'd81f4b6a3c92'
+down_revision: Union[str, None] = 'c3e9a7d25f80'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('workspace_flags',
+        sa.Column('workspace_id', sa.Integer(), nullable=False),
+        sa.Column('kind', sa.String(length=20), nullable=False),
+        sa.Column('key', sa.String(length=100), nullable=False),
+        sa.Column('enabled', sa.Boolean(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['workspace_id'], ['workspaces.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('workspace_id', 'kind', 'key')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('workspace_flags')
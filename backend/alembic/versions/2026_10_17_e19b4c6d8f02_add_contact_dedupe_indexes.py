@@ -0,0 +1,27 @@
+"""add_contact_dedupe_indexes
+
+Revision ID: e19b4c6d8f02
+Revises: 5b0e7f3d9a21
+Create Date: 2026-10-17 18:47:33.201558
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = 'e19b4c6d8f02'
+down_revision: Union[str, None] = '5b0e7f3d9a21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Bulk import dedupes on case-insensitive email and on phone
+    op.create_index('ix_workspace_email_lower', 'contacts', ['workspace_id', sa.text('lower(email)')], unique=False)
+    op.create_index('ix_workspace_phone', 'contacts', ['workspace_id', 'phone'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_workspace_phone', table_name='contacts')
+    op.drop_index('ix_workspace_email_lower', table_name='contacts')
@@ -0,0 +1,26 @@
+"""event_logs_nullable_workspace
+
+Revision ID: f2b7c4e9a105
+Revises: d81f4b6a3c92
+Create Date: 2026-10-17 23:12:40.517093
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = 'f2b7c4e9a105'
+down_revision: Union[str, None] = 'd81f4b6a3c92'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Scheduler job runs are logged without a workspace
+    op.alter_column('event_logs', 'workspace_id', existing_type=sa.Integer(), nullable=True)
+
+
+def downgrade() -> None:
+    op.execute("DELETE FROM event_logs WHERE workspace_id IS NULL")
+    op.alter_column('event_logs', 'workspace_id', existing_type=sa.Integer(), nullable=False)
@@ -3,7 +3,7 @@ Auth API – registration, login, logout, and current user.
 Hardened with httpOnly cookies, CSRF protection, and rate limiting.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, Response, Request, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, status, Response, Request
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
@@ -20,8 +20,8 @@ from app.schemas.auth import (
     PermissionsPayload,
 )
 from app.core.csrf import generate_csrf_token
-from app.core.rate_limit import limit_requests
-from app.services.event_dispatcher import dispatch_event_background
+from app.core.rate_limit import AUTH_POLICY, rate_limit
+from app.services.event_dispatcher import dispatch_event
 from app.services.demo_seeder import seed_demo_data
 from app.utils.enums import UserRole, WorkspaceStatus, AutomationEventType
 
@@ -58,8 +58,8 @@ def _set_auth_cookies(response: Response, access_token: str, csrf_token: str):
     )
 
 
-@router.post("/register", response_model=TokenWithUser, status_code=status.HTTP_201_CREATED, dependencies=[Depends(limit_requests)])
-def register(response: Response, payload: UserCreate, background_tasks: BackgroundTasks, db: Session = Depends(get_db)):
+@router.post("/register", response_model=TokenWithUser, status_code=status.HTTP_201_CREATED, dependencies=[Depends(rate_limit(AUTH_POLICY))])
+def register(response: Response, payload: UserCreate, db: Session = Depends(get_db)):
     """
     Register a new Owner. Creates a workspace and the first user.
     Sets httpOnly session cookie and returns a CSRF token.
@@ -91,6 +91,15 @@ def register(response: Response, payload: UserCreate, background_tasks: Backgrou
         is_active=True,
     )
     db.add(user)
+    db.flush()
+
+    # Welcome email goes through the outbox, committed with the new account
+    dispatch_event(
+        workspace_id=workspace.id,
+        event_type=AutomationEventType.OWNER_REGISTERED.value,
+        reference_id=user.id,
+        db=db,
+    )
     db.commit()
     db.refresh(user)
 
@@ -102,24 +111,14 @@ def register(response: Response, payload: UserCreate, background_tasks: Backgrou
     csrf_token = generate_csrf_token()
     _set_auth_cookies(response, access_token, csrf_token)
 
-    # Send welcome email (owner only, non-blocking)
-    # Dispatch welcome event
-    background_tasks.add_task(
-        dispatch_event_background, 
-        workspace.id, 
-        AutomationEventType.OWNER_REGISTERED.value, 
-        user.id,
-        {} 
-    )
-
     return TokenWithUser(
         access_token="cookie-based", 
         user=UserResponse.model_validate(user),
     )
 
 
-@router.post("/login", response_model=TokenWithUser, dependencies=[Depends(limit_requests)])
-def login(response: Response, payload: UserLogin, background_tasks: BackgroundTasks, db: Session = Depends(get_db)):
+@router.post("/login", response_model=TokenWithUser, dependencies=[Depends(rate_limit(AUTH_POLICY))])
+def login(response: Response, payload: UserLogin, db: Session = Depends(get_db)):
     """
     Login with JSON credentials. Works for both owner and staff (via email).
     Sets httpOnly session cookie.
@@ -146,15 +145,15 @@ def login(response: Response, payload: UserLogin, background_tasks: BackgroundTa
     csrf_token = generate_csrf_token()
     _set_auth_cookies(response, access_token, csrf_token)
 
-    # Send login notification (owner only, non-blocking)
+    # Send login notification (owner only, delivered by the outbox worker)
     if user.role == UserRole.OWNER:
-        background_tasks.add_task(
-            dispatch_event_background,
-            user.workspace_id,
-            AutomationEventType.OWNER_LOGGED_IN.value,
-            user.id,
-            {}
+        dispatch_event(
+            workspace_id=user.workspace_id,
+            event_type=AutomationEventType.OWNER_LOGGED_IN.value,
+            reference_id=user.id,
+            db=db,
         )
+        db.commit()
 
     return TokenWithUser(
         access_token="cookie-based", 
@@ -209,7 +208,7 @@ def _get_or_create_demo_user(db: Session) -> User:
     return user
 
 
-@router.post("/demo-login", response_model=TokenWithUser, dependencies=[Depends(limit_requests)])
+@router.post("/demo-login", response_model=TokenWithUser, dependencies=[Depends(rate_limit(AUTH_POLICY))])
 def demo_login(response: Response, db: Session = Depends(get_db)):
     """
     Login endpoint for public demo mode. No credentials required.
@@ -238,7 +237,7 @@ def demo_login(response: Response, db: Session = Depends(get_db)):
     )
 
 
-@router.post("/staff-login", response_model=TokenWithUser, dependencies=[Depends(limit_requests)])
+@router.post("/staff-login", response_model=TokenWithUser, dependencies=[Depends(rate_limit(AUTH_POLICY))])
 def staff_login(response: Response, payload: StaffLogin, db: Session = Depends(get_db)):
     """
     Staff-specific login: requires staff_id + email + password.
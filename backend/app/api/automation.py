@@ -1,5 +1,6 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
+from typing import Optional
 from sqlalchemy import func, desc, case
 from datetime import datetime, timezone, timedelta
 
@@ -7,7 +8,10 @@ from app.core.database import get_db
 from app.core.dependencies import require_owner
 from app.models.user import User
 from app.models.event_log import EventLog
-from app.services.automation_registry import AUTOMATION_RULES
+from app.models.automation_rule_override import AutomationRuleOverride
+from app.services.automation_registry import AUTOMATION_RULES, registry, validate_actions
+from app.services.log_partitions import retention_start
+from app.services.workspace_flags import RULE, FEATURE, is_rule_enabled, is_feature_enabled, set_flag
 
 router = APIRouter(prefix="/automation", tags=["Automation"])
 
@@ -15,13 +19,7 @@ router = APIRouter(prefix="/automation", tags=["Automation"])
 from pydantic import BaseModel
 
 
-# ── In-Memory Toggle Store (per workspace) ───────────────────────
-# Key: "ws_{workspace_id}:{rule_key}" → bool
-_rule_toggles: dict[str, bool] = {}
-
-# Feature flags per workspace: "ws_{workspace_id}:feature:{name}" → bool
-_feature_flags: dict[str, bool] = {}
-
+# Toggles and feature flags are persisted in workspace_flags (services/workspace_flags.py)
 FEATURES = [
     {"key": "customer_emails", "label": "Customer Emails", "description": "Send confirmation & welcome emails to customers", "category": "notifications"},
     {"key": "staff_sms_alerts", "label": "Staff SMS Alerts", "description": "Send SMS to staff on low inventory & critical failures", "category": "notifications"},
@@ -31,20 +29,16 @@ FEATURES = [
 ]
 
 
-def _toggle_key(ws_id: int, rule_key: str) -> str:
-    return f"ws_{ws_id}:{rule_key}"
-
-def _feature_key(ws_id: int, feature: str) -> str:
-    return f"ws_{ws_id}:feature:{feature}"
-
-def is_rule_enabled(ws_id: int, rule_key: str) -> bool:
-    return _rule_toggles.get(_toggle_key(ws_id, rule_key), True)  # default: enabled
-
-
 class TogglePayload(BaseModel):
     enabled: bool
 
 
+class RuleOverridePayload(BaseModel):
+    actions: list[dict]
+    trigger: Optional[str] = None       # required when adding a custom rule
+    description: Optional[str] = None
+
+
 # ── Rules (with live metrics + toggle state) ─────────────────────
 
 @router.get("/rules")
@@ -53,7 +47,7 @@ def get_rules(current_user: User = Depends(require_owner()), db: Session = Depen
     now = datetime.now(timezone.utc)
     since = now - timedelta(hours=24)
 
-    # Fetch per-rule stats in one query
+    # Fetch per-rule stats in one query (the created_at bound prunes older partitions)
     rule_stats = db.query(
         EventLog.source,
         func.count(EventLog.id).label("exec_count"),
@@ -77,16 +71,71 @@ def get_rules(current_user: User = Depends(require_owner()), db: Session = Depen
 
     return [
         {
-            **r.dict(),
-            "enabled": is_rule_enabled(current_user.workspace_id, r.key),
-            "exec_count_24h": stats_map.get(r.key, {}).get("exec_count_24h", 0),
-            "last_triggered": stats_map.get(r.key, {}).get("last_triggered", None),
-            "success_rate_24h": stats_map.get(r.key, {}).get("success_rate_24h", 100),
+            **entry.rule.dict(),
+            "actions": list(entry.actions),
+            "custom": entry.rule.custom,
+            "overridden": entry.actions != entry.rule.actions,
+            "enabled": is_rule_enabled(current_user.workspace_id, entry.rule.key),
+            "exec_count_24h": stats_map.get(entry.rule.key, {}).get("exec_count_24h", 0),
+            "last_triggered": stats_map.get(entry.rule.key, {}).get("last_triggered", None),
+            "success_rate_24h": stats_map.get(entry.rule.key, {}).get("success_rate_24h", 100),
         }
-        for r in AUTOMATION_RULES
+        for entry in registry.all_rules(current_user.workspace_id, db)
     ]
 
 
+# ── Rule Overrides (persisted, per workspace) ────────────────────
+
+@router.put("/rules/{rule_key}/override")
+def put_rule_override(
+    rule_key: str,
+    payload: RuleOverridePayload,
+    current_user: User = Depends(require_owner()),
+    db: Session = Depends(get_db),
+):
+    """Replace a built-in rule's actions, or add a custom rule, for this workspace."""
+    builtin = registry.get(rule_key)
+    if builtin and payload.trigger not in (None, builtin.trigger):
+        raise HTTPException(status_code=400, detail="Built-in rules cannot change trigger")
+    if not builtin and not payload.trigger:
+        raise HTTPException(status_code=400, detail="Custom rules need a trigger")
+    try:
+        validate_actions(payload.actions)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    override = db.query(AutomationRuleOverride).filter(
+        AutomationRuleOverride.workspace_id == current_user.workspace_id,
+        AutomationRuleOverride.rule_key == rule_key,
+    ).first()
+    if not override:
+        override = AutomationRuleOverride(workspace_id=current_user.workspace_id, rule_key=rule_key)
+        db.add(override)
+    override.trigger = None if builtin else payload.trigger
+    override.description = payload.description
+    override.actions = payload.actions
+    db.commit()
+    registry.invalidate_workspace(current_user.workspace_id)
+    return {"rule_key": rule_key, "trigger": builtin.trigger if builtin else payload.trigger, "actions": payload.actions}
+
+
+@router.delete("/rules/{rule_key}/override", status_code=204)
+def delete_rule_override(
+    rule_key: str,
+    current_user: User = Depends(require_owner()),
+    db: Session = Depends(get_db),
+):
+    """Restore a built-in rule's default actions, or remove a custom rule."""
+    deleted = db.query(AutomationRuleOverride).filter(
+        AutomationRuleOverride.workspace_id == current_user.workspace_id,
+        AutomationRuleOverride.rule_key == rule_key,
+    ).delete(synchronize_session=False)
+    if not deleted:
+        raise HTTPException(status_code=404, detail=f"No override for rule '{rule_key}'")
+    db.commit()
+    registry.invalidate_workspace(current_user.workspace_id)
+
+
 # ── Toggle Rule ──────────────────────────────────────────────────
 
 @router.patch("/rules/{rule_key}/toggle")
@@ -94,14 +143,14 @@ def toggle_rule(
     rule_key: str,
     payload: TogglePayload,
     current_user: User = Depends(require_owner()),
+    db: Session = Depends(get_db),
 ):
     """Enable or disable an automation rule for this workspace."""
-    valid_keys = {r.key for r in AUTOMATION_RULES}
+    valid_keys = {entry.rule.key for entry in registry.all_rules(current_user.workspace_id, db)}
     if rule_key not in valid_keys:
-        from fastapi import HTTPException
         raise HTTPException(status_code=404, detail=f"Rule '{rule_key}' not found")
 
-    _rule_toggles[_toggle_key(current_user.workspace_id, rule_key)] = payload.enabled
+    set_flag(db, current_user.workspace_id, RULE, rule_key, payload.enabled)
     return {"rule_key": rule_key, "enabled": payload.enabled}
 
 
@@ -114,7 +163,7 @@ def get_features(current_user: User = Depends(require_owner())):
     return [
         {
             **f,
-            "enabled": _feature_flags.get(_feature_key(ws_id, f["key"]), True),
+            "enabled": is_feature_enabled(ws_id, f["key"]),
         }
         for f in FEATURES
     ]
@@ -125,14 +174,14 @@ def toggle_feature(
     feature_key: str,
     payload: TogglePayload,
     current_user: User = Depends(require_owner()),
+    db: Session = Depends(get_db),
 ):
     """Toggle a feature flag for this workspace."""
     valid_keys = {f["key"] for f in FEATURES}
     if feature_key not in valid_keys:
-        from fastapi import HTTPException
         raise HTTPException(status_code=404, detail=f"Feature '{feature_key}' not found")
 
-    _feature_flags[_feature_key(current_user.workspace_id, feature_key)] = payload.enabled
+    set_flag(db, current_user.workspace_id, FEATURE, feature_key, payload.enabled)
     return {"feature_key": feature_key, "enabled": payload.enabled}
 
 
@@ -143,7 +192,8 @@ def get_metrics(current_user: User = Depends(require_owner()), db: Session = Dep
     """Return automation execution metrics (success vs failure)."""
     logs = db.query(EventLog.status, func.count(EventLog.id)).filter(
         EventLog.workspace_id == current_user.workspace_id,
-        EventLog.event_type.in_(["automation_executed", "automation_failed"])
+        EventLog.event_type.in_(["automation_executed", "automation_failed"]),
+        EventLog.created_at >= retention_start(db, current_user.workspace_id, now=datetime.now(timezone.utc)),
     ).group_by(EventLog.status).all()
 
     stats = {status: count for status, count in logs}
@@ -166,6 +216,7 @@ def get_engine_status(current_user: User = Depends(require_owner()), db: Session
     """
     Aggregated engine status — single call for the dashboard header.
     Returns: engine state, metrics, throughput, latency stats.
+    Every query bounds created_at so only the partitions in range are read.
     """
     now = datetime.now(timezone.utc)
     since_24h = now - timedelta(hours=24)
@@ -173,13 +224,14 @@ def get_engine_status(current_user: User = Depends(require_owner()), db: Session
 
     ws_id = current_user.workspace_id
 
-    # ── All-time metrics
+    # ── All-time metrics (everything still inside the retention window)
     all_stats = db.query(
         func.count(EventLog.id).label("total"),
         func.count(case((EventLog.status == "success", 1))).label("success"),
     ).filter(
         EventLog.workspace_id == ws_id,
         EventLog.event_type.in_(["automation_executed", "automation_failed"]),
+        EventLog.created_at >= retention_start(db, ws_id, now=now),
     ).first()
 
     total = all_stats.total or 0
@@ -199,28 +251,20 @@ def get_engine_status(current_user: User = Depends(require_owner()), db: Session
     avg_latency = round(sum(exec_times) / len(exec_times)) if exec_times else 0
     p95_latency = sorted(exec_times)[int(len(exec_times) * 0.95)] if len(exec_times) >= 2 else avg_latency
 
-    # ── Throughput (last hour)
-    events_last_hour = db.query(func.count(EventLog.id)).filter(
+    # ── Throughput (last hour) + events/failures last 24h, in one pass
+    recent = db.query(
+        func.count(EventLog.id).label("events_24h"),
+        func.count(case((EventLog.event_type == "automation_failed", 1))).label("failures_24h"),
+        func.count(case((EventLog.created_at >= since_1h, 1))).label("events_last_hour"),
+    ).filter(
         EventLog.workspace_id == ws_id,
         EventLog.event_type.in_(["automation_executed", "automation_failed"]),
-        EventLog.created_at >= since_1h,
-    ).scalar() or 0
-
-    events_per_minute = round(events_last_hour / 60, 2)
-
-    # ── Failures last 24h
-    failures_24h = db.query(func.count(EventLog.id)).filter(
-        EventLog.workspace_id == ws_id,
-        EventLog.event_type == "automation_failed",
         EventLog.created_at >= since_24h,
-    ).scalar() or 0
+    ).first()
 
-    # ── Events last 24h
-    events_24h = db.query(func.count(EventLog.id)).filter(
-        EventLog.workspace_id == ws_id,
-        EventLog.event_type.in_(["automation_executed", "automation_failed"]),
-        EventLog.created_at >= since_24h,
-    ).scalar() or 0
+    events_24h = recent.events_24h or 0
+    failures_24h = recent.failures_24h or 0
+    events_per_minute = round((recent.events_last_hour or 0) / 60, 2)
 
     failure_rate_24h = round((failures_24h / events_24h * 100), 1) if events_24h > 0 else 0
 
@@ -1,18 +1,26 @@
+import json
 import logging
-from datetime import datetime, timezone
-from typing import List, Optional
+from datetime import datetime, time, timedelta, timezone
+from typing import List, Literal, Optional
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import and_, or_, select, func, text
+from sqlalchemy.exc import IntegrityError
 
-from app.core.database import get_db
+from app.core.config import settings
+from app.core.realtime_topics import BOOKING_STATUS_CHANGED, publish_after_commit
+from app.core.database import get_db, SessionLocal
 from app.core.security import get_current_user
 from app.models.user import User
 from app.models.booking import Booking
 from app.models.contact import Contact
 from app.utils.enums import BookingStatus, AutomationEventType
 from app.services.event_dispatcher import dispatch_event
+from app.services.stats_rollup import record_booking_created, record_booking_status_change
 from pydantic import BaseModel
 
 router = APIRouter(prefix="/bookings", tags=["Bookings"])
@@ -65,18 +73,25 @@ def list_bookings(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
-    """List bookings with optional date range and status filters."""
-    query = db.query(Booking).filter(Booking.workspace_id == current_user.workspace_id)
+    """
+    List bookings starting in a date range (at most BOOKINGS_CALENDAR_MAX_DAYS
+    wide) plus every unscheduled booking, with an optional status filter.
+    Missing bounds default to a window starting BOOKINGS_LIST_LOOKBACK_DAYS ago.
+    """
+    start_date, end_date = _list_window(start_date, end_date)
+    query = db.query(Booking).filter(
+        Booking.workspace_id == current_user.workspace_id,
+        # Form bookings without a usable date have no start_time; always list them
+        or_(
+            Booking.start_time.is_(None),
+            and_(Booking.start_time >= start_date, Booking.start_time < end_date),
+        ),
+    )
 
     if status:
         query = query.filter(Booking.status == status)
-    
-    if start_date:
-        query = query.filter(Booking.start_time >= start_date)
-    if end_date:
-        query = query.filter(Booking.end_time <= end_date)
 
-    bookings = query.order_by(Booking.start_time.asc()).all()
+    bookings = query.options(joinedload(Booking.contact)).order_by(Booking.start_time.asc()).all()
     
     # Enrichment
     results = []
@@ -85,6 +100,208 @@ def list_bookings(
     return results
 
 
+# ── Calendar Window ─────────────────────────────────────────────
+
+CALENDAR_FETCH_SIZE = 500
+
+
+def _calendar_window(start: datetime, end: datetime) -> tuple[datetime, datetime]:
+    """Validate a bounded [start, end) window; naive datetimes are UTC."""
+    if start.tzinfo is None:
+        start = start.replace(tzinfo=timezone.utc)
+    if end.tzinfo is None:
+        end = end.replace(tzinfo=timezone.utc)
+    if end <= start:
+        raise HTTPException(status_code=400, detail="end must be after start")
+    if end - start > timedelta(days=settings.BOOKINGS_CALENDAR_MAX_DAYS):
+        raise HTTPException(
+            status_code=400,
+            detail=f"Window too large (max {settings.BOOKINGS_CALENDAR_MAX_DAYS} days)",
+        )
+    return start, end
+
+
+def _list_window(start: Optional[datetime], end: Optional[datetime]) -> tuple[datetime, datetime]:
+    """Fill in missing list bounds, then validate like a calendar window."""
+    span = timedelta(days=settings.BOOKINGS_CALENDAR_MAX_DAYS)
+    if start is None and end is None:
+        today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+        start = today - timedelta(days=settings.BOOKINGS_LIST_LOOKBACK_DAYS)
+    if start is None:
+        start = end - span
+    if end is None:
+        end = start + span
+    return _calendar_window(start, end)
+
+
+def _calendar_rows(workspace_id: int, start: datetime, end: datetime, status_filter: Optional[BookingStatus]):
+    """
+    Yield booking rows in the window, oldest first, straight from a
+    server-side cursor. Runs on its own session because the body is
+    streamed after the request's dependencies have finished.
+    """
+    # workspace_id + start_time range → ix_workspace_booking_start
+    stmt = (
+        select(
+            Booking.id,
+            Booking.title,
+            Booking.description,
+            Booking.start_time,
+            Booking.end_time,
+            Booking.status,
+            Booking.contact_id,
+            func.coalesce(Contact.name, "Unknown").label("contact_name"),
+            Booking.created_at,
+        )
+        .outerjoin(Contact, Contact.id == Booking.contact_id)
+        .where(
+            Booking.workspace_id == workspace_id,
+            Booking.start_time >= start,
+            Booking.start_time < end,
+        )
+        .order_by(Booking.start_time, Booking.id)
+        .execution_options(yield_per=CALENDAR_FETCH_SIZE)
+    )
+    if status_filter:
+        stmt = stmt.where(Booking.status == status_filter)
+
+    db = SessionLocal()
+    try:
+        for row in db.execute(stmt):
+            yield jsonable_encoder(row._asdict())
+    finally:
+        db.close()
+
+
+def _ndjson(rows):
+    for row in rows:
+        yield json.dumps(row) + "\n"
+
+
+def _json_array(rows):
+    """Chunked JSON array — same body as a list response, without buffering it."""
+    yield "["
+    first = True
+    for row in rows:
+        yield ("" if first else ",") + json.dumps(row)
+        first = False
+    yield "]"
+
+
+def _calendar_summary(db: Session, workspace_id: int, start: datetime, end: datetime, tz: str) -> list[dict]:
+    """Per-day counts by status — enough for month views to draw dots."""
+    local_day = func.date(func.timezone(tz, Booking.start_time))
+    rows = db.execute(
+        select(
+            local_day.label("date"),
+            func.count().label("total"),
+            *[func.count().filter(Booking.status == st).label(st.value) for st in BookingStatus],
+        )
+        .where(
+            Booking.workspace_id == workspace_id,
+            Booking.start_time >= start,
+            Booking.start_time < end,
+        )
+        .group_by(local_day)
+        .order_by(local_day)
+    ).all()
+    return [{**row._asdict(), "date": str(row.date)} for row in rows]
+
+
+@router.get("/calendar")
+def get_calendar(
+    start: datetime = Query(..., description="Window start (inclusive)"),
+    end: datetime = Query(..., description="Window end (exclusive)"),
+    view: Literal["rows", "summary"] = Query("rows", description="rows = bookings, summary = counts per day"),
+    format: Literal["json", "ndjson"] = Query("json", description="Streaming format for the rows view"),
+    tz: str = Query("UTC", description="IANA timezone used to bucket days in the summary view"),
+    status: Optional[BookingStatus] = None,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """
+    Bookings that start inside a bounded window.
+    The rows view streams JSON (or NDJSON) without loading the range into memory;
+    the summary view returns one small row per day.
+    """
+    start, end = _calendar_window(start, end)
+
+    if view == "summary":
+        try:
+            ZoneInfo(tz)
+        except (ZoneInfoNotFoundError, ValueError):
+            raise HTTPException(status_code=400, detail=f"Unknown timezone: {tz}")
+        return _calendar_summary(db, current_user.workspace_id, start, end, tz)
+
+    rows = _calendar_rows(current_user.workspace_id, start, end, status)
+    if format == "ndjson":
+        return StreamingResponse(_ndjson(rows), media_type="application/x-ndjson")
+    return StreamingResponse(_json_array(rows), media_type="application/json")
+
+
+# ── Availability ────────────────────────────────────────────────
+
+AVAILABILITY_SQL = text("""
+    SELECT slot AS start, slot + make_interval(mins => :slot_minutes) AS end
+    FROM generate_series(
+        CAST(:start AS timestamptz),
+        CAST(:end AS timestamptz) - make_interval(mins => :slot_minutes),
+        make_interval(mins => :slot_minutes)
+    ) AS slot
+    WHERE (slot AT TIME ZONE :tz)::time >= :open_time
+      AND ((slot + make_interval(mins => :slot_minutes)) AT TIME ZONE :tz)::time <= :close_time
+      AND (slot AT TIME ZONE :tz)::date = ((slot + make_interval(mins => :slot_minutes)) AT TIME ZONE :tz)::date
+      AND NOT EXISTS (
+          SELECT 1 FROM bookings b
+          WHERE b.workspace_id = :workspace_id
+            AND b.status = 'CONFIRMED'
+            AND b.time_range && tstzrange(slot, slot + make_interval(mins => :slot_minutes), '[)')
+      )
+    ORDER BY slot
+""")
+
+
+@router.get("/availability")
+def get_availability(
+    start: datetime = Query(..., description="Range start (inclusive)"),
+    end: datetime = Query(..., description="Range end (exclusive)"),
+    slot_minutes: int = Query(30, ge=5, le=480),
+    open_time: time = Query(time(9, 0), description="Daily opening time in tz"),
+    close_time: time = Query(time(17, 0), description="Daily closing time in tz"),
+    tz: str = Query("UTC", description="IANA timezone for opening hours"),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """
+    Free slots in a date range, in one query: candidate slots from
+    generate_series, minus anything overlapping a confirmed booking
+    (anti-join served by the exclusion constraint's GiST index).
+    """
+    start, end = _calendar_window(start, end)
+    if close_time <= open_time:
+        raise HTTPException(status_code=400, detail="close_time must be after open_time")
+    try:
+        ZoneInfo(tz)
+    except (ZoneInfoNotFoundError, ValueError):
+        raise HTTPException(status_code=400, detail=f"Unknown timezone: {tz}")
+
+    rows = db.execute(AVAILABILITY_SQL, {
+        "workspace_id": current_user.workspace_id,
+        "start": start,
+        "end": end,
+        "slot_minutes": slot_minutes,
+        "open_time": open_time,
+        "close_time": close_time,
+        "tz": tz,
+    }).all()
+    return {
+        "start": start,
+        "end": end,
+        "slot_minutes": slot_minutes,
+        "slots": [{"start": r.start, "end": r.end} for r in rows],
+    }
+
+
 @router.post("/", response_model=BookingResponse, status_code=201)
 def create_booking(
     payload: BookingCreate,
@@ -112,6 +329,11 @@ def create_booking(
         timezone="UTC"
     )
     db.add(booking)
+    db.flush()
+    record_booking_created(db, booking)
+    publish_after_commit(db, current_user.workspace_id, BOOKING_STATUS_CHANGED, {
+        "booking_id": booking.id, "status": booking.status, "previous_status": None,
+    })
     db.commit()
     db.refresh(booking)
     
@@ -138,13 +360,12 @@ def confirm_booking(
     if booking.status == BookingStatus.CONFIRMED:
         return _map_response(booking)
 
-    # 🛑 OVERLAP CHECK (only if booking has scheduled times)
+    # 🛑 OVERLAP CHECK (only if booking has scheduled times) — GiST range lookup
     if booking.start_time and booking.end_time:
         overlapping = db.query(Booking).filter(
             Booking.workspace_id == current_user.workspace_id,
             Booking.status == BookingStatus.CONFIRMED,
-            Booking.start_time < booking.end_time,
-            Booking.end_time > booking.start_time,
+            Booking.time_range.overlaps(func.tstzrange(booking.start_time, booking.end_time, "[)")),
             Booking.id != booking.id 
         ).first()
 
@@ -154,27 +375,37 @@ def confirm_booking(
                 detail=f"Time slot overlap with confirmed booking #{overlapping.id} ({overlapping.title})"
             )
 
-    # ✅ Confirm
+    # ✅ Confirm — the exclusion constraint settles concurrent confirmations
+    previous_status = booking.status
     booking.status = BookingStatus.CONFIRMED
-    db.commit()
-
-    # 📨 Dispatch Event (Email & Message handled by Dispatcher)
     try:
-        dispatch_event(
-            workspace_id=current_user.workspace_id,
-            event_type=AutomationEventType.BOOKING_CONFIRMED.value,
-            reference_id=booking.id,
-            db=db,
-            payload={
-                "contact_email": booking.contact.email if booking.contact else None,
-                "contact_name": booking.contact.name if booking.contact else "Unknown",
-                "date": booking.start_time.strftime("%Y-%m-%d") if booking.start_time else "TBD",
-                "time": booking.start_time.strftime("%H:%M") if booking.start_time else "TBD",
-                "booking_title": booking.title
-            }
+        db.flush()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(
+            status_code=409,
+            detail="Time slot was just confirmed for another booking",
         )
-    except Exception as e:
-        logger.error(f"Event dispatch failed: {e}")
+    record_booking_status_change(db, booking, previous_status)
+    publish_after_commit(db, current_user.workspace_id, BOOKING_STATUS_CHANGED, {
+        "booking_id": booking.id, "status": booking.status, "previous_status": previous_status,
+    })
+
+    # 📨 Enqueue Event in the same transaction (Email & Message handled by the outbox worker)
+    dispatch_event(
+        workspace_id=current_user.workspace_id,
+        event_type=AutomationEventType.BOOKING_CONFIRMED.value,
+        reference_id=booking.id,
+        db=db,
+        payload={
+            "contact_email": booking.contact.email if booking.contact else None,
+            "contact_name": booking.contact.name if booking.contact else "Unknown",
+            "date": booking.start_time.strftime("%Y-%m-%d") if booking.start_time else "TBD",
+            "time": booking.start_time.strftime("%H:%M") if booking.start_time else "TBD",
+            "booking_title": booking.title
+        }
+    )
+    db.commit()
 
     db.refresh(booking)
     return _map_response(booking)
@@ -193,5 +424,10 @@ def delete_booking(
     if not booking:
         raise HTTPException(status_code=404, detail="Booking not found")
     
+    previous_status = booking.status
     booking.status = BookingStatus.CANCELLED
+    record_booking_status_change(db, booking, previous_status)
+    publish_after_commit(db, current_user.workspace_id, BOOKING_STATUS_CHANGED, {
+        "booking_id": booking.id, "status": booking.status, "previous_status": previous_status,
+    })
     db.commit()
@@ -3,18 +3,24 @@ Contacts API – Full CRUD with CRM contact_type filtering.
 Workspace-scoped. Accessible by Owner and Staff.
 """
 
+import json
 import logging
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response, UploadFile, File
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from typing import Optional
+from typing import Literal, Optional
 
-from app.core.database import get_db
+from app.core.database import get_db, SessionLocal
 from app.core.security import get_current_user
 from app.models.user import User
 from app.models.contact import Contact
-from app.schemas.contact import ContactCreate, ContactUpdate, ContactResponse
+from app.schemas.contact import ContactCreate, ContactUpdate, ContactResponse, ContactTypeahead
 from app.utils.enums import ContactType
 from app.core.csrf import verify_csrf
+from app.utils.pagination import SortKey, keyset_paginate
+from app.services.stats_rollup import record_contact_created, record_contact_deleted
+from app.services.contact_import import import_contacts, iter_csv, iter_ndjson
+from app.services.contact_search import apply_search
 
 logger = logging.getLogger(__name__)
 
@@ -23,14 +29,20 @@ router = APIRouter(prefix="/contacts", tags=["Contacts"])
 
 @router.get("/", response_model=list[ContactResponse])
 def list_contacts(
+    response: Response,
     search: Optional[str] = Query(None, description="Search by name, email, or phone"),
     contact_type: Optional[ContactType] = Query(None, description="Filter by type: customer, provider, vendor"),
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the X-Next-Cursor header"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
-    """List contacts with optional search and contact_type filter (for CRM tabs)."""
+    """
+    List contacts with optional search and contact_type filter (for CRM tabs).
+    Without search, newest first with cursor pagination. With search, best
+    matches first (paged with skip/limit).
+    """
     query = db.query(Contact).filter(
         Contact.workspace_id == current_user.workspace_id,
         Contact.is_deleted == False,
@@ -39,16 +51,29 @@ def list_contacts(
     if contact_type:
         query = query.filter(Contact.contact_type == contact_type)
 
-    if search:
-        search_term = f"%{search}%"
-        query = query.filter(
-            (Contact.name.ilike(search_term))
-            | (Contact.email.ilike(search_term))
-            | (Contact.phone.ilike(search_term))
-        )
+    if search and search.strip():
+        query, rank = apply_search(query, search)
+        return query.order_by(rank.desc(), Contact.id.desc()).offset(skip).limit(limit).all()
+
+    return keyset_paginate(
+        query, [SortKey(Contact.created_at), SortKey(Contact.id)], limit, response, cursor=cursor, skip=skip
+    )
+
 
-    contacts = query.order_by(Contact.created_at.desc()).offset(skip).limit(limit).all()
-    return contacts
+@router.get("/typeahead", response_model=list[ContactTypeahead])
+def typeahead_contacts(
+    q: str = Query(..., min_length=1, max_length=100, description="Name, email, or phone prefix"),
+    limit: int = Query(10, ge=1, le=25),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Lightweight ranked lookup for search boxes – returns id/name/email only."""
+    query = db.query(Contact.id, Contact.name, Contact.email).filter(
+        Contact.workspace_id == current_user.workspace_id,
+        Contact.is_deleted == False,
+    )
+    query, rank = apply_search(query, q)
+    return query.order_by(rank.desc(), Contact.id.desc()).limit(limit).all()
 
 
 @router.get("/{contact_id}", response_model=ContactResponse)
@@ -84,11 +109,42 @@ def create_contact(
         workspace_id=current_user.workspace_id,
     )
     db.add(contact)
+    record_contact_created(db, current_user.workspace_id)
     db.commit()
     db.refresh(contact)
     return contact
 
 
+@router.post("/import", dependencies=[Depends(verify_csrf)])
+def import_contacts_file(
+    file: UploadFile = File(..., description="CSV with a header row, or NDJSON"),
+    format: Optional[Literal["csv", "ndjson"]] = Query(None, description="Defaults from the file extension"),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Bulk import contacts. Columns: name, email, phone, notes, contact_type.
+    Streams NDJSON events back: per-row errors, progress after each batch,
+    and a final summary. Rows matching an existing email or phone are skipped.
+    """
+    if format is None:
+        format = "ndjson" if (file.filename or "").lower().endswith((".ndjson", ".jsonl")) else "csv"
+    parse = iter_ndjson if format == "ndjson" else iter_csv
+    workspace_id = current_user.workspace_id
+
+    def events():
+        # Own session: the body is streamed after the request scope ends
+        db = SessionLocal()
+        try:
+            for event in import_contacts(db, workspace_id, parse(file.file)):
+                yield json.dumps(event) + "\n"
+        except UnicodeDecodeError:
+            yield json.dumps({"type": "error", "row": None, "error": "File must be UTF-8 encoded"}) + "\n"
+        finally:
+            db.close()
+
+    return StreamingResponse(events(), media_type="application/x-ndjson")
+
+
 @router.put("/{contact_id}", response_model=ContactResponse)
 def update_contact(
     contact_id: int,
@@ -129,5 +185,7 @@ def delete_contact(
     if not contact:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Contact not found")
 
-    contact.is_deleted = True
+    if not contact.is_deleted:
+        contact.is_deleted = True
+        record_contact_deleted(db, contact)
     db.commit()
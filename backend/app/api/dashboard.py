@@ -2,6 +2,7 @@
 Dashboard API – Phase 4.
 Owner-only, read-only, pre-aggregated workspace analytics.
 No raw table dumps. All queries workspace-scoped.
+Responses are served through the dashboard cache (TTL + invalidated on writes).
 """
 
 from datetime import datetime, timedelta, timezone
@@ -22,6 +23,8 @@ from app.models.alert import Alert
 from app.models.event_log import EventLog
 from app.utils.enums import BookingStatus, ContactSource, AlertSeverity
 from app.schemas.alert import AlertResponse
+from app.services.dashboard_cache import dashboard_cache
+from app.services.dashboard_service import get_owner_dashboard
 
 router = APIRouter(prefix="/dashboard", tags=["Dashboard"])
 
@@ -55,16 +58,11 @@ def get_overview(
     current_user: User = Depends(require_owner),
     db: Session = Depends(get_db),
 ):
-    """High-level workspace KPIs – aggregated via service."""
-    from app.services.dashboard_service import get_overview_stats
-    if hasattr(get_overview_stats, '__call__'):
-        try:
-            return get_overview_stats(current_user.workspace_id, db)
-        except TypeError:
-            # New service doesn't have get_overview_stats, use owner dashboard
-            pass
-    from app.services.dashboard_service import get_owner_dashboard
-    data = get_owner_dashboard(current_user.workspace_id, db, range_days=7)
+    """High-level workspace KPIs – projection of the 7-day owner dashboard."""
+    ws = current_user.workspace_id
+    data = dashboard_cache.get_or_compute(
+        ws, "owner-overview", 7, lambda: get_owner_dashboard(ws, db, range_days=7)
+    )
     return {**data["kpis"], **data["growth"], "health": data["health"], "revenue_trend": data["revenue_trend"], "pipeline": data["pipeline"]}
 
 
@@ -79,11 +77,13 @@ def get_owner_overview(
     Returns ALL dashboard data in a single call.
     Supports range=7, 30, 90 (days).
     """
-    from app.services.dashboard_service import get_owner_dashboard
     allowed = [7, 30, 90]
     if range not in allowed:
         range = 7
-    return get_owner_dashboard(current_user.workspace_id, db, range_days=range)
+    ws = current_user.workspace_id
+    return dashboard_cache.get_or_compute(
+        ws, "owner-overview", range, lambda: get_owner_dashboard(ws, db, range_days=range)
+    )
 
 
 # ── 2. Contacts Analytics ───────────────────────────────────────
@@ -95,7 +95,10 @@ def get_contacts_stats(
 ):
     """Contact analytics – totals, recency, source breakdown."""
     ws = current_user.workspace_id
+    return dashboard_cache.get_or_compute(ws, "contacts", None, lambda: _contacts_stats(ws, db))
 
+
+def _contacts_stats(ws: int, db: Session) -> dict:
     total = db.query(func.count(Contact.id)).filter(Contact.workspace_id == ws).scalar() or 0
     new_7d = db.query(func.count(Contact.id)).filter(
         Contact.workspace_id == ws, Contact.created_at >= _days_ago(7)
@@ -130,7 +133,10 @@ def get_bookings_stats(
 ):
     """Booking analytics – status breakdown, recency, conversion rate."""
     ws = current_user.workspace_id
+    return dashboard_cache.get_or_compute(ws, "bookings", None, lambda: _bookings_stats(ws, db))
+
 
+def _bookings_stats(ws: int, db: Session) -> dict:
     total = db.query(func.count(Booking.id)).filter(Booking.workspace_id == ws).scalar() or 0
 
     # Status breakdown
@@ -175,7 +181,10 @@ def get_inventory_stats(
 ):
     """Inventory health – totals, low-stock, out-of-stock list."""
     ws = current_user.workspace_id
+    return dashboard_cache.get_or_compute(ws, "inventory", None, lambda: _inventory_stats(ws, db))
+
 
+def _inventory_stats(ws: int, db: Session) -> dict:
     total_items = db.query(func.count(InventoryItem.id)).filter(
         InventoryItem.workspace_id == ws
     ).scalar() or 0
@@ -223,7 +232,10 @@ def get_alerts_stats(
 ):
     """Alert summary – totals, severity breakdown, recent alerts."""
     ws = current_user.workspace_id
+    return dashboard_cache.get_or_compute(ws, "alerts", None, lambda: _alerts_stats(ws, db))
 
+
+def _alerts_stats(ws: int, db: Session) -> dict:
     total = db.query(func.count(Alert.id)).filter(Alert.workspace_id == ws).scalar() or 0
     unread = db.query(func.count(Alert.id)).filter(
         Alert.workspace_id == ws, Alert.is_read == False
@@ -255,3 +267,13 @@ def get_alerts_stats(
         "by_severity": by_severity,
         "recent": [AlertResponse.model_validate(a) for a in recent],
     }
+
+
+# ── 6. Cache Metrics ────────────────────────────────────────────
+
+@router.get("/cache-stats")
+def get_cache_stats(
+    current_user: User = Depends(require_owner),
+):
+    """Dashboard cache hit/miss counters for this worker process."""
+    return dashboard_cache.stats()
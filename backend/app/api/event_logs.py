@@ -3,7 +3,9 @@ Event Logs API – Phase 3.
 Read-only audit trail. Workspace-scoped.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
@@ -11,16 +13,19 @@ from app.core.security import get_current_user
 from app.models.user import User
 from app.models.event_log import EventLog
 from app.schemas.event_log import EventLogResponse
+from app.utils.pagination import SortKey, keyset_paginate
 
 router = APIRouter(prefix="/event-logs", tags=["Event Logs"])
 
 
 @router.get("/", response_model=list[EventLogResponse])
 def list_event_logs(
+    response: Response,
     event_type: str = Query(None),
     source: str = Query(None),
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the X-Next-Cursor header"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
@@ -40,8 +45,9 @@ def list_event_logs(
         # Let's use ilike for flexibility.
         query = query.filter(EventLog.source.ilike(f"{source}%"))
 
-    logs = query.order_by(EventLog.created_at.desc()).offset(skip).limit(limit).all()
-    return logs
+    return keyset_paginate(
+        query, [SortKey(EventLog.created_at), SortKey(EventLog.id)], limit, response, cursor=cursor, skip=skip
+    )
 
 
 @router.get("/{log_id}", response_model=EventLogResponse)
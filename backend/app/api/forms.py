@@ -8,7 +8,9 @@ import secrets
 import re
 from datetime import datetime, timezone
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
@@ -33,7 +35,9 @@ from app.utils.enums import (
     ConversationChannel, AutomationEventType, FieldType,
 )
 from app.services.event_dispatcher import dispatch_event
+from app.services.stats_rollup import record_contact_created, record_submission
 from app.core.csrf import verify_csrf
+from app.utils.pagination import SortKey, keyset_paginate
 
 logger = logging.getLogger(__name__)
 
@@ -88,19 +92,18 @@ def _build_submission_response(sub: FormSubmission) -> dict:
 
 @router.get("/", response_model=list[FormListResponse])
 def list_forms(
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the X-Next-Cursor header"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """List all forms in the workspace."""
-    forms = (
-        db.query(Form)
-        .filter(Form.workspace_id == current_user.workspace_id)
-        .order_by(Form.created_at.desc())
-        .offset(skip).limit(limit).all()
+    query = db.query(Form).filter(Form.workspace_id == current_user.workspace_id)
+    return keyset_paginate(
+        query, [SortKey(Form.created_at), SortKey(Form.id)], limit, response, cursor=cursor, skip=skip
     )
-    return forms
 
 
 @router.get("/{form_id}", response_model=FormResponse)
@@ -323,9 +326,11 @@ def reorder_fields(
 @router.get("/{form_id}/submissions", response_model=list[FormSubmissionResponse])
 def list_submissions(
     form_id: int,
+    response: Response,
     status_filter: SubmissionStatus = Query(None, alias="status"),
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the X-Next-Cursor header"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
@@ -339,7 +344,14 @@ def list_submissions(
     if status_filter:
         query = query.filter(FormSubmission.status == status_filter)
 
-    subs = query.order_by(FormSubmission.created_at.desc()).offset(skip).limit(limit).all()
+    subs = keyset_paginate(
+        query,
+        [SortKey(FormSubmission.created_at), SortKey(FormSubmission.id)],
+        limit,
+        response,
+        cursor=cursor,
+        skip=skip,
+    )
     return [_build_submission_response(s) for s in subs]
 
 
@@ -362,7 +374,6 @@ def approve_submission(
         raise HTTPException(status_code=404, detail="Submission not found")
 
     sub.status = SubmissionStatus.APPROVED
-    db.commit()
 
     # Create approval message in conversation
     if sub.contact_id:
@@ -381,23 +392,20 @@ def approve_submission(
             )
             db.add(msg)
             conv.last_message_at = datetime.now(timezone.utc)
-            db.commit()
-
-    # Dispatch event
-    try:
-        dispatch_event(
-            workspace_id=current_user.workspace_id,
-            event_type=AutomationEventType.FORM_APPROVED.value,
-            reference_id=sub.id,
-            db=db,
-            payload={
-                "contact_email": sub.contact.email if sub.contact else None,
-                "contact_name": sub.contact.name if sub.contact else None,
-                "form_title": form.title,
-            },
-        )
-    except Exception as e:
-        logger.error(f"Event dispatch failed: {e}")
+
+    # Dispatch event (outbox row commits atomically with the approval)
+    dispatch_event(
+        workspace_id=current_user.workspace_id,
+        event_type=AutomationEventType.FORM_APPROVED.value,
+        reference_id=sub.id,
+        db=db,
+        payload={
+            "contact_email": sub.contact.email if sub.contact else None,
+            "contact_name": sub.contact.name if sub.contact else None,
+            "form_title": form.title,
+        },
+    )
+    db.commit()
 
     return {"status": "approved", "submission_id": sub.id}
 
@@ -451,8 +459,8 @@ def submit_public_form(
     4. Conversation Resolution (find by workspace+contact -> create if missing)
     5. Create FormSubmission & Answers
     6. Create Inbox Message (System)
-    7. Commit
-    8. Dispatch Event
+    7. Dispatch Event (enqueued in the outbox)
+    8. Commit
     """
     # ── 1. Validate Form ──
     form = db.query(Form).filter(
@@ -538,6 +546,7 @@ def submit_public_form(
         )
         db.add(contact)
         db.flush()
+        record_contact_created(db, workspace_id)
 
     # ── 4. Conversation Resolution ──
     conversation = db.query(Conversation).filter(
@@ -564,6 +573,7 @@ def submit_public_form(
     )
     db.add(submission)
     db.flush()
+    record_submission(db, workspace_id)
 
     for field_id_str, value in payload.answers.items():
         field = field_map.get(field_id_str)
@@ -627,25 +637,21 @@ def submit_public_form(
     conversation.last_message_at = datetime.now(timezone.utc)
     conversation.is_read = False
 
-    # ── 8. Commit ──
-    db.commit()
-
-    # ── 9. Dispatch Event ──
-    try:
-        dispatch_event(
-            workspace_id=workspace_id,
-            event_type=AutomationEventType.FORM_SUBMITTED.value,
-            reference_id=submission.id,
-            db=db,
-            payload={
-                "contact_email": contact.email,
-                "contact_name": contact.name,
-                "form_title": form.title,
-            },
-        )
-    except Exception as e:
-        logger.error(f"Event dispatch failed: {e}")
+    # ── 8. Dispatch Event (outbox row, delivered after commit by the worker) ──
+    dispatch_event(
+        workspace_id=workspace_id,
+        event_type=AutomationEventType.FORM_SUBMITTED.value,
+        reference_id=submission.id,
+        db=db,
+        payload={
+            "contact_email": contact.email,
+            "contact_name": contact.name,
+            "form_title": form.title,
+        },
+    )
 
+    # ── 9. Commit ──
+    db.commit()
 
     return {
         "success": True,
@@ -5,7 +5,7 @@ Uses new message model: content, sender_type, message_type, metadata.
 """
 
 import logging
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 from typing import Optional
@@ -28,7 +28,10 @@ from app.schemas.inbox import (
     MessageResponse,
     UnreadCountResponse,
 )
+from app.core.realtime_topics import INBOX_MESSAGE_CREATED, publish_after_commit
 from app.services.event_dispatcher import dispatch_event
+from app.services.dashboard_cache import mark_workspace_dirty
+from app.utils.pagination import SortKey, keyset_paginate
 
 logger = logging.getLogger(__name__)
 
@@ -41,22 +44,8 @@ router = APIRouter(
 
 # ── Helpers ──────────────────────────────────────────────────────
 
-def _conversation_to_response(conv: Conversation, db: Session) -> dict:
-    """Build a ConversationResponse dict with preview and counts."""
-    msg_count = db.query(func.count(Message.id)).filter(Message.conversation_id == conv.id).scalar() or 0
-    last_msg = (
-        db.query(Message)
-        .filter(Message.conversation_id == conv.id)
-        .order_by(Message.created_at.desc())
-        .first()
-    )
-
-    # Use content first, fall back to body for backcompat
-    preview = None
-    if last_msg:
-        text = last_msg.content or last_msg.body or ""
-        preview = (text[:120] + "…") if len(text) > 120 else text
-
+def _conversation_to_response(conv: Conversation) -> dict:
+    """Build a ConversationResponse dict from the denormalized preview and count."""
     return {
         "id": conv.id,
         "subject": conv.subject,
@@ -67,8 +56,8 @@ def _conversation_to_response(conv: Conversation, db: Session) -> dict:
         "workspace_id": conv.workspace_id,
         "created_at": conv.created_at,
         "contact_name": conv.contact.name if conv.contact else None,
-        "last_message_preview": preview,
-        "message_count": msg_count,
+        "last_message_preview": conv.last_message_preview,
+        "message_count": conv.message_count or 0,
     }
 
 
@@ -94,10 +83,12 @@ def _message_to_response(msg: Message) -> dict:
 
 @router.get("/", response_model=list[ConversationResponse])
 def list_conversations(
+    response: Response,
     channel: Optional[ConversationChannel] = Query(None),
     is_read: Optional[bool] = Query(None),
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the X-Next-Cursor header"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
@@ -111,13 +102,15 @@ def list_conversations(
     if is_read is not None:
         query = query.filter(Conversation.is_read == is_read)
 
-    convs = (
-        query.order_by(Conversation.last_message_at.desc().nullslast())
-        .offset(skip)
-        .limit(limit)
-        .all()
+    convs = keyset_paginate(
+        query,
+        [SortKey(Conversation.last_message_at, nullable=True), SortKey(Conversation.id)],
+        limit,
+        response,
+        cursor=cursor,
+        skip=skip,
     )
-    return [_conversation_to_response(c, db) for c in convs]
+    return [_conversation_to_response(c) for c in convs]
 
 
 @router.get("/unread-count", response_model=UnreadCountResponse)
@@ -155,7 +148,7 @@ def get_conversation(
     if not conv:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Conversation not found")
 
-    response = _conversation_to_response(conv, db)
+    response = _conversation_to_response(conv)
     response["messages"] = [_message_to_response(m) for m in conv.messages]
     return response
 
@@ -215,11 +208,15 @@ def create_conversation(
             created_by=current_user.id,
         )
         db.add(msg)
+        db.flush()
+        publish_after_commit(db, current_user.workspace_id, INBOX_MESSAGE_CREATED, {
+            "conversation_id": conv.id, "message_id": msg.id,
+        })
 
     db.commit()
     db.refresh(conv)
 
-    response = _conversation_to_response(conv, db)
+    response = _conversation_to_response(conv)
     response["messages"] = [_message_to_response(m) for m in conv.messages]
     return response
 
@@ -283,27 +280,28 @@ def add_message(
     # Update conversation timestamp
     conv.last_message_at = now
     conv.is_read = True  # user is replying, so it's read
+    db.flush()
+    publish_after_commit(db, current_user.workspace_id, INBOX_MESSAGE_CREATED, {
+        "conversation_id": conversation_id, "message_id": msg.id,
+    })
+
+    # Dispatch staff_replied event (outbox row, committed with the message)
+    if payload.sender_type == SenderType.BUSINESS:
+        dispatch_event(
+            workspace_id=current_user.workspace_id,
+            event_type=AutomationEventType.STAFF_REPLIED.value,
+            reference_id=msg.id,
+            db=db,
+            payload={
+                "contact_email": conv.contact.email if conv.contact else None,
+                "contact_name": conv.contact.name if conv.contact else None,
+                "message_content": payload.content,
+            },
+        )
 
     db.commit()
     db.refresh(msg)
 
-    # Dispatch staff_replied event (non-blocking)
-    if payload.sender_type == SenderType.BUSINESS:
-        try:
-            dispatch_event(
-                workspace_id=current_user.workspace_id,
-                event_type=AutomationEventType.STAFF_REPLIED.value,
-                reference_id=msg.id,
-                db=db,
-                payload={
-                    "contact_email": conv.contact.email if conv.contact else None,
-                    "contact_name": conv.contact.name if conv.contact else None,
-                    "message_content": payload.content,
-                },
-            )
-        except Exception as e:
-            logger.error(f"Event dispatch failed: {e}")
-
     return _message_to_response(msg)
 
 
@@ -381,5 +379,6 @@ def mark_all_read(
         Conversation.workspace_id == current_user.workspace_id,
         Conversation.is_read == False,
     ).update({"is_read": True})
+    mark_workspace_dirty(db, current_user.workspace_id)
     db.commit()
     return {"detail": "All conversations marked as read"}
@@ -12,6 +12,10 @@ from fastapi import APIRouter, Depends
 from app.core.dependencies import require_owner
 from app.services.email_service import get_email_provider
 from app.services.sms_service import get_sms_provider
+from app.tasks.async_executor import async_executor
+from app.core.rate_limit import rate_limiter
+from app.core.websocket_manager import ws_manager
+from app.tasks.scheduler import scheduler
 
 logger = logging.getLogger(__name__)
 
@@ -75,3 +79,27 @@ async def get_health(current_user=Depends(require_owner())):
         _health_cache["expires_at"] = time.time() + CACHE_TTL
 
         return result
+
+
+@router.get("/executor-stats")
+def get_executor_stats(current_user=Depends(require_owner())):
+    """Queue depth and backpressure counters of the shared async executor."""
+    return async_executor.stats()
+
+
+@router.get("/scheduler-stats")
+def get_scheduler_stats(current_user=Depends(require_owner())):
+    """Leadership and per-job state of this worker's scheduler."""
+    return scheduler.stats()
+
+
+@router.get("/ws-stats")
+def get_ws_stats(current_user=Depends(require_owner())):
+    """Per-connection send queue depth and lag of this worker's WebSockets."""
+    return ws_manager.get_stats()
+
+
+@router.get("/rate-limit-stats")
+def get_rate_limit_stats(current_user=Depends(require_owner())):
+    """Allowed/limited counts per policy on this worker, and tracked keys."""
+    return rate_limiter.stats()
@@ -7,7 +7,8 @@ Endpoints:
   WS    /ws/internal-messages          — WebSocket for real-time events
 
 WS Event Types (server → client):
-  new_message, typing_start, typing_stop, connected
+  new_message, typing (aggregated: everyone currently typing), connected
+  plus the workspace topics from core/realtime_topics.py
 
 WS Event Types (client → server):
   typing_start, typing_stop
@@ -126,7 +127,7 @@ async def send_message(
         raise HTTPException(status_code=400, detail="Message too long (max 5000 chars)")
 
     # Rate limit
-    if not ws_manager.check_rate_limit(current_user.id):
+    if not await ws_manager.check_rate_limit(current_user.id):
         raise HTTPException(status_code=429, detail="Too many messages. Slow down.")
 
     # Save to DB
@@ -140,6 +141,7 @@ async def send_message(
     db.refresh(msg)
 
     serialized = _serialize_message(msg, current_user.full_name)
+    ws_manager.set_typing(current_user.workspace_id, current_user.id, current_user.full_name, False)
 
     # Broadcast to other connected clients in workspace (sender already has it from POST response)
     await ws_manager.broadcast(
@@ -161,7 +163,7 @@ async def websocket_chat(websocket: WebSocket):
 
     Auth: Reads JWT from httpOnly cookie (sent automatically by browser).
     Protocol:
-      Server → Client: { type: "new_message"|"typing_start"|"typing_stop"|"connected", payload: {...} }
+      Server → Client: { type: "new_message"|"typing"|"connected", payload: {...} }
       Client → Server: { type: "typing_start"|"typing_stop" }
     """
     # 1. Accept connection (required to read cookies)
@@ -194,14 +196,11 @@ async def websocket_chat(websocket: WebSocket):
         await websocket.close(code=4002, reason="Connection limit")
         return
 
-    # 4. Send confirmation + online users
-    await websocket.send_json({
-        "type": "connected",
-        "payload": {
-            "user_id": user_id,
-            "workspace_id": workspace_id,
-            "online_users": ws_manager.get_online_users(workspace_id),
-        },
+    # 4. Send confirmation + online users (through the send queue, ahead of any broadcast)
+    ws_manager.enqueue(workspace_id, user_id, websocket, "connected", {
+        "user_id": user_id,
+        "workspace_id": workspace_id,
+        "online_users": ws_manager.get_online_users(workspace_id),
     })
 
     logger.info(f"WS: Chat connected — user={user_id}, workspace={workspace_id}")
@@ -219,14 +218,9 @@ async def websocket_chat(websocket: WebSocket):
             if not event_type:
                 continue
 
-            # Relay typing events to other users
+            # Typing state is coalesced and sent as one "typing" frame per interval
             if event_type in ("typing_start", "typing_stop"):
-                await ws_manager.broadcast(
-                    workspace_id,
-                    event_type,
-                    {"user_id": user_id, "user_name": user_name},
-                    exclude_user_id=user_id,
-                )
+                ws_manager.set_typing(workspace_id, user_id, user_name, event_type == "typing_start")
 
     except WebSocketDisconnect:
         logger.info(f"WS: user {user_id} disconnected (clean)")
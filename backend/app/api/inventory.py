@@ -5,17 +5,21 @@ Negative stock is rejected unless explicitly designed.
 """
 
 import asyncio
+import logging
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
 from typing import Optional
 
-from app.core.database import get_db
+from app.core.database import get_db, SessionLocal
 from app.core.security import get_current_user
 from app.core.dependencies import require_permission
 from app.models.user import User
 from app.models.inventory import InventoryItem
 from app.schemas.inventory import InventoryItemCreate, InventoryItemUpdate, InventoryItemResponse
 from app.core.csrf import verify_csrf
+from app.tasks.async_executor import async_executor, ExecutorBusyError
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(
     prefix="/inventory",
@@ -169,30 +173,39 @@ def update_item(
         )
         db.commit()
 
-        # Fire external automation (emails, sms, webhooks)
+        # Fire external automation (emails, sms, webhooks) in the background
         try:
-            from app.services.automation_engine import fire_event
-            asyncio.get_event_loop().run_until_complete(
-                fire_event(
-                    event_type="inventory.low_stock",
-                    workspace_id=current_user.workspace_id,
-                    payload={
-                        "item_id": item.id,
-                        "item_name": item.name,
-                        "quantity": item.quantity,
-                        "threshold": item.low_stock_threshold,
-                        "title": f"Low Stock: {item.name}",
-                        "message": f"{item.name} is down to {item.quantity} {item.unit or 'units'} (threshold: {item.low_stock_threshold}).",
-                    },
-                    db=db,
-                )
-            )
-        except Exception:
-            pass  # automation must never block the request
+            async_executor.submit(_fire_low_stock(current_user.workspace_id, _low_stock_payload(item)))
+        except ExecutorBusyError as e:
+            logger.warning(f"[INVENTORY] Low-stock automation dropped for item {item.id}: {e}")
 
     return result
 
 
+def _low_stock_payload(item: InventoryItem) -> dict:
+    # inventory_id is the entity the automation engine dedupes runs on
+    return {
+        "inventory_id": item.id,
+        "item_name": item.name,
+        "quantity": item.quantity,
+        "threshold": item.low_stock_threshold,
+        "title": f"Low Stock: {item.name}",
+        "message": f"{item.name} is down to {item.quantity} {item.unit or 'units'} (threshold: {item.low_stock_threshold}).",
+    }
+
+
+async def _fire_low_stock(workspace_id: int, payload: dict):
+    """Runs on the async executor with its own session (the request's is closed by then)."""
+    from app.services.automation_engine import fire_event
+    db = SessionLocal()
+    try:
+        await fire_event(event_type="inventory.low_stock", workspace_id=workspace_id, payload=payload, db=db)
+    except Exception as e:
+        logger.error(f"[INVENTORY] Low-stock automation failed: {e}")  # automation must never block the request
+    finally:
+        await asyncio.to_thread(db.close)
+
+
 @router.delete("/{item_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_item(
     item_id: int,
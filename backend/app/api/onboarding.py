@@ -3,9 +3,9 @@ Onboarding API – workspace status and activation.
 Owner-only endpoints.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
-from app.services.event_dispatcher import dispatch_event_background
+from app.services.event_dispatcher import dispatch_event
 
 from app.core.database import get_db
 from app.core.dependencies import require_role, get_current_workspace
@@ -56,7 +56,6 @@ def get_onboarding_status(
 
 @router.post("/activate", response_model=WorkspaceResponse)
 def activate_workspace(
-    background_tasks: BackgroundTasks,
     current_user: User = Depends(require_role(UserRole.OWNER)),
     workspace: Workspace = Depends(get_current_workspace),
     db: Session = Depends(get_db),
@@ -77,17 +76,15 @@ def activate_workspace(
         )
 
     workspace.status = WorkspaceStatus.ACTIVE
+
+    # Welcome email is enqueued in the same transaction as the activation
+    dispatch_event(
+        workspace_id=workspace.id,
+        event_type=AutomationEventType.WORKSPACE_ACTIVATED.value,
+        reference_id=current_user.id,
+        db=db,
+    )
     db.commit()
     db.refresh(workspace)
-    
-    # Send welcome email asynchronously
-    # Dispatch workspace activated event
-    background_tasks.add_task(
-        dispatch_event_background,
-        workspace.id,
-        AutomationEventType.WORKSPACE_ACTIVATED.value,
-        current_user.id,
-        {}
-    )
-    
+
     return WorkspaceResponse.model_validate(workspace)
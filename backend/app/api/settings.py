@@ -6,6 +6,7 @@ Production-grade endpoints for the SaaS Settings Hub.
 from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
+from app.core.config import settings
 from app.core.database import get_db, engine
 from app.core.security import get_current_user, verify_password, hash_password
 from app.models.user import User
@@ -165,6 +166,7 @@ def get_workspace_details(
         "id": workspace.id,
         "status": workspace.status.value if workspace.status else "active",
         "logo_url": getattr(workspace, "logo_url", None),
+        "log_retention_days": workspace.log_retention_days or settings.LOG_RETENTION_DAYS,
     }
 
 
@@ -188,6 +190,8 @@ def update_workspace(
         workspace.name = payload.name
     if payload.logo_url is not None and hasattr(workspace, "logo_url"):
         workspace.logo_url = payload.logo_url
+    if payload.log_retention_days is not None:
+        workspace.log_retention_days = payload.log_retention_days
 
     db.commit()
     db.refresh(workspace)
@@ -197,6 +201,7 @@ def update_workspace(
             "name": workspace.name,
             "slug": workspace.slug,
             "logo_url": getattr(workspace, "logo_url", None),
+            "log_retention_days": workspace.log_retention_days or settings.LOG_RETENTION_DAYS,
         },
     }
 
@@ -1,9 +1,9 @@
 """Webhooks API – stub for Phase 3."""
 
 from fastapi import APIRouter, Depends
-from app.core.rate_limit import limit_requests
+from app.core.rate_limit import WEBHOOK_POLICY, rate_limit
 
-router = APIRouter(prefix="/webhooks", tags=["Webhooks"], dependencies=[Depends(limit_requests)])
+router = APIRouter(prefix="/webhooks", tags=["Webhooks"], dependencies=[Depends(rate_limit(WEBHOOK_POLICY))])
 
 
 # Endpoints will be implemented in Phase 3
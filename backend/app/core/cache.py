@@ -0,0 +1,250 @@
+"""
+Pluggable key/value cache backends.
+
+- InMemoryCacheBackend: per-process LRU with per-entry TTL (single instance).
+- RedisCacheBackend: shared store so every gunicorn worker sees the same
+  entries and invalidations. Requires the `redis` package and CACHE_URL.
+
+Backends also keep integer counters (incr/get_counter), which callers use
+for generation-based invalidation: bump a counter and every key that embeds
+the old value becomes unreachable and ages out via TTL/LRU.
+
+VersionedLocalCache keeps decoded values in process memory and uses such a
+counter only as a version stamp (rechecked at most every CACHE_VERSION_TTL
+seconds), for hot-path config that is read far more often than it changes. The stamp must be visible to every worker, so
+get_version_backend() returns Redis when configured and otherwise
+DatabaseVersionBackend (a primary-key read of the cache_versions table),
+never the process-local memory backend.
+"""
+
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class CacheBackend:
+    """Interface every cache backend implements."""
+
+    name = "base"
+
+    def get(self, key: str) -> Any | None:
+        raise NotImplementedError
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        raise NotImplementedError
+
+    def get_counter(self, key: str) -> int:
+        raise NotImplementedError
+
+    def incr(self, key: str) -> int:
+        raise NotImplementedError
+
+    def size(self) -> int | None:
+        """Number of live entries, if cheaply known."""
+        return None
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """Thread-safe LRU dict with per-entry expiry."""
+
+    name = "memory"
+
+    def __init__(self, max_entries: int = 1024):
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._counters: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def get_counter(self, key: str) -> int:
+        with self._lock:
+            return self._counters.get(key, 0)
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + 1
+            return self._counters[key]
+
+    def size(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+class RedisCacheBackend(CacheBackend):
+    """Shared cache in Redis; values are stored as JSON."""
+
+    name = "redis"
+
+    def __init__(self, url: str):
+        try:
+            import redis
+        except ImportError as exc:
+            raise RuntimeError("CACHE_BACKEND=redis requires the 'redis' package") from exc
+        self._client = redis.Redis.from_url(url, socket_timeout=1.0, health_check_interval=30)
+
+    def get(self, key: str) -> Any | None:
+        raw = self._client.get(key)
+        return json.loads(raw) if raw is not None else None
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        self._client.set(key, json.dumps(value), px=int(ttl * 1000))
+
+    def get_counter(self, key: str) -> int:
+        raw = self._client.get(key)
+        return int(raw) if raw is not None else 0
+
+    def incr(self, key: str) -> int:
+        return int(self._client.incr(key))
+
+
+class DatabaseVersionBackend(CacheBackend):
+    """Counters only, in the cache_versions table (shared by every worker)."""
+
+    name = "database"
+
+    def get(self, key: str) -> Any | None:
+        raise NotImplementedError("DatabaseVersionBackend only stores counters")
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        raise NotImplementedError("DatabaseVersionBackend only stores counters")
+
+    def get_counter(self, key: str) -> int:
+        from app.core.database import engine
+        from app.models.cache_version import CacheVersion
+
+        with engine.connect() as conn:
+            value = conn.execute(select(CacheVersion.version).where(CacheVersion.key == key)).scalar()
+        return value or 0
+
+    def incr(self, key: str) -> int:
+        from app.core.database import engine
+        from app.models.cache_version import CacheVersion
+
+        stmt = pg_insert(CacheVersion).values(key=key, version=1)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["key"], set_={"version": CacheVersion.version + 1}
+        ).returning(CacheVersion.version)
+        with engine.begin() as conn:
+            return int(conn.execute(stmt).scalar())
+
+
+class VersionedLocalCache:
+    """
+    Per-process values keyed by e.g. workspace id, each stamped with a shared
+    version counter. get() serves the local copy while the counter is
+    unchanged and reloads otherwise; bump() after a committed write makes
+    every process reload on its next read.
+
+    A checked stamp is trusted for `version_ttl` seconds, so a burst of reads
+    (one automation event checks flags per rule and per action) costs at most
+    one counter lookup; other processes see a bump within that delay.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        max_entries: int = 1024,
+        backend: CacheBackend | None = None,
+        version_ttl: float = settings.CACHE_VERSION_TTL,
+    ):
+        self._namespace = namespace
+        self._max_entries = max_entries
+        self._backend = backend or get_version_backend()
+        self._version_ttl = version_ttl
+        # key → (version, value, monotonic time the version was last checked)
+        self._entries: OrderedDict[Any, tuple[int | None, Any, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _version_key(self, key) -> str:
+        return f"{self._namespace}:ver:{key}"
+
+    def _version(self, key) -> int | None:
+        try:
+            return self._backend.get_counter(self._version_key(key))
+        except Exception as e:
+            logger.warning(f"[CACHE] Version lookup failed for {self._namespace}: {e}")
+            return None  # unknown version: never trust the local copy
+
+    def _store(self, key, version: int | None, value: Any, checked_at: float) -> None:
+        with self._lock:
+            self._entries[key] = (version, value, checked_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def get(self, key, load: Callable[[], Any]) -> Any:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] is not None and now - entry[2] < self._version_ttl:
+                self._entries.move_to_end(key)
+                return entry[1]
+        version = self._version(key)
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and version is not None and entry[0] == version:
+            self._store(key, version, entry[1], now)
+            return entry[1]
+        value = load()
+        self._store(key, version, value, now)
+        return value
+
+    def discard(self, key) -> None:
+        """Drop this process's copy only."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def bump(self, key) -> None:
+        """Invalidate `key` in every process sharing the backend."""
+        with self._lock:
+            self._entries.pop(key, None)
+        try:
+            self._backend.incr(self._version_key(key))
+        except Exception as e:
+            logger.warning(f"[CACHE] Version bump failed for {self._namespace}: {e}")
+
+
+def get_cache_backend() -> CacheBackend:
+    """Factory — returns the backend selected by CACHE_BACKEND."""
+    backend = settings.CACHE_BACKEND.lower()
+    if backend == "redis":
+        if not settings.CACHE_URL:
+            logger.warning("[CACHE] CACHE_BACKEND=redis but CACHE_URL is empty — using in-memory cache")
+        else:
+            return RedisCacheBackend(settings.CACHE_URL)
+    return InMemoryCacheBackend(max_entries=settings.CACHE_MAX_ENTRIES)
+
+
+def get_version_backend() -> CacheBackend:
+    """Counter source for VersionedLocalCache: Redis if configured, else the database."""
+    if settings.CACHE_BACKEND.lower() == "redis" and settings.CACHE_URL:
+        return RedisCacheBackend(settings.CACHE_URL)
+    return DatabaseVersionBackend()
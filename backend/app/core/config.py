@@ -34,12 +34,84 @@ class Settings(BaseSettings):
     SMTP_PASSWORD: str = ""
     SMTP_FROM: str = ""
     SMTP_USE_SSL: bool = True
+    SMTP_POOL_SIZE: int = 4            # max concurrent SMTP connections
+    SMTP_IDLE_TIMEOUT: float = 60.0    # seconds before an idle connection is reopened
+    SMTP_TIMEOUT: float = 10.0         # connect/command timeout in seconds
 
     SMS_PROVIDER: str = "mock"         # "mock" | "twilio"
     TWILIO_SID: str = ""
     TWILIO_TOKEN: str = ""
     TWILIO_FROM: str = ""
 
+    PROVIDER_BATCH_CONCURRENCY: int = 10   # in-flight sends per send_batch() call
+
+    # ── Event Outbox ────────────────────────────────────────
+    OUTBOX_ENABLED: bool = True
+    OUTBOX_WORKERS: int = 2
+    OUTBOX_BATCH_SIZE: int = 20
+    OUTBOX_POLL_INTERVAL: float = 1.0      # seconds between idle polls
+    OUTBOX_MAX_ATTEMPTS: int = 5
+    OUTBOX_RETRY_BASE_SECONDS: int = 10    # backoff = base * 2^(attempt-1)
+    OUTBOX_RETRY_MAX_SECONDS: int = 900
+    OUTBOX_LOCK_TIMEOUT: int = 300         # reclaim rows stuck in "processing"
+
+    # ── Automation ──────────────────────────────────────────
+    AUTOMATION_ACTION_TIMEOUT: float = 15.0   # seconds per automation action
+    AUTOMATION_IDEMPOTENCY_TTL_DAYS: int = 30 # how long a rule stays deduped per entity
+
+    # ── Async Executor ──────────────────────────────────────
+    ASYNC_EXECUTOR_MAX_PENDING: int = 200         # queued + running coroutines
+    ASYNC_EXECUTOR_SUBMIT_TIMEOUT: float = 5.0    # seconds submit() waits for a free slot
+    ASYNC_EXECUTOR_RESULT_TIMEOUT: float = 60.0   # seconds sync callers wait for a result
+
+    # ── Scheduler ───────────────────────────────────────────
+    SCHEDULER_ENABLED: bool = True
+    SCHEDULER_TICK_SECONDS: float = 5.0       # how often due jobs / leadership are checked
+    SCHEDULER_WORKERS: int = 4                # threads running job bodies on the leader
+    INVENTORY_SYNC_INTERVAL: int = 300        # seconds between low-stock alert syncs
+    BOOKING_REMINDER_INTERVAL: int = 600      # seconds between reminder scans
+    BOOKING_REMINDER_LEAD_HOURS: int = 24     # remind bookings starting within this window
+    LOG_RETENTION_CRON: str = "15 3 * * *"    # UTC
+    ROLLUP_REFRESH_CRON: str = "45 3 * * *"   # UTC
+
+    # ── Log Retention ───────────────────────────────────────
+    LOG_RETENTION_DAYS: int = 90              # default; workspaces.log_retention_days overrides
+    LOG_PARTITION_PREMAKE_MONTHS: int = 2     # monthly partitions created ahead of time
+    LOG_ARCHIVE_DIR: str = "./archive/logs"   # expired partitions are written here as .jsonl.gz
+
+    # ── Dashboard ───────────────────────────────────────────
+    DASHBOARD_QUERY_WORKERS: int = 4       # concurrent per-table aggregate queries
+    DASHBOARD_CACHE_TTL: int = 30          # seconds; 0 disables the response cache
+
+    # ── Bookings Calendar ───────────────────────────────────
+    BOOKINGS_CALENDAR_MAX_DAYS: int = 92   # widest window /bookings/calendar and /bookings accept
+    BOOKINGS_LIST_LOOKBACK_DAYS: int = 30  # /bookings without start_date starts this many days ago
+
+    # ── Contact Import ──────────────────────────────────────
+    CONTACT_IMPORT_BATCH_SIZE: int = 1000  # rows per multi-row INSERT + commit
+
+    # ── Realtime (WebSocket) ────────────────────────────────
+    WS_BACKPLANE: str = "postgres"             # "postgres" | "memory" (single process / tests)
+    WS_BACKPLANE_CHANNEL: str = "ws_broadcast" # LISTEN/NOTIFY channel
+    WS_SEND_QUEUE_SIZE: int = 100              # frames buffered per socket before it is dropped
+    WS_TYPING_INTERVAL: float = 0.5            # max one aggregated typing frame per workspace per interval
+    WS_TYPING_TTL: float = 6.0                 # typing state expires unless the client refreshes it
+
+    # ── Cache Backend ───────────────────────────────────────
+    CACHE_BACKEND: str = "memory"      # "memory" | "redis"
+    CACHE_URL: str = ""                # e.g. redis://localhost:6379/0
+    CACHE_MAX_ENTRIES: int = 2048      # LRU bound for the in-memory backend
+    CACHE_VERSION_TTL: float = 1.0     # seconds a worker trusts a checked version stamp
+
+    # ── Rate Limiting ───────────────────────────────────────
+    RATE_LIMIT_BACKEND: str = "memory"     # "memory" | "redis" (shared across workers)
+    RATE_LIMIT_URL: str = ""               # defaults to CACHE_URL
+    RATE_LIMIT_MAX_KEYS: int = 10000       # LRU bound for the in-memory backend
+    RATE_LIMIT_DEFAULT_PER_MIN: int = 60   # per IP, routes without a policy
+    RATE_LIMIT_AUTH_PER_MIN: int = 20      # per IP, login/register
+    RATE_LIMIT_WEBHOOKS_PER_MIN: int = 120 # per IP, inbound webhooks
+    RATE_LIMIT_CHAT_PER_SEC: int = 5       # per user, team chat messages
+
     @property
     def cors_origins_list(self) -> list[str]:
         """Parse comma-separated CORS origins into a list."""
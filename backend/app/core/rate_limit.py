@@ -1,34 +1,242 @@
+"""
+Rate limiting – GCRA (generic cell rate algorithm) with pluggable backends.
+
+A policy allows `limit` requests per `period` seconds, as a burst of up to
+`limit` followed by one request every period/limit seconds. GCRA stores a
+single number per key (the theoretical arrival time, TAT), so memory per
+key is constant and no per-request history is kept.
+
+Backends (RATE_LIMIT_BACKEND):
+- "memory": per-process LRU of TATs. Keys whose TAT has passed are idle
+  (indistinguishable from new) and are swept; past RATE_LIMIT_MAX_KEYS the
+  least recently seen key is forgotten.
+- "redis": one atomic Lua call per check using the Redis clock, with the
+  key expiring when it goes idle, so limits hold across every worker.
+
+Backend failures fail open: a cache outage must not lock users out.
+
+Routes pick a policy with `Depends(rate_limit(AUTH_POLICY))`; over-limit
+requests get 429 with a Retry-After header.
+"""
+
+import logging
+import math
+import threading
 import time
-from fastapi import Request, HTTPException, status
-
-# In-memory store for rate limiting: { "ip_address": [timestamp1, timestamp2, ...] }
-# In production with multiple workers/instances, use Redis.
-RATE_LIMIT_STORE = {}
-
-def limit_requests(request: Request):
-    """
-    Dependency to limit requests per IP.
-    Default: 60 requests per minute.
-    """
-    if not request.client or not request.client.host:
-        return True # Skip rate limit if usage cannot be tracked
-
-    ip = request.client.host
-    now = time.time()
-    window = 60  # seconds
-    limit = 60   # requests per window
-
-    history = RATE_LIMIT_STORE.get(ip, [])
-    
-    # Filter out timestamps older than the window
-    history = [t for t in history if now - t < window]
-    
-    if len(history) >= limit:
-        raise HTTPException(
-            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-            detail="Too many requests. Please try again later."
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import NamedTuple
+
+from fastapi import HTTPException, Request, status
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RateLimitPolicy:
+    name: str
+    limit: int       # requests allowed per period (also the burst size)
+    period: float    # seconds
+
+    @property
+    def interval(self) -> float:
+        """Seconds between requests once the burst is used up."""
+        return self.period / self.limit
+
+
+class RateLimitDecision(NamedTuple):
+    allowed: bool
+    remaining: int
+    retry_after: float   # seconds until the next request would be allowed
+
+
+# ── Policies ─────────────────────────────────────────────────────
+DEFAULT_POLICY = RateLimitPolicy("default", settings.RATE_LIMIT_DEFAULT_PER_MIN, 60)
+AUTH_POLICY = RateLimitPolicy("auth", settings.RATE_LIMIT_AUTH_PER_MIN, 60)
+WEBHOOK_POLICY = RateLimitPolicy("webhooks", settings.RATE_LIMIT_WEBHOOKS_PER_MIN, 60)
+CHAT_MESSAGE_POLICY = RateLimitPolicy("chat", settings.RATE_LIMIT_CHAT_PER_SEC, 1)
+
+
+def _gcra(tat: float | None, now: float, interval: float, burst: int) -> tuple[float | None, RateLimitDecision]:
+    """One GCRA step. Returns (new TAT to store or None if denied, decision)."""
+    tat = max(tat or now, now)
+    new_tat = tat + interval
+    allow_at = new_tat - interval * burst
+    if now < allow_at:
+        return None, RateLimitDecision(False, 0, allow_at - now)
+    return new_tat, RateLimitDecision(True, int((now - allow_at) / interval), 0.0)
+
+
+# ── Backends ─────────────────────────────────────────────────────
+
+class RateLimitBackend:
+    """Interface every rate limit backend implements."""
+
+    name = "base"
+
+    def hit(self, key: str, interval: float, burst: int) -> RateLimitDecision:
+        raise NotImplementedError
+
+    def size(self) -> int | None:
+        """Number of tracked keys, if cheaply known."""
+        return None
+
+
+class InMemoryRateLimitBackend(RateLimitBackend):
+    """Thread-safe LRU of key → TAT (monotonic seconds)."""
+
+    name = "memory"
+
+    SWEEP_PER_HIT = 2  # idle keys examined from the LRU end on each hit
+
+    def __init__(self, max_keys: int = 10000):
+        self._max_keys = max_keys
+        self._tats: OrderedDict[str, float] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def hit(self, key: str, interval: float, burst: int, now: float | None = None) -> RateLimitDecision:
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            new_tat, decision = _gcra(self._tats.get(key), now, interval, burst)
+            if new_tat is not None:
+                self._tats[key] = new_tat
+            if key in self._tats:
+                self._tats.move_to_end(key)
+            self._sweep(now)
+            return decision
+
+    def _sweep(self, now: float) -> None:
+        for _ in range(self.SWEEP_PER_HIT):
+            if not self._tats:
+                return
+            oldest, tat = next(iter(self._tats.items()))
+            if tat > now:
+                break
+            del self._tats[oldest]
+        while len(self._tats) > self._max_keys:
+            self._tats.popitem(last=False)
+
+    def size(self) -> int:
+        with self._lock:
+            return len(self._tats)
+
+
+_GCRA_LUA = """
+local interval = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) * 1000 + math.floor(tonumber(clock[2]) / 1000)
+local tat = tonumber(redis.call('GET', KEYS[1]) or now)
+if tat < now then tat = now end
+local new_tat = tat + interval
+local allow_at = new_tat - interval * burst
+if now < allow_at then
+  return {0, 0, allow_at - now}
+end
+redis.call('SET', KEYS[1], new_tat, 'PX', math.max(1, new_tat - now))
+return {1, math.floor((now - allow_at) / interval), 0}
+"""
+
+
+class RedisRateLimitBackend(RateLimitBackend):
+    """Shared GCRA state in Redis (TATs in milliseconds, server clock)."""
+
+    name = "redis"
+
+    def __init__(self, url: str):
+        try:
+            import redis
+        except ImportError as exc:
+            raise RuntimeError("RATE_LIMIT_BACKEND=redis requires the 'redis' package") from exc
+        self._client = redis.Redis.from_url(url, socket_timeout=1.0, health_check_interval=30)
+        self._script = self._client.register_script(_GCRA_LUA)
+
+    def hit(self, key: str, interval: float, burst: int) -> RateLimitDecision:
+        allowed, remaining, retry_after_ms = self._script(
+            keys=[key], args=[max(1, math.ceil(interval * 1000)), burst]
         )
+        return RateLimitDecision(bool(allowed), int(remaining), int(retry_after_ms) / 1000)
+
+
+def get_rate_limit_backend() -> RateLimitBackend:
+    """Factory — returns the backend selected by RATE_LIMIT_BACKEND."""
+    backend = settings.RATE_LIMIT_BACKEND.lower()
+    if backend == "redis":
+        url = settings.RATE_LIMIT_URL or settings.CACHE_URL
+        if not url:
+            logger.warning("[RATE] RATE_LIMIT_BACKEND=redis but no RATE_LIMIT_URL/CACHE_URL — using in-memory limits")
+        else:
+            return RedisRateLimitBackend(url)
+    return InMemoryRateLimitBackend(max_keys=settings.RATE_LIMIT_MAX_KEYS)
+
+
+# ── Limiter ──────────────────────────────────────────────────────
+
+class RateLimiter:
+    """Applies policies against a backend, with per-policy counters."""
+
+    def __init__(self, backend: RateLimitBackend | None = None):
+        self._backend = backend or get_rate_limit_backend()
+        self._lock = threading.Lock()
+        self._allowed: dict[str, int] = {}
+        self._limited: dict[str, int] = {}
+        self._errors = 0
+
+    def hit(self, policy: RateLimitPolicy, key: str) -> RateLimitDecision:
+        """Count one request for `key` under `policy`."""
+        try:
+            decision = self._backend.hit(f"rl:{policy.name}:{key}", policy.interval, policy.limit)
+        except Exception as e:
+            logger.warning(f"[RATE] Backend failed, allowing request: {e}")
+            with self._lock:
+                self._errors += 1
+            return RateLimitDecision(True, policy.limit, 0.0)
+        counters = self._allowed if decision.allowed else self._limited
+        with self._lock:
+            counters[policy.name] = counters.get(policy.name, 0) + 1
+        return decision
+
+    def stats(self) -> dict:
+        """Allowed/limited counters for this process."""
+        with self._lock:
+            policies = sorted(set(self._allowed) | set(self._limited))
+            return {
+                "backend": self._backend.name,
+                "keys": self._backend.size(),
+                "errors": self._errors,
+                "by_policy": {
+                    name: {"allowed": self._allowed.get(name, 0), "limited": self._limited.get(name, 0)}
+                    for name in policies
+                },
+            }
+
+
+# ── Singleton instance ────────────────────────────────────────────
+rate_limiter = RateLimiter()
+
+
+# ── FastAPI dependencies ─────────────────────────────────────────
+
+def rate_limit(policy: RateLimitPolicy):
+    """Dependency factory: limit requests per client IP under `policy`."""
+
+    def dependency(request: Request):
+        if not request.client or not request.client.host:
+            return True  # Skip rate limit if usage cannot be tracked
+        decision = rate_limiter.hit(policy, request.client.host)
+        if not decision.allowed:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too many requests. Please try again later.",
+                headers={"Retry-After": str(max(1, math.ceil(decision.retry_after)))},
+            )
+        return True
+
+    dependency.__name__ = f"rate_limit_{policy.name}"
+    return dependency
+
 
-    history.append(now)
-    RATE_LIMIT_STORE[ip] = history
-    return True
+# Default per-IP limit, for routes without a dedicated policy
+limit_requests = rate_limit(DEFAULT_POLICY)
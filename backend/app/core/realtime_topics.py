@@ -0,0 +1,83 @@
+"""
+Realtime Topics – typed workspace events pushed over the chat WebSocket.
+
+Write paths call publish_after_commit(); the event waits on the session
+and is broadcast to the workspace once the transaction commits (dropped
+on rollback), so clients never hear about rows they cannot read yet.
+Frames arrive as { type: <topic>, payload: {...} } next to the chat events,
+letting clients refetch on change instead of polling.
+
+Topics (payload keys):
+  inbox.message_created   conversation_id, message_id
+  alert.created           alert_id, title, severity
+  booking.status_changed  booking_id, status, previous_status (None when created)
+  dashboard.invalidated   –  any committed change to dashboard data
+                             (alerts, bookings, conversations, …); also the
+                             cue to refresh the inbox/alert unread counts
+"""
+
+import logging
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.database import SessionLocal
+from app.core.websocket_manager import ws_manager
+
+logger = logging.getLogger(__name__)
+
+INBOX_MESSAGE_CREATED = "inbox.message_created"
+ALERT_CREATED = "alert.created"
+BOOKING_STATUS_CHANGED = "booking.status_changed"
+DASHBOARD_INVALIDATED = "dashboard.invalidated"
+
+# topic → payload keys every publisher must supply
+TOPICS: dict[str, tuple[str, ...]] = {
+    INBOX_MESSAGE_CREATED: ("conversation_id", "message_id"),
+    ALERT_CREATED: ("alert_id", "title", "severity"),
+    BOOKING_STATUS_CHANGED: ("booking_id", "status", "previous_status"),
+    DASHBOARD_INVALIDATED: (),
+}
+
+_PENDING_KEY = "realtime_pending_events"
+
+
+def _check(topic: str, payload: dict) -> None:
+    required = TOPICS.get(topic)
+    if required is None:
+        raise ValueError(f"Unknown realtime topic {topic!r}")
+    missing = [key for key in required if key not in payload]
+    if missing:
+        raise ValueError(f"{topic} payload missing {', '.join(missing)}")
+
+
+def publish(workspace_id: int, topic: str, payload: dict | None = None) -> None:
+    """Broadcast a topic event now (for callers that have already committed)."""
+    payload = payload or {}
+    _check(topic, payload)
+    ws_manager.broadcast_threadsafe(workspace_id, topic, jsonable_encoder(payload))
+
+
+def publish_after_commit(db: Session, workspace_id: int, topic: str, payload: dict | None = None) -> None:
+    """Queue a topic event on `db`; it is broadcast when `db` commits."""
+    payload = payload or {}
+    _check(topic, payload)
+    db.info.setdefault(_PENDING_KEY, []).append((workspace_id, topic, jsonable_encoder(payload)))
+
+
+@event.listens_for(SessionLocal, "after_commit")
+def _publish_on_commit(session: Session):
+    for workspace_id, topic, payload in session.info.pop(_PENDING_KEY, ()):
+        try:
+            ws_manager.broadcast_threadsafe(workspace_id, topic, payload)
+        except Exception as e:
+            # Realtime pushes are best-effort; the write already committed
+            logger.warning(f"[WS] Failed to publish {topic} for workspace {workspace_id}: {e}")
+
+
+@event.listens_for(SessionLocal, "after_transaction_end")
+def _discard_unpublished(session: Session, transaction):
+    # Runs after after_commit; anything still queued was rolled back
+    if transaction.parent is None:
+        session.info.pop(_PENDING_KEY, None)
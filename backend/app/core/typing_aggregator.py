@@ -0,0 +1,139 @@
+"""
+Typing Aggregator – coalesced "who is typing" state for team chat.
+
+Clients send typing_start/typing_stop. Relaying each one to every
+socket in the workspace costs O(n²) frames, so instead every
+WS_TYPING_INTERVAL seconds:
+
+1. each process publishes its users' net state changes (one backplane
+   message per workspace; a start/stop flurry inside one interval, or a
+   repeated start within WS_TYPING_TTL/3 of the last publish, publishes
+   nothing new — clients must refresh more often than every TTL/2);
+2. every process merges the changes it receives into the workspace's
+   typing set, expiring users not refreshed within WS_TYPING_TTL (clients
+   repeat typing_start while typing, so crashed tabs clear themselves);
+3. each workspace whose set changed gets one aggregated "typing" frame,
+   delivered to that process's local sockets only.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class TypingAggregator:
+    def __init__(
+        self,
+        publish: Callable[[dict], Awaitable[None]],
+        emit: Callable[[int, list[dict]], Awaitable[None]],
+        interval: float = settings.WS_TYPING_INTERVAL,
+        ttl: float = settings.WS_TYPING_TTL,
+    ):
+        self._publish = publish          # to every process (backplane)
+        self._emit = emit                # to this process's sockets
+        self._interval = interval
+        self._ttl = ttl
+        # Local input, overwritten until the next flush: (ws, user) → (name, active)
+        self._pending: dict[tuple[int, int], tuple[str, bool]] = {}
+        # What this process last published as active: (ws, user) → published_at
+        self._published: dict[tuple[int, int], float] = {}
+        # Merged workspace state: ws → {user: (name, expires_at)}
+        self._typing: dict[int, dict[int, tuple[str, float]]] = {}
+        self._dirty: set[int] = set()
+        self._last_emitted: dict[int, tuple[int, ...]] = {}
+        self._task: asyncio.Task | None = None
+
+    # ── Input ─────────────────────────────────────────────────────
+
+    def update(self, workspace_id: int, user_id: int, user_name: str, active: bool) -> None:
+        """Record a local user's typing state; published on the next flush."""
+        self._pending[(workspace_id, user_id)] = (user_name, active)
+
+    def apply(self, message: dict, now: float | None = None) -> None:
+        """Merge a published batch of changes (from any process)."""
+        now = time.monotonic() if now is None else now
+        workspace_id = message["workspace_id"]
+        users = self._typing.setdefault(workspace_id, {})
+        for change in message["changes"]:
+            if change["active"]:
+                users[change["user_id"]] = (change["user_name"], now + self._ttl)
+            else:
+                users.pop(change["user_id"], None)
+        if not users:
+            del self._typing[workspace_id]
+        self._dirty.add(workspace_id)
+
+    # ── Flush ─────────────────────────────────────────────────────
+
+    def _net_changes(self, now: float) -> dict[int, list[dict]]:
+        changes: dict[int, list[dict]] = {}
+        for key, (name, active) in self._pending.items():
+            published_at = self._published.get(key)
+            if active:
+                if published_at is not None and now - published_at < self._ttl / 3:
+                    continue  # already typing and refreshed within the last ttl/3
+                self._published[key] = now
+            else:
+                if published_at is None:
+                    continue  # never announced, nothing to retract
+                del self._published[key]
+            workspace_id, user_id = key
+            changes.setdefault(workspace_id, []).append(
+                {"user_id": user_id, "user_name": name, "active": active}
+            )
+        self._pending.clear()
+        return changes
+
+    def _expire(self, now: float) -> None:
+        for workspace_id, users in list(self._typing.items()):
+            stale = [user_id for user_id, (_, expires_at) in users.items() if expires_at <= now]
+            for user_id in stale:
+                del users[user_id]
+            if stale:
+                self._dirty.add(workspace_id)
+            if not users:
+                del self._typing[workspace_id]
+
+    async def flush(self, now: float | None = None) -> None:
+        now = time.monotonic() if now is None else now
+        for workspace_id, changes in self._net_changes(now).items():
+            await self._publish({"workspace_id": workspace_id, "kind": "typing", "changes": changes})
+
+        self._expire(now)
+        dirty, self._dirty = self._dirty, set()
+        for workspace_id in dirty:
+            users = self._typing.get(workspace_id, {})
+            snapshot = tuple(sorted(users))
+            if self._last_emitted.get(workspace_id, ()) == snapshot:
+                continue
+            if snapshot:
+                self._last_emitted[workspace_id] = snapshot
+            else:
+                self._last_emitted.pop(workspace_id, None)
+            await self._emit(workspace_id, [
+                {"user_id": user_id, "user_name": users[user_id][0]} for user_id in snapshot
+            ])
+
+    # ── Lifecycle ─────────────────────────────────────────────────
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.warning(f"WS: typing flush failed: {e}")
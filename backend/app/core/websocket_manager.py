@@ -3,52 +3,77 @@ WebSocket Connection Manager for Internal Messaging.
 
 Tracks active WebSocket connections per workspace.
 Handles connect, disconnect, and broadcast with fault tolerance.
+
+Connections live in the process that accepted them. Broadcasts are
+published once to the backplane (core/ws_backplane.py) and every process,
+including the publisher, delivers them to its own sockets, so events reach
+users connected to any worker or instance.
+
+Delivery never awaits a socket: each event is serialized once and put on
+every recipient's bounded send queue, drained by that connection's own
+writer task. A client whose queue overflows (WS_SEND_QUEUE_SIZE) is
+disconnected as a slow consumer instead of stalling everyone else.
 """
 
 import logging
 import asyncio
+import json
 import time
 from typing import Dict, Set
 from collections import defaultdict
 from fastapi import WebSocket, WebSocketDisconnect
 
+from app.core.config import settings
+from app.core.rate_limit import CHAT_MESSAGE_POLICY, rate_limiter
+from app.core.typing_aggregator import TypingAggregator
+from app.core.ws_backplane import Backplane, create_backplane
+
 logger = logging.getLogger(__name__)
 
 MAX_CONNECTIONS_PER_WORKSPACE = 50
-RATE_LIMIT_MESSAGES_PER_SEC = 5
+SLOW_CONSUMER_CLOSE_CODE = 4008
 
 
 class ConnectionEntry:
-    """Represents a single WebSocket connection."""
-    __slots__ = ("websocket", "user_id", "user_name", "connected_at")
+    """A single WebSocket connection with its send queue and writer task."""
+    __slots__ = (
+        "websocket", "user_id", "user_name", "connected_at",
+        "queue", "writer", "sent", "last_lag_ms", "max_lag_ms",
+    )
 
-    def __init__(self, websocket: WebSocket, user_id: int, user_name: str):
+    def __init__(self, websocket: WebSocket, user_id: int, user_name: str, queue_size: int):
         self.websocket = websocket
         self.user_id = user_id
         self.user_name = user_name
         self.connected_at = time.time()
+        # (enqueued_at, serialized frame)
+        self.queue: asyncio.Queue[tuple[float, str]] = asyncio.Queue(maxsize=queue_size)
+        self.writer: asyncio.Task | None = None
+        self.sent = 0
+        self.last_lag_ms = 0.0
+        self.max_lag_ms = 0.0
+
+    def offer(self, text: str) -> bool:
+        """Queue a frame without waiting. False if the client is too far behind."""
+        try:
+            self.queue.put_nowait((time.monotonic(), text))
+            return True
+        except asyncio.QueueFull:
+            return False
 
+    def stats(self) -> dict:
+        return {
+            "user_id": self.user_id,
+            "connected_for_s": round(time.time() - self.connected_at),
+            "queued": self.queue.qsize(),
+            "sent": self.sent,
+            "last_lag_ms": round(self.last_lag_ms, 1),
+            "max_lag_ms": round(self.max_lag_ms, 1),
+        }
 
-class RateLimiter:
-    """Simple per-user token bucket rate limiter."""
-
-    def __init__(self, max_per_sec: int = RATE_LIMIT_MESSAGES_PER_SEC):
-        self._max = max_per_sec
-        self._buckets: Dict[int, list] = defaultdict(list)
-
-    def allow(self, user_id: int) -> bool:
-        now = time.time()
-        # Prune old timestamps
-        self._buckets[user_id] = [
-            t for t in self._buckets[user_id] if now - t < 1.0
-        ]
-        if len(self._buckets[user_id]) >= self._max:
-            return False
-        self._buckets[user_id].append(now)
-        return True
 
-    def cleanup_user(self, user_id: int):
-        self._buckets.pop(user_id, None)
+def _frame(event_type: str, payload: dict) -> str:
+    return json.dumps({"type": event_type, "payload": payload}, separators=(",", ":"))
 
 
 class WebSocketManager:
@@ -62,10 +87,31 @@ class WebSocketManager:
     Multiple tabs from the same user are supported.
     """
 
-    def __init__(self):
+    def __init__(self, backplane: Backplane | None = None):
         # workspace_id → { conn_id: ConnectionEntry }
         self._connections: Dict[int, Dict[str, ConnectionEntry]] = defaultdict(dict)
-        self._rate_limiter = RateLimiter()
+        self._backplane = backplane or create_backplane()
+        self._started = False
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._queue_size = settings.WS_SEND_QUEUE_SIZE
+        self._slow_consumers_dropped = 0
+        self._typing = TypingAggregator(publish=self._publish, emit=self._emit_typing)
+
+    async def start(self):
+        """Subscribe to the backplane (call once per process, on the serving loop)."""
+        if self._started:
+            return
+        await self._backplane.start(self._deliver)
+        self._typing.start()
+        self._loop = asyncio.get_running_loop()
+        self._started = True
+
+    async def stop(self):
+        if self._started:
+            self._started = False
+            self._loop = None
+            await self._typing.stop()
+            await self._backplane.stop()
 
     def _conn_id(self, user_id: int, websocket: WebSocket) -> str:
         """Generate a unique connection ID per tab."""
@@ -86,7 +132,9 @@ class WebSocketManager:
             return False
 
         conn_id = self._conn_id(user_id, websocket)
-        pool[conn_id] = ConnectionEntry(websocket, user_id, user_name)
+        entry = ConnectionEntry(websocket, user_id, user_name, self._queue_size)
+        entry.writer = asyncio.create_task(self._writer(workspace_id, conn_id, entry))
+        pool[conn_id] = entry
         logger.info(
             f"WS: user {user_id} ({user_name}) connected to workspace {workspace_id}. "
             f"Active: {len(pool)}"
@@ -101,6 +149,9 @@ class WebSocketManager:
         conn_id = self._conn_id(user_id, websocket)
         entry = pool.pop(conn_id, None)
         if entry:
+            if entry.writer:
+                entry.writer.cancel()
+            self._typing.update(workspace_id, user_id, entry.user_name, False)
             logger.info(
                 f"WS: user {user_id} disconnected from workspace {workspace_id}. "
                 f"Active: {len(pool)}"
@@ -116,57 +167,147 @@ class WebSocketManager:
         payload: dict,
         exclude_user_id: int | None = None,
     ):
+        """Send an event to all connections in a workspace, on every process."""
+        await self._publish({
+            "workspace_id": workspace_id,
+            "type": event_type,
+            "payload": payload,
+            "exclude_user_id": exclude_user_id,
+        })
+
+    def broadcast_threadsafe(self, workspace_id: int, event_type: str, payload: dict):
         """
-        Send an event to all connections in a workspace.
-        Broken sockets are automatically removed.
+        broadcast() for sync code (threadpool routes, workers, commit hooks):
+        schedules the publish on the serving loop without waiting for it.
+        A no-op in processes that are not serving WebSockets.
         """
-        pool = self._connections.get(workspace_id)
-        if not pool:
+        loop = self._loop
+        if loop is None or loop.is_closed():
             return
-
-        message = {"type": event_type, "payload": payload}
-        dead: list[str] = []
-
-        for conn_id, entry in pool.items():
-            if exclude_user_id is not None and entry.user_id == exclude_user_id:
-                continue
-            try:
-                await entry.websocket.send_json(message)
-            except Exception:
-                dead.append(conn_id)
-                logger.debug(f"WS: dead socket {conn_id} in workspace {workspace_id}")
-
-        # Clean up broken sockets
-        for conn_id in dead:
-            pool.pop(conn_id, None)
-        if not pool:
-            self._connections.pop(workspace_id, None)
+        coro = self.broadcast(workspace_id, event_type, payload)
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            loop.create_task(coro)
+        else:
+            asyncio.run_coroutine_threadsafe(coro, loop)
 
     async def send_to_user(
         self, workspace_id: int, user_id: int, event_type: str, payload: dict
     ):
-        """Send an event to all connections of a specific user."""
+        """Send an event to all connections of a specific user, on every process."""
+        await self._publish({
+            "workspace_id": workspace_id,
+            "type": event_type,
+            "payload": payload,
+            "user_id": user_id,
+        })
+
+    async def _publish(self, message: dict):
+        if not self._started:
+            # No backplane (tests, scripts): local delivery only
+            await self._deliver(message)
+            return
+        try:
+            await self._backplane.publish(message)
+        except Exception as e:
+            logger.error(f"WS: backplane publish failed, delivering locally only: {e}")
+            await self._deliver(message)
+
+    async def _deliver(self, message: dict):
+        """
+        Deliver a backplane message to this process's sockets: serialize once,
+        then queue the frame for each recipient without awaiting any socket.
+        """
+        if message.get("kind") == "typing":
+            self._typing.apply(message)
+            return
+
+        workspace_id = message["workspace_id"]
         pool = self._connections.get(workspace_id)
         if not pool:
             return
 
-        message = {"type": event_type, "payload": payload}
-        dead: list[str] = []
+        exclude_user_id = message.get("exclude_user_id")
+        only_user_id = message.get("user_id")
+        text = _frame(message["type"], message["payload"])
+        slow: list[str] = []
 
         for conn_id, entry in pool.items():
-            if entry.user_id != user_id:
+            if exclude_user_id is not None and entry.user_id == exclude_user_id:
                 continue
-            try:
-                await entry.websocket.send_json(message)
-            except Exception:
-                dead.append(conn_id)
-
-        for conn_id in dead:
-            pool.pop(conn_id, None)
+            if only_user_id is not None and entry.user_id != only_user_id:
+                continue
+            if not entry.offer(text):
+                slow.append(conn_id)
+
+        for conn_id in slow:
+            self._drop_slow_consumer(workspace_id, conn_id)
+
+    def set_typing(self, workspace_id: int, user_id: int, user_name: str, active: bool):
+        """Record typing_start/typing_stop; coalesced into periodic "typing" frames."""
+        self._typing.update(workspace_id, user_id, user_name, active)
+
+    async def _emit_typing(self, workspace_id: int, users: list[dict]):
+        # Local sockets only: every process runs its own aggregator
+        await self._deliver({"workspace_id": workspace_id, "type": "typing", "payload": {"users": users}})
+
+    def enqueue(self, workspace_id: int, user_id: int, websocket: WebSocket, event_type: str, payload: dict) -> bool:
+        """Queue a frame for one local connection (keeps it ordered with broadcasts)."""
+        entry = self._connections.get(workspace_id, {}).get(self._conn_id(user_id, websocket))
+        return bool(entry and entry.offer(_frame(event_type, payload)))
+
+    async def _writer(self, workspace_id: int, conn_id: str, entry: ConnectionEntry):
+        """Drain one connection's queue; a failed send removes the connection."""
+        try:
+            while True:
+                enqueued_at, text = await entry.queue.get()
+                await entry.websocket.send_text(text)
+                entry.sent += 1
+                entry.last_lag_ms = (time.monotonic() - enqueued_at) * 1000
+                entry.max_lag_ms = max(entry.max_lag_ms, entry.last_lag_ms)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.debug(f"WS: dead socket {conn_id} in workspace {workspace_id}")
+            self._remove(workspace_id, conn_id)
+
+    def _remove(self, workspace_id: int, conn_id: str) -> ConnectionEntry | None:
+        pool = self._connections.get(workspace_id)
+        if not pool:
+            return None
+        entry = pool.pop(conn_id, None)
+        if not pool:
+            self._connections.pop(workspace_id, None)
+        return entry
 
-    def check_rate_limit(self, user_id: int) -> bool:
-        """Returns True if the user is within rate limits."""
-        return self._rate_limiter.allow(user_id)
+    def _drop_slow_consumer(self, workspace_id: int, conn_id: str):
+        entry = self._remove(workspace_id, conn_id)
+        if not entry:
+            return
+        self._slow_consumers_dropped += 1
+        logger.warning(
+            f"WS: dropping slow consumer {conn_id} in workspace {workspace_id} "
+            f"({entry.queue.qsize()} frames queued, max lag {entry.max_lag_ms:.0f}ms)"
+        )
+        if entry.writer:
+            entry.writer.cancel()
+        asyncio.create_task(self._close_quietly(entry.websocket))
+
+    @staticmethod
+    async def _close_quietly(websocket: WebSocket):
+        try:
+            await websocket.close(code=SLOW_CONSUMER_CLOSE_CODE, reason="Too slow")
+        except Exception:
+            pass
+
+    async def check_rate_limit(self, user_id: int) -> bool:
+        """Returns True if the user is within the chat message limit (all workers)."""
+        # The Redis backend does a blocking round trip; keep it off the event loop
+        decision = await asyncio.to_thread(rate_limiter.hit, CHAT_MESSAGE_POLICY, str(user_id))
+        return decision.allowed
 
     def get_online_users(self, workspace_id: int) -> list[dict]:
         """Return list of unique online users in a workspace."""
@@ -178,10 +319,14 @@ class WebSocketManager:
         return [{"id": uid, "name": name} for uid, name in seen.items()]
 
     def get_stats(self) -> dict:
-        """Debug stats."""
+        """Connection counts, per-connection queue depth/lag and slow-consumer drops."""
         return {
-            ws_id: len(pool)
-            for ws_id, pool in self._connections.items()
+            "workspaces": {
+                ws_id: [entry.stats() for entry in pool.values()]
+                for ws_id, pool in self._connections.items()
+            },
+            "send_queue_size": self._queue_size,
+            "slow_consumers_dropped": self._slow_consumers_dropped,
         }
 
 
@@ -0,0 +1,215 @@
+"""
+WebSocket Backplane – cross-process fan-out for WebSocketManager.
+
+Each process holds only its own sockets, so a broadcast is published once
+to the backplane and every subscribed process (the publisher included)
+delivers it to its local connections.
+
+Backends (WS_BACKPLANE):
+- "postgres": NOTIFY on WS_BACKPLANE_CHANNEL; each process keeps one
+  LISTEN connection watched by its event loop. NOTIFY payloads are capped
+  at 8000 bytes, so larger messages are split into fragments sent in one
+  transaction (delivered contiguously, in order) and reassembled.
+- "memory": in-process hub, for tests and single-worker development.
+  Several backplanes sharing one InMemoryHub behave like separate workers.
+"""
+
+import asyncio
+import json
+import logging
+import uuid
+from abc import ABC, abstractmethod
+from typing import Awaitable, Callable
+
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+Deliver = Callable[[dict], Awaitable[None]]
+
+NOTIFY_MAX_BYTES = 7900  # Postgres limit is 8000, minus fragment header
+
+
+class Backplane(ABC):
+    """Publishes messages to every process and hands received ones to `deliver`."""
+
+    @abstractmethod
+    async def start(self, deliver: Deliver) -> None: ...
+
+    @abstractmethod
+    async def publish(self, message: dict) -> None: ...
+
+    @abstractmethod
+    async def stop(self) -> None: ...
+
+
+# ── In-memory ────────────────────────────────────────────────────
+
+class InMemoryHub:
+    """Shared 'bus' connecting in-memory backplanes."""
+
+    def __init__(self):
+        self.subscribers: list[Deliver] = []
+
+
+class InMemoryBackplane(Backplane):
+    def __init__(self, hub: InMemoryHub | None = None):
+        self._hub = hub or InMemoryHub()
+        self._deliver: Deliver | None = None
+
+    async def start(self, deliver: Deliver) -> None:
+        self._deliver = deliver
+        self._hub.subscribers.append(deliver)
+
+    async def publish(self, message: dict) -> None:
+        # Round-trip through JSON like the real transport
+        decoded = json.loads(json.dumps(message))
+        for deliver in list(self._hub.subscribers):
+            await deliver(decoded)
+
+    async def stop(self) -> None:
+        if self._deliver in self._hub.subscribers:
+            self._hub.subscribers.remove(self._deliver)
+        self._deliver = None
+
+
+# ── Postgres LISTEN/NOTIFY ───────────────────────────────────────
+
+def split_fragments(raw: str, limit: int = NOTIFY_MAX_BYTES) -> list[str]:
+    """Split a JSON payload into NOTIFY-sized '<id> <i> <n> <chunk>' fragments."""
+    data = raw.encode("utf-8")
+    if len(data) <= limit:
+        return [f"- 0 1 {raw}"]
+    chunks, start = [], 0
+    while start < len(data):
+        end = min(start + limit, len(data))
+        while end < len(data) and (data[end] & 0xC0) == 0x80:
+            end -= 1  # never cut a UTF-8 sequence in half
+        chunks.append(data[start:end].decode("utf-8"))
+        start = end
+    message_id = uuid.uuid4().hex
+    return [f"{message_id} {i} {len(chunks)} {chunk}" for i, chunk in enumerate(chunks)]
+
+
+class FragmentAssembler:
+    """Reassembles fragments produced by split_fragments()."""
+
+    def __init__(self, max_pending: int = 256):
+        self._pending: dict[str, list[str | None]] = {}
+        self._max_pending = max_pending
+
+    def feed(self, fragment: str) -> str | None:
+        """Returns the full payload once its last fragment arrives."""
+        message_id, index, total, chunk = fragment.split(" ", 3)
+        if message_id == "-":
+            return chunk
+        parts = self._pending.get(message_id)
+        if parts is None:
+            if len(self._pending) >= self._max_pending:
+                self._pending.pop(next(iter(self._pending)))  # drop the oldest incomplete message
+            parts = self._pending[message_id] = [None] * int(total)
+        parts[int(index)] = chunk
+        if any(p is None for p in parts):
+            return None
+        del self._pending[message_id]
+        return "".join(parts)
+
+
+class PostgresBackplane(Backplane):
+    def __init__(self, channel: str = settings.WS_BACKPLANE_CHANNEL, reconnect_delay: float = 2.0):
+        self._channel = channel
+        self._reconnect_delay = reconnect_delay
+        self._dsn = make_url(settings.DATABASE_URL).set(drivername="postgresql").render_as_string(hide_password=False)
+        self._conn = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._deliver: Deliver | None = None
+        self._assembler = FragmentAssembler()
+        self._reconnect_task: asyncio.Task | None = None
+        self._stopping = False
+
+    async def start(self, deliver: Deliver) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._deliver = deliver
+        self._stopping = False
+        await self._listen()
+
+    async def _listen(self) -> None:
+        import psycopg2
+
+        conn = await asyncio.to_thread(psycopg2.connect, self._dsn)
+        conn.autocommit = True
+        with conn.cursor() as cur:
+            cur.execute(f'LISTEN "{self._channel}"')
+        self._conn = conn
+        self._loop.add_reader(conn.fileno(), self._on_readable)
+        logger.info(f"[WS] Listening on Postgres channel {self._channel}")
+
+    def _on_readable(self) -> None:
+        try:
+            self._conn.poll()
+        except Exception as e:
+            logger.warning(f"[WS] Backplane connection lost: {e}")
+            self._drop_connection()
+            if not self._stopping:
+                self._reconnect_task = self._loop.create_task(self._reconnect())
+            return
+        while self._conn.notifies:
+            notify = self._conn.notifies.pop(0)
+            try:
+                raw = self._assembler.feed(notify.payload)
+                if raw is not None:
+                    self._loop.create_task(self._deliver(json.loads(raw)))
+            except (ValueError, IndexError) as e:
+                logger.warning(f"[WS] Dropping malformed backplane message: {e}")
+
+    def _drop_connection(self) -> None:
+        conn, self._conn = self._conn, None
+        if conn is None:
+            return
+        try:
+            self._loop.remove_reader(conn.fileno())
+        except Exception:
+            pass
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    async def _reconnect(self) -> None:
+        while not self._stopping:
+            await asyncio.sleep(self._reconnect_delay)
+            try:
+                await self._listen()
+                return
+            except Exception as e:
+                logger.warning(f"[WS] Backplane reconnect failed: {e}")
+
+    async def publish(self, message: dict) -> None:
+        fragments = split_fragments(json.dumps(message, separators=(",", ":"), ensure_ascii=False))
+        await asyncio.to_thread(self._notify, fragments)
+
+    def _notify(self, fragments: list[str]) -> None:
+        from app.core.database import engine
+
+        # One transaction: the fragments are queued together and in order
+        with engine.begin() as conn:
+            for fragment in fragments:
+                conn.execute(text("SELECT pg_notify(:channel, :payload)"), {"channel": self._channel, "payload": fragment})
+
+    async def stop(self) -> None:
+        self._stopping = True
+        if self._reconnect_task:
+            self._reconnect_task.cancel()
+            self._reconnect_task = None
+        self._drop_connection()
+
+
+def create_backplane(kind: str = settings.WS_BACKPLANE) -> Backplane:
+    if kind == "postgres":
+        return PostgresBackplane()
+    if kind == "memory":
+        return InMemoryBackplane()
+    raise ValueError(f"Unknown WS_BACKPLANE {kind!r}; expected 'postgres' or 'memory'")
@@ -4,6 +4,7 @@ Cloud Run compatible: binds to 0.0.0.0:$PORT.
 """
 
 import os
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Depends
 from fastapi.middleware.cors import CORSMiddleware
@@ -17,11 +18,37 @@ from app.models.workspace import Workspace
 import app.models  # Ensures all SQLAlchemy models are registered in the mapper registry
 
 from app.core.middleware import LogRequestsMiddleware
+from app.utils.pagination import NEXT_CURSOR_HEADER
 from app.core.exception_handlers import http_exception_handler, validation_exception_handler, generic_exception_handler
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from app.api import auth, onboarding, staff, contacts, inbox, bookings, forms, inventory, alerts, event_logs, dashboard, webhooks, automation, integrations, internal_messages
 from app.api import settings as settings_api
+from app.tasks.outbox_worker import outbox_worker
+from app.tasks.async_executor import async_executor
+from app.core.websocket_manager import ws_manager
+from app.tasks.scheduler import register_default_jobs, scheduler
+
+
+# ── Lifespan ──────────────────────────────────────────────────────
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start background workers on boot and stop them on shutdown."""
+    async_executor.start()
+    await ws_manager.start()
+    if settings.OUTBOX_ENABLED:
+        outbox_worker.start()
+    if settings.SCHEDULER_ENABLED:
+        register_default_jobs()
+        scheduler.start()
+    yield
+    if settings.SCHEDULER_ENABLED:
+        scheduler.stop()  # first: its jobs enqueue outbox events
+    if settings.OUTBOX_ENABLED:
+        outbox_worker.stop()
+    async_executor.stop()  # after the outbox, whose handlers submit to it
+    await ws_manager.stop()
+
 
 app = FastAPI(
     title=settings.APP_NAME,
@@ -29,6 +56,7 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
 # ── 1. Middleware ──────────────────────────────────────────────────
@@ -38,6 +66,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 app.add_middleware(LogRequestsMiddleware)
 
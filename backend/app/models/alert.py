@@ -2,7 +2,7 @@
 Alert model – system notifications with severity levels.
 """
 
-from sqlalchemy import Column, String, Integer, ForeignKey, Text, Boolean, Enum
+from sqlalchemy import Column, String, Integer, ForeignKey, Text, Boolean, Enum, Index, text
 
 from app.models.base import Base, TimestampMixin
 from app.utils.enums import AlertSeverity
@@ -10,6 +10,9 @@ from app.utils.enums import AlertSeverity
 
 class Alert(TimestampMixin, Base):
     __tablename__ = "alerts"
+    __table_args__ = (
+        Index("ix_alert_workspace_read_created", "workspace_id", "is_read", text("created_at DESC"), text("id DESC")),
+    )
 
     title = Column(String(255), nullable=False)
     message = Column(Text, nullable=True)
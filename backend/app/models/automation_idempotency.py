@@ -0,0 +1,25 @@
+"""
+AutomationIdempotency model – one row per automation that has run for an entity.
+The (workspace_id, unique_key) primary key makes the dedupe check a single
+index probe; rows expire after AUTOMATION_IDEMPOTENCY_TTL_DAYS and are swept.
+"""
+
+from sqlalchemy import Column, String, Integer, ForeignKey, DateTime, Index, func
+
+from app.models.base import Base
+
+
+class AutomationIdempotency(Base):
+    __tablename__ = "automation_idempotency"
+    __table_args__ = (
+        Index("ix_automation_idempotency_expires", "expires_at"),
+    )
+
+    workspace_id = Column(Integer, ForeignKey("workspaces.id", ondelete="CASCADE"), primary_key=True)
+    unique_key = Column(String(255), primary_key=True)  # "<rule_key>:<entity_id>"
+    rule_key = Column(String(100), nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    expires_at = Column(DateTime(timezone=True), nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<AutomationIdempotency ws={self.workspace_id} key={self.unique_key}>"
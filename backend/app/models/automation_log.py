@@ -1,23 +1,36 @@
 """
 AutomationLog model — audit trail for event-driven automation.
-Insert-only log table for traceability.
+Doubles as the transactional outbox: rows are written in the same
+transaction as the business change and drained by the outbox worker.
+Range-partitioned by month on created_at (see services/log_partitions.py).
 """
 
-from sqlalchemy import Column, String, Integer, ForeignKey, Index
+from sqlalchemy import Column, String, Integer, ForeignKey, Index, JSON, Text, DateTime
 
-from app.models.base import Base, TimestampMixin
+from app.models.base import Base, TimestampMixin, partition_key_column
 
 
 class AutomationLog(TimestampMixin, Base):
     __tablename__ = "automation_logs"
     __table_args__ = (
         Index("ix_autolog_workspace_created", "workspace_id", "created_at"),
+        Index("ix_autolog_status_next_attempt", "status", "next_attempt_at"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
     )
 
+    created_at = partition_key_column()
+
     workspace_id = Column(Integer, ForeignKey("workspaces.id", ondelete="CASCADE"), nullable=False, index=True)
     event_type = Column(String(100), nullable=False, index=True)
     reference_id = Column(Integer, nullable=True)  # generic FK to the triggering entity
     status = Column(String(20), nullable=False, default="pending")
 
+    # ── Outbox delivery state ───────────────────────────────
+    payload = Column(JSON, nullable=True)
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime(timezone=True), nullable=True)
+    locked_at = Column(DateTime(timezone=True), nullable=True)
+    last_error = Column(Text, nullable=True)
+
     def __repr__(self) -> str:
         return f"<AutomationLog id={self.id} event={self.event_type} status={self.status}>"
@@ -0,0 +1,25 @@
+"""
+AutomationRuleOverride model – per-workspace changes to the rule registry.
+A row for a built-in rule key replaces that rule's actions for the workspace;
+a row with a new key and a trigger adds a custom rule.
+"""
+
+from sqlalchemy import Column, String, Integer, ForeignKey, JSON, UniqueConstraint
+
+from app.models.base import Base, TimestampMixin
+
+
+class AutomationRuleOverride(TimestampMixin, Base):
+    __tablename__ = "automation_rule_overrides"
+    __table_args__ = (
+        UniqueConstraint("workspace_id", "rule_key", name="uq_rule_override_workspace_key"),
+    )
+
+    workspace_id = Column(Integer, ForeignKey("workspaces.id", ondelete="CASCADE"), nullable=False, index=True)
+    rule_key = Column(String(100), nullable=False)
+    trigger = Column(String(100), nullable=True)      # required for custom rules
+    description = Column(String(500), nullable=True)
+    actions = Column(JSON, nullable=False)            # same shape as AutomationRule.actions
+
+    def __repr__(self) -> str:
+        return f"<AutomationRuleOverride ws={self.workspace_id} rule={self.rule_key}>"
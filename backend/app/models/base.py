@@ -2,6 +2,8 @@
 SQLAlchemy declarative base and common column mixin.
 """
 
+from datetime import datetime, timezone
+
 from sqlalchemy import Column, Integer, DateTime, func
 from sqlalchemy.orm import DeclarativeBase
 
@@ -25,3 +27,18 @@ class TimestampMixin:
         onupdate=func.now(),
         nullable=False,
     )
+
+
+def partition_key_column() -> Column:
+    """
+    created_at for tables range-partitioned on it: part of the primary key
+    (Postgres requires the partition key in every unique constraint) and set
+    client-side so the row's partition is known before the INSERT.
+    """
+    return Column(
+        DateTime(timezone=True),
+        primary_key=True,
+        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
+        nullable=False,
+    )
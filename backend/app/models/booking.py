@@ -2,7 +2,8 @@
 Booking model – service bookings linked to contacts and form submissions.
 """
 
-from sqlalchemy import Column, String, Integer, ForeignKey, DateTime, Enum, Text, Index
+from sqlalchemy import Column, String, Integer, ForeignKey, DateTime, Enum, Text, Index, Computed, text
+from sqlalchemy.dialects.postgresql import TSTZRANGE, ExcludeConstraint
 from sqlalchemy.orm import relationship
 
 from app.models.base import Base, TimestampMixin
@@ -12,6 +13,14 @@ class Booking(TimestampMixin, Base):
     __tablename__ = "bookings"
     __table_args__ = (
         Index("ix_workspace_booking_start", "workspace_id", "start_time"),
+        # Confirmed bookings may never overlap within a workspace (needs btree_gist)
+        ExcludeConstraint(
+            ("workspace_id", "="),
+            ("time_range", "&&"),
+            name="ex_booking_confirmed_overlap",
+            using="gist",
+            where=text("status = 'CONFIRMED'"),
+        ),
     )
 
     title = Column(String(255), nullable=False)
@@ -20,6 +29,16 @@ class Booking(TimestampMixin, Base):
     start_time = Column(DateTime(timezone=True), nullable=True)
     end_time = Column(DateTime(timezone=True), nullable=True)
     timezone = Column(String(50), default="UTC", nullable=False)
+
+    # [start_time, end_time) maintained by Postgres; NULL when either end is missing
+    time_range = Column(
+        TSTZRANGE,
+        Computed(
+            "CASE WHEN start_time IS NOT NULL AND end_time IS NOT NULL AND end_time > start_time "
+            "THEN tstzrange(start_time, end_time, '[)') END",
+            persisted=True,
+        ),
+    )
     
     status = Column(Enum(BookingStatus, name="booking_status"), nullable=False, default=BookingStatus.PENDING, index=True)
     
@@ -0,0 +1,20 @@
+"""
+CacheVersion model – shared version counters for per-process caches.
+
+VersionedLocalCache compares a counter here against the one its local copy
+was loaded under; bumping the row makes every worker reload.
+"""
+
+from sqlalchemy import Column, String, BigInteger
+
+from app.models.base import Base
+
+
+class CacheVersion(Base):
+    __tablename__ = "cache_versions"
+
+    key = Column(String(200), primary_key=True)
+    version = Column(BigInteger, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return f"<CacheVersion {self.key}={self.version}>"
@@ -2,7 +2,8 @@
 Contact model – external customers/leads/providers/vendors. Contacts do NOT authenticate.
 """
 
-from sqlalchemy import Column, String, Integer, ForeignKey, Enum, Boolean, Index
+from sqlalchemy import Column, String, Integer, ForeignKey, Enum, Boolean, Index, Computed, text
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import relationship
 
 from app.models.base import Base, TimestampMixin
@@ -14,6 +15,18 @@ class Contact(TimestampMixin, Base):
     __table_args__ = (
         Index("ix_workspace_contact_created", "workspace_id", "created_at"),
         Index("ix_workspace_email", "workspace_id", "email"),
+        Index("ix_workspace_email_lower", "workspace_id", text("lower(email)")),
+        Index("ix_workspace_phone", "workspace_id", "phone"),
+        # Search indexes (need the btree_gin and pg_trgm extensions)
+        Index("ix_contacts_search_vector", "workspace_id", "search_vector", postgresql_using="gin"),
+        Index(
+            "ix_contacts_name_trgm", "workspace_id", "name",
+            postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_contacts_phone_digits", "workspace_id", "phone_digits",
+            postgresql_ops={"phone_digits": "text_pattern_ops"},
+        ),
     )
 
     name = Column(String(255), nullable=False)
@@ -29,6 +42,20 @@ class Contact(TimestampMixin, Base):
     workspace_id = Column(Integer, ForeignKey("workspaces.id", ondelete="CASCADE"), nullable=False, index=True)
     is_deleted = Column(Boolean, default=False, nullable=False)
 
+    # Maintained by Postgres for contact search (see services/contact_search.py)
+    search_vector = Column(
+        TSVECTOR,
+        Computed(
+            "to_tsvector('simple'::regconfig, coalesce(name, '') || ' ' || coalesce(email, '') || ' ' "
+            "|| translate(coalesce(email, ''), '@._-+', '     '))",
+            persisted=True,
+        ),
+    )
+    phone_digits = Column(
+        String(50),
+        Computed("regexp_replace(coalesce(phone, ''), '[^0-9]', '', 'g')", persisted=True),
+    )
+
     # Relationships
     workspace = relationship("Workspace", back_populates="contacts")
 
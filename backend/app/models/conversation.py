@@ -3,7 +3,7 @@ Conversation model – one conversation per contact per workspace.
 All communication (manual, automated, form submissions, approvals) lives here.
 """
 
-from sqlalchemy import Column, String, Integer, ForeignKey, Boolean, Enum, DateTime, UniqueConstraint
+from sqlalchemy import Column, String, Integer, ForeignKey, Boolean, Enum, DateTime, UniqueConstraint, Index, text
 from sqlalchemy.orm import relationship
 
 from app.models.base import Base, TimestampMixin
@@ -14,6 +14,10 @@ class Conversation(TimestampMixin, Base):
     __tablename__ = "conversations"
     __table_args__ = (
         UniqueConstraint("workspace_id", "contact_id", name="uq_workspace_contact"),
+        Index(
+            "ix_conversation_workspace_last_message",
+            "workspace_id", text("last_message_at DESC NULLS LAST"), text("id DESC"),
+        ),
     )
 
     subject = Column(String(500), nullable=True)
@@ -26,6 +30,10 @@ class Conversation(TimestampMixin, Base):
     last_message_at = Column(DateTime(timezone=True), nullable=True, index=True)
     manual_override = Column(Boolean, default=False, nullable=False)
 
+    # Denormalized from messages (kept in sync by Message mapper events)
+    message_count = Column(Integer, default=0, server_default="0", nullable=False)
+    last_message_preview = Column(String(200), nullable=True)
+
     # Foreign keys
     contact_id = Column(Integer, ForeignKey("contacts.id", ondelete="CASCADE"), nullable=False, index=True)
     workspace_id = Column(Integer, ForeignKey("workspaces.id", ondelete="CASCADE"), nullable=False, index=True)
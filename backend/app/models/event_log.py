@@ -1,26 +1,30 @@
 """
 EventLog model – automation engine audit trail.
 Records every automation event for traceability.
+Range-partitioned by month on created_at (see services/log_partitions.py).
 """
 
 from sqlalchemy import Column, String, Integer, ForeignKey, JSON, Text, Index
 
-from app.models.base import Base, TimestampMixin
+from app.models.base import Base, TimestampMixin, partition_key_column
 
 
 class EventLog(TimestampMixin, Base):
     __tablename__ = "event_logs"
     __table_args__ = (
         Index("ix_eventlog_workspace_created", "workspace_id", "created_at"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
     )
 
+    created_at = partition_key_column()
+
     event_type = Column(String(100), nullable=False, index=True)
     source = Column(String(100), nullable=True)
     triggered_by = Column(String(100), nullable=True)
     status = Column(String(20), nullable=False, default="success")
     payload = Column(JSON, nullable=True)
     result = Column(Text, nullable=True)
-    workspace_id = Column(Integer, ForeignKey("workspaces.id", ondelete="CASCADE"), nullable=False, index=True)
+    workspace_id = Column(Integer, ForeignKey("workspaces.id", ondelete="CASCADE"), nullable=True, index=True)  # NULL for scheduler runs
     execution_ms = Column(Integer, nullable=True)
     action_count = Column(Integer, nullable=True, default=0)
     failed_action_count = Column(Integer, nullable=True, default=0)
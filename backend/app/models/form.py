@@ -14,6 +14,7 @@ class Form(TimestampMixin, Base):
     __tablename__ = "forms"
     __table_args__ = (
         Index("ix_form_public_slug", "public_slug", unique=True),
+        Index("ix_form_workspace_created", "workspace_id", "created_at", "id"),
     )
 
     title = Column(String(255), nullable=False)
@@ -48,6 +49,9 @@ class Form(TimestampMixin, Base):
 
 class FormSubmission(TimestampMixin, Base):
     __tablename__ = "form_submissions"
+    __table_args__ = (
+        Index("ix_submission_workspace_form_created", "workspace_id", "form_id", "created_at", "id"),
+    )
 
     form_id = Column(Integer, ForeignKey("forms.id", ondelete="CASCADE"), nullable=False, index=True)
     contact_id = Column(Integer, ForeignKey("contacts.id", ondelete="SET NULL"), nullable=True, index=True)
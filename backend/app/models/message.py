@@ -2,15 +2,20 @@
 Message model – child of Conversation.
 Each message has a sender_type, message_type, and optional structured metadata.
 Old 'direction' and 'body' columns kept temporarily for migration safety.
+Inserts, edits and deletes keep Conversation.message_count and
+Conversation.last_message_preview in sync (see mapper events below).
 """
 
-from sqlalchemy import Column, String, Integer, ForeignKey, Text, Enum as SAEnum, JSON
+from sqlalchemy import Column, String, Integer, ForeignKey, Text, Enum as SAEnum, JSON, event, update, select, func, case, and_, or_, inspect
 from sqlalchemy.orm import relationship
 import enum
 
 from app.models.base import Base, TimestampMixin
+from app.models.conversation import Conversation
 from app.utils.enums import SenderType, MessageType
 
+PREVIEW_LENGTH = 120
+
 
 # Keep old enum for migration compatibility (do not use in new code)
 class MessageDirection(str, enum.Enum):
@@ -49,3 +54,75 @@ class Message(TimestampMixin, Base):
 
     # Relationships
     conversation = relationship("Conversation", back_populates="messages")
+
+
+# ── Denormalized conversation stats ──────────────────────────────
+
+def make_preview(text: str | None) -> str:
+    """Inbox preview text: first PREVIEW_LENGTH chars, ellipsized."""
+    text = text or ""
+    return (text[:PREVIEW_LENGTH] + "…") if len(text) > PREVIEW_LENGTH else text
+
+
+def _latest_preview_sql(conversation_id: int):
+    """Correlated SQL expression for the newest message's preview."""
+    text_col = func.coalesce(Message.content, Message.body, "")
+    preview = case(
+        (func.length(text_col) > PREVIEW_LENGTH, func.concat(func.left(text_col, PREVIEW_LENGTH), "…")),
+        else_=text_col,
+    )
+    return (
+        select(preview)
+        .where(Message.conversation_id == conversation_id)
+        .order_by(Message.created_at.desc(), Message.id.desc())
+        .limit(1)
+        .scalar_subquery()
+    )
+
+
+@event.listens_for(Message, "after_insert")
+def _conversation_on_message_insert(mapper, connection, target):
+    connection.execute(
+        update(Conversation.__table__)
+        .where(Conversation.__table__.c.id == target.conversation_id)
+        .values(
+            message_count=Conversation.__table__.c.message_count + 1,
+            last_message_preview=make_preview(target.content or target.body),
+        )
+    )
+
+
+@event.listens_for(Message, "after_update")
+def _conversation_on_message_edit(mapper, connection, target):
+    state = inspect(target)
+    if not (state.attrs.content.history.has_changes() or state.attrs.body.history.has_changes()):
+        return
+    # Only the newest message feeds the preview
+    newer = (
+        select(Message.id)
+        .where(
+            Message.conversation_id == target.conversation_id,
+            or_(
+                Message.created_at > target.created_at,
+                and_(Message.created_at == target.created_at, Message.id > target.id),
+            ),
+        )
+        .exists()
+    )
+    connection.execute(
+        update(Conversation.__table__)
+        .where(Conversation.__table__.c.id == target.conversation_id, ~newer)
+        .values(last_message_preview=make_preview(target.content or target.body))
+    )
+
+
+@event.listens_for(Message, "after_delete")
+def _conversation_on_message_delete(mapper, connection, target):
+    connection.execute(
+        update(Conversation.__table__)
+        .where(Conversation.__table__.c.id == target.conversation_id)
+        .values(
+            message_count=func.greatest(Conversation.__table__.c.message_count - 1, 0),
+            last_message_preview=_latest_preview_sql(target.conversation_id),
+        )
+    )
@@ -2,7 +2,7 @@
 Workspace model – every record in the system belongs to a workspace.
 """
 
-from sqlalchemy import Column, String, Enum
+from sqlalchemy import Column, String, Integer, Enum
 from sqlalchemy.orm import relationship
 
 from app.models.base import Base, TimestampMixin
@@ -19,6 +19,7 @@ class Workspace(TimestampMixin, Base):
         default=WorkspaceStatus.SETUP,
         nullable=False,
     )
+    log_retention_days = Column(Integer, nullable=True)  # NULL → LOG_RETENTION_DAYS
 
     # Relationships — cascade delete all children
     users = relationship("User", back_populates="workspace", cascade="all, delete-orphan", lazy="dynamic")
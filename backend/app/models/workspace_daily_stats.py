@@ -0,0 +1,33 @@
+"""
+WorkspaceDailyStats model – per-workspace, per-day KPI rollup.
+Maintained incrementally by services/stats_rollup.py and rebuildable from
+the raw tables, so dashboard trends read a handful of small rows.
+"""
+
+from sqlalchemy import Column, Integer, ForeignKey, Date, DateTime, func
+
+from app.models.base import Base
+
+
+class WorkspaceDailyStats(Base):
+    __tablename__ = "workspace_daily_stats"
+
+    workspace_id = Column(Integer, ForeignKey("workspaces.id", ondelete="CASCADE"), primary_key=True)
+    day = Column(Date, primary_key=True)  # UTC day the entity was created
+
+    new_contacts = Column(Integer, nullable=False, default=0, server_default="0")
+
+    # Bookings bucketed by creation day, split by their *current* status
+    bookings_created = Column(Integer, nullable=False, default=0, server_default="0")
+    bookings_pending = Column(Integer, nullable=False, default=0, server_default="0")
+    bookings_confirmed = Column(Integer, nullable=False, default=0, server_default="0")
+    bookings_completed = Column(Integer, nullable=False, default=0, server_default="0")
+    bookings_cancelled = Column(Integer, nullable=False, default=0, server_default="0")
+
+    submissions = Column(Integer, nullable=False, default=0, server_default="0")
+    alerts = Column(Integer, nullable=False, default=0, server_default="0")
+
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<WorkspaceDailyStats ws={self.workspace_id} day={self.day}>"
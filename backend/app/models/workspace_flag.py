@@ -0,0 +1,21 @@
+"""
+WorkspaceFlag model – persisted per-workspace automation rule toggles and
+feature flags. Missing rows mean "enabled" (the default).
+"""
+
+from sqlalchemy import Column, String, Integer, ForeignKey, Boolean, DateTime, func
+
+from app.models.base import Base
+
+
+class WorkspaceFlag(Base):
+    __tablename__ = "workspace_flags"
+
+    workspace_id = Column(Integer, ForeignKey("workspaces.id", ondelete="CASCADE"), primary_key=True)
+    kind = Column(String(20), primary_key=True)   # "rule" | "feature"
+    key = Column(String(100), primary_key=True)
+    enabled = Column(Boolean, nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<WorkspaceFlag ws={self.workspace_id} {self.kind}:{self.key}={self.enabled}>"
@@ -41,3 +41,12 @@ class ContactResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class ContactTypeahead(BaseModel):
+    id: int
+    name: str
+    email: Optional[str]
+
+    class Config:
+        from_attributes = True
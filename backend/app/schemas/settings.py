@@ -20,3 +20,4 @@ class EmailVerifyRequest(BaseModel):
 class WorkspaceUpdate(BaseModel):
     name: Optional[str] = Field(None, min_length=1, max_length=255)
     logo_url: Optional[str] = None
+    log_retention_days: Optional[int] = Field(None, ge=1, le=3650)
@@ -5,9 +5,16 @@ All wrapped in try/except – never blocks the request.
 """
 
 import logging
+from typing import NamedTuple
+
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
+from app.core.realtime_topics import ALERT_CREATED, publish_after_commit
 from app.models.alert import Alert
+from app.models.inventory import InventoryItem
+from app.services.dashboard_cache import mark_workspace_dirty
+from app.services.stats_rollup import record_alert
 from app.utils.enums import AlertSeverity
 
 logger = logging.getLogger(__name__)
@@ -30,6 +37,10 @@ def create_alert(
         )
         db.add(alert)
         db.flush()
+        record_alert(db, workspace_id)
+        publish_after_commit(db, workspace_id, ALERT_CREATED, {
+            "alert_id": alert.id, "title": title, "severity": severity,
+        })
         logger.info(f"🔔 Alert created: [{severity.value}] {title} (workspace={workspace_id})")
         return alert
     except Exception as exc:
@@ -57,3 +68,118 @@ def dismiss_alert(
     except Exception as exc:
         logger.error(f"Failed to dismiss alert: {exc}")
         return False
+
+
+
+# ── Inventory sync ───────────────────────────────────────────────
+
+LOW_STOCK_PREFIX = "Low Stock: "
+
+
+class InventorySyncPlan(NamedTuple):
+    """Changes that bring unread low-stock alerts in line with inventory."""
+    create: list[dict]      # Alert column values to insert
+    dismiss: list[int]      # alert ids whose item is no longer low
+    delete: list[int]       # older duplicate alert ids
+    unchanged: int          # low items that already have exactly one alert
+
+
+def plan_inventory_sync(items: list, alerts: list) -> InventorySyncPlan:
+    """
+    Diff thresholded items against unread "Low Stock:" alerts.
+    `items` rows carry name/quantity/unit/low_stock_threshold; `alerts` rows
+    carry id/title and must be ordered newest first.
+    """
+    low: dict[str, object] = {}
+    cleared: set[str] = set()
+    for item in items:
+        title = f"{LOW_STOCK_PREFIX}{item.name}"
+        if item.quantity <= item.low_stock_threshold:
+            low.setdefault(title, item)
+        else:
+            cleared.add(title)
+    cleared -= low.keys()  # an item sharing its name with a low one keeps the alert
+
+    by_title: dict[str, list[int]] = {}
+    for alert in alerts:
+        by_title.setdefault(alert.title, []).append(alert.id)
+
+    create, dismiss, delete, unchanged = [], [], [], 0
+    for title, item in low.items():
+        ids = by_title.get(title)
+        if not ids:
+            create.append({
+                "title": title,
+                "message": (
+                    f"{item.name} is down to {item.quantity} "
+                    f"{item.unit or 'units'} (threshold: {item.low_stock_threshold})."
+                ),
+                "severity": AlertSeverity.WARNING,
+            })
+        else:
+            unchanged += 1
+            delete.extend(ids[1:])  # keep the newest
+    for title in cleared:
+        dismiss.extend(by_title.get(title, ()))
+    return InventorySyncPlan(create, dismiss, delete, unchanged)
+
+
+def sync_workspace_inventory_alerts(db: Session, workspace_id: int) -> dict:
+    """
+    Sync low-stock alerts with current inventory levels (caller commits):
+    create one alert per low item without one, dismiss alerts for items back
+    above threshold and delete older duplicates. Two reads and at most three
+    bulk writes regardless of catalogue size; new alerts are pushed as
+    ALERT_CREATED once the caller commits. Returns the diff counts.
+    """
+    items = (
+        db.query(
+            InventoryItem.name,
+            InventoryItem.quantity,
+            InventoryItem.unit,
+            InventoryItem.low_stock_threshold,
+        )
+        .filter(
+            InventoryItem.workspace_id == workspace_id,
+            InventoryItem.is_deleted == False,
+            InventoryItem.low_stock_threshold.isnot(None),
+        )
+        .all()
+    )
+    alerts = (
+        db.query(Alert.id, Alert.title)
+        .filter(
+            Alert.workspace_id == workspace_id,
+            Alert.is_read == False,
+            Alert.title.startswith(LOW_STOCK_PREFIX, autoescape=True),
+        )
+        .order_by(Alert.created_at.desc(), Alert.id.desc())
+        .all()
+    )
+    plan = plan_inventory_sync(items, alerts)
+
+    if plan.create:
+        created = db.execute(
+            insert(Alert).returning(Alert.id, Alert.title, Alert.severity),
+            [{**values, "workspace_id": workspace_id} for values in plan.create],
+        ).all()
+        record_alert(db, workspace_id, count=len(plan.create))
+        for alert_id, title, severity in created:
+            publish_after_commit(db, workspace_id, ALERT_CREATED, {
+                "alert_id": alert_id, "title": title, "severity": severity,
+            })
+    if plan.dismiss:
+        db.query(Alert).filter(Alert.id.in_(plan.dismiss)).update({"is_read": True}, synchronize_session=False)
+    if plan.delete:
+        db.query(Alert).filter(Alert.id.in_(plan.delete)).delete(synchronize_session=False)
+
+    diff = {
+        "created": len(plan.create),
+        "dismissed": len(plan.dismiss),
+        "deduplicated": len(plan.delete),
+        "unchanged": plan.unchanged,
+    }
+    if plan.create or plan.dismiss or plan.delete:
+        mark_workspace_dirty(db, workspace_id)  # bulk statements bypass the flush hook
+        logger.info(f"[ALERTS] Inventory sync for workspace {workspace_id}: {diff}")
+    return diff
@@ -1,42 +1,44 @@
+import asyncio
 import logging
 import time
 from datetime import datetime, timezone
 from sqlalchemy.orm import Session
-from sqlalchemy import text
 
 from app.models.event_log import EventLog
 from app.models.alert import Alert
 from app.models.conversation import Conversation
 from app.models.message import Message, MessageDirection
 from app.models.contact import Contact
+from app.models.user import User
 from app.utils.enums import AlertSeverity, ConversationChannel
-from app.services.automation_registry import get_rule_by_trigger, AUTOMATION_RULES
+from app.services.automation_registry import registry
+from app.services.stats_rollup import record_alert
+from app.services.automation_idempotency import claim_key, release_key
+from app.services.workspace_flags import is_rule_enabled, is_feature_enabled
+from app.core.config import settings
+from app.core.realtime_topics import ALERT_CREATED, INBOX_MESSAGE_CREATED, publish_after_commit
 
 logger = logging.getLogger(__name__)
 
-# ── Action Definitions (Internal) ────────────────────────────────
-# Which actions to take for each rule key
-RULE_ACTIONS = {
-    "booking_confirmation": [
-        {"type": "send_email", "template": "booking_confirmation"},
-        {"type": "create_conversation", "channel": "system", "subject": "Booking Confirmed"},
-    ],
-    "new_contact_welcome": [
-        {"type": "send_email", "template": "welcome_email", "subject": "Welcome!"},
-    ],
-    "booking_cancellation": [
-        {"type": "send_email", "template": "booking_cancelled"},
-        {"type": "create_conversation", "channel": "system", "subject": "Booking Cancelled"},
-    ],
-    "form_notification": [
-        {"type": "send_email", "template": "form_notification"},
-        {"type": "create_conversation", "channel": "form", "subject": "New Form Submission"},
-    ],
-    "inventory_low_alert": [
-        {"type": "create_alert", "severity": "warning"},
-        {"type": "send_sms", "template": "low_stock_alert"},
-    ],
-}
+# Actions that only talk to external providers. They run concurrently (with a
+# per-action timeout); every other action mutates the session and runs in order.
+IO_ACTIONS = frozenset({"send_email", "send_sms"})
+
+# Persisted per-workspace toggles decide which compiled rules run
+registry.set_enabled_check(is_rule_enabled)
+
+
+def _action_feature(action_def: dict) -> str | None:
+    """The workspace feature flag that gates an action, if any."""
+    action_type = action_def["type"]
+    to_staff = action_def.get("recipients") == "staff"
+    if action_type == "send_email" and not to_staff:
+        return "customer_emails"
+    if action_type == "send_sms" and to_staff:
+        return "staff_sms_alerts"
+    if action_type == "create_conversation":
+        return "auto_thread_creation"
+    return None
 
 
 # ── Core Engine ──────────────────────────────────────────────────
@@ -49,32 +51,57 @@ async def fire_event(
 ) -> None:
     """
     Fire an automation event.
+
+    Runs in three phases so no transaction (and no row lock taken by a DB
+    action) is held while a provider send is awaited. The DB phases are
+    blocking session work and run in a worker thread, keeping the event
+    loop free for other sends:
+
+    1. claim idempotency keys and run each rule's DB actions in declaration
+       order, then commit;
+    2. run the IO actions of all matching rules concurrently, each under its
+       timeout;
+    3. release the keys of failed runs and write the execution logs in one
+       short transaction.
     """
-    rules = get_rule_by_trigger(event_type)
+    plans = await asyncio.to_thread(_run_db_phase, event_type, workspace_id, payload, db)
+    if not plans:
+        return
+
+    tasks = [
+        [asyncio.ensure_future(_run_io_timed(action_def, payload, recipients)) for action_def, recipients in plan["io"]]
+        for plan in plans
+    ]
+    await asyncio.gather(*(task for rule_tasks in tasks for task in rule_tasks))
+    for plan, rule_tasks in zip(plans, tasks):
+        plan["io_results"] = [task.result() for task in rule_tasks]
+
+    await asyncio.to_thread(_write_logs, plans, workspace_id, payload, db)
+
+
+def _run_db_phase(event_type: str, workspace_id: int, payload: dict, db: Session) -> list[dict]:
+    """Phase 1: claims, override checks and DB actions, committed together."""
+    rules = registry.rules_for(event_type, workspace_id, db)
     if not rules:
         logger.debug(f"No automation rules for event: {event_type}")
-        return
+        return []
 
-    for rule in rules:
-        rule_key = rule.key
+    plans = []
+    for compiled in rules:
+        # Toggled-off rules skip everything, including the queries below
+        if not compiled.is_enabled(workspace_id):
+            continue
+        rule_key = compiled.rule.key
         
         # 1. Idempotency Check
-        # Prevent running same rule for same entity (e.g. booking_id) multiple times?
-        # Use a deterministic key from payload.
+        # Run each rule once per entity (e.g. booking_id). The key is committed
+        # with the DB actions and released again if the run fails.
         entity_id = payload.get("booking_id") or payload.get("form_submission_id") or payload.get("inventory_id") or payload.get("contact_id")
         unique_key = f"{rule_key}:{entity_id}" if entity_id else None
         
-        if unique_key:
-            exists = db.query(EventLog).filter(
-                EventLog.workspace_id == workspace_id,
-                EventLog.event_type == "automation_executed",
-                EventLog.status == "success",
-                text("payload ->> 'unique_key' = :ukey")
-            ).params(ukey=unique_key).first()
-            
-            if exists:
-                logger.info(f"Skipping duplicate automation: {unique_key}")
-                continue
+        if unique_key and not claim_key(db, workspace_id, unique_key, rule_key):
+            logger.info(f"Skipping duplicate automation: {unique_key}")
+            continue
 
         # 2. Manual Override Check
         # If this is a conversation/message action, check if staff already replied manually
@@ -91,89 +118,134 @@ async def fire_event(
              
              if override:
                  logger.info(f"Skipping automation due to manual override for contact {contact_id}")
+                 if unique_key:
+                     release_key(db, workspace_id, unique_key)
                  # Log the skip?
                  _log_event(db, workspace_id, "automation_skipped", rule_key, "Manual override active", payload)
                  continue
 
-        # 3. Execution
-        actions = RULE_ACTIONS.get(rule_key, [])
-        all_success = True
-        errors = []
-        total_actions = len(actions)
-        failed_actions = 0
-        
-        exec_start = time.time()
-        
+        # 3. Execution: DB actions now, in order; IO actions (with their
+        # recipients resolved here) wait for phase 2
+        actions = [
+            a for a in compiled.actions
+            if (feature := _action_feature(a)) is None or is_feature_enabled(workspace_id, feature)
+        ]
+        plan = {"rule_key": rule_key, "unique_key": unique_key, "total": len(actions), "db_ms": 0, "db_errors": [], "io": []}
         for action_def in actions:
-            try:
-                await _execute_action(action_def, payload, workspace_id, db)
-            except Exception as exc:
-                all_success = False
-                failed_actions += 1
-                errors.append(str(exc))
-                logger.error(f"Action failed {action_def['type']}: {exc}")
+            if action_def["type"] in IO_ACTIONS:
+                plan["io"].append((action_def, _io_recipients(action_def, workspace_id, db)))
+            else:
+                elapsed_ms, error = _run_db_timed(action_def, payload, workspace_id, db)
+                plan["db_ms"] += elapsed_ms
+                if error:
+                    plan["db_errors"].append(error)
+        plans.append(plan)
+
+    try:
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return plans
 
-        exec_ms = int((time.time() - exec_start) * 1000)
+
+def _write_logs(plans: list[dict], workspace_id: int, payload: dict, db: Session) -> None:
+    """Phase 3: release failed claims and record each rule's outcome."""
+    for plan in plans:
+        io_results = plan["io_results"]
+        errors = plan["db_errors"] + [error for _, error in io_results if error]
+        all_success = not errors
+        # Critical path: sequential DB actions, then the slowest concurrent send
+        exec_ms = plan["db_ms"] + max((ms for ms, _ in io_results), default=0)
 
         # 4. Logging
         status_res = "success" if all_success else "error"
         result_text = "All actions executed" if all_success else f"Errors: {'; '.join(errors)}"
         
-        # Add unique_key to payload for future dedup
         log_payload = payload.copy()
-        if unique_key:
-            log_payload["unique_key"] = unique_key
+        if plan["unique_key"]:
+            log_payload["unique_key"] = plan["unique_key"]
+            if not all_success:
+                # Leave failed runs retryable
+                release_key(db, workspace_id, plan["unique_key"])
             
         _log_event(
             db, workspace_id,
             f"automation_{'executed' if all_success else 'failed'}",
-            rule_key, result_text, log_payload,
+            plan["rule_key"], result_text, log_payload,
             status=status_res,
             execution_ms=exec_ms,
-            action_count=total_actions,
-            failed_action_count=failed_actions,
+            action_count=plan["total"],
+            failed_action_count=len(errors),
         )
 
+    try:
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Log failure: {e}")
+
+
+def _run_db_timed(action_def: dict, payload: dict, workspace_id: int, db: Session) -> tuple[int, str | None]:
+    """
+    Run one DB action in a savepoint, so a failure undoes only that action.
+    Returns (elapsed_ms, error or None); never raises.
+    """
+    start = time.perf_counter()
+    try:
+        with db.begin_nested():
+            _execute_db_action(action_def, payload, workspace_id, db)
+        error = None
+    except Exception as exc:
+        error = str(exc)
+    if error:
+        logger.error(f"Action failed {action_def['type']}: {error}")
+    return int((time.perf_counter() - start) * 1000), error
+
+
+async def _run_io_timed(action_def: dict, payload: dict, recipients: list[str] | None) -> tuple[int, str | None]:
+    """
+    Run one IO action under its timeout.
+    Returns (elapsed_ms, error or None); never raises.
+    """
+    timeout = action_def.get("timeout", settings.AUTOMATION_ACTION_TIMEOUT)
+    start = time.perf_counter()
+    try:
+        await asyncio.wait_for(_execute_io_action(action_def, payload, recipients), timeout)
+        error = None
+    except asyncio.TimeoutError:
+        error = f"{action_def['type']} timed out after {timeout}s"
+    except Exception as exc:
+        error = str(exc)
+    if error:
+        logger.error(f"Action failed {action_def['type']}: {error}")
+    return int((time.perf_counter() - start) * 1000), error
+
 
 def _log_event(
     db: Session, workspace_id: int, event_type: str, rule_key: str,
     result: str, payload: dict, status: str = "info",
     execution_ms: int = None, action_count: int = 0, failed_action_count: int = 0,
 ):
-    try:
-        log = EventLog(
-            event_type=event_type,
-            source=f"automation.{rule_key}",
-            status=status,
-            payload=payload,
-            result=result,
-            workspace_id=workspace_id,
-            metadata={"rule": rule_key},
-            execution_ms=execution_ms,
-            action_count=action_count,
-            failed_action_count=failed_action_count,
-        )
-        db.add(log)
-        db.commit()
-    except Exception as e:
-        logger.error(f"Log failure: {e}")
+    """Add an execution log row; committed by the surrounding phase."""
+    db.add(EventLog(
+        event_type=event_type,
+        source=f"automation.{rule_key}",
+        status=status,
+        payload=payload,
+        result=result,
+        workspace_id=workspace_id,
+        metadata={"rule": rule_key},
+        execution_ms=execution_ms,
+        action_count=action_count,
+        failed_action_count=failed_action_count,
+    ))
 
 
-async def _execute_action(
-    action_def: dict,
-    payload: dict,
-    workspace_id: int,
-    db: Session,
-) -> str:
+def _execute_db_action(action_def: dict, payload: dict, workspace_id: int, db: Session) -> str:
     action_type = action_def["type"]
 
-    if action_type == "send_email":
-        return await _action_send_email(action_def, payload)
-
-    elif action_type == "send_sms":
-        return await _action_send_sms(action_def, payload)
-
-    elif action_type == "create_alert":
+    if action_type == "create_alert":
         return _action_create_alert(action_def, payload, workspace_id, db)
 
     elif action_type == "create_conversation":
@@ -183,24 +255,80 @@ async def _execute_action(
         raise ValueError(f"Unknown action type: {action_type}")
 
 
+async def _execute_io_action(action_def: dict, payload: dict, recipients: list[str] | None) -> str:
+    action_type = action_def["type"]
+
+    if action_type == "send_email":
+        return await _action_send_email(action_def, payload, recipients)
+
+    elif action_type == "send_sms":
+        return await _action_send_sms(action_def, payload, recipients)
+
+    else:
+        raise ValueError(f"Unknown action type: {action_type}")
+
+
+def _io_recipients(action_def: dict, workspace_id: int, db: Session) -> list[str] | None:
+    """Staff addresses for a staff-facing send (looked up in phase 1), else None."""
+    if action_def.get("recipients") != "staff":
+        return None
+    column = User.email if action_def["type"] == "send_email" else User.phone
+    return _staff_recipients(db, workspace_id, column)
+
+
 # ── Action Handlers ──────────────────────────────────────────────
 
-async def _action_send_email(action_def: dict, payload: dict) -> str:
+def _staff_recipients(db: Session, workspace_id: int, column) -> list[str]:
+    """Distinct non-empty email/phone values of the workspace's active users."""
+    rows = db.query(column).filter(
+        User.workspace_id == workspace_id,
+        User.is_active == True,
+        User.is_deleted == False,
+        column.isnot(None),
+        column != "",
+    ).distinct().all()
+    return [r[0] for r in rows]
+
+
+def _check_batch(results, channel: str) -> str:
+    """Raise if any recipient in a fan-out failed."""
+    failed = [r for r in results if not r.success]
+    if failed:
+        raise Exception(
+            f"{channel} failed for {len(failed)}/{len(results)} recipients: "
+            + ", ".join(f"{r.to} ({r.error})" for r in failed)
+        )
+    return f"{channel} sent to {len(results)} recipients"
+
+
+async def _action_send_email(action_def: dict, payload: dict, recipients: list[str] | None) -> str:
     from app.services.email_service import get_email_provider
+    from app.services.interfaces.email_provider import OutgoingEmail
     provider = get_email_provider()
-    to = payload.get("contact_email", payload.get("email", ""))
     subject = payload.get("subject", "Notification")
     body = payload.get("body", "Message")
+    if recipients is not None:
+        if not recipients:
+            return "Skipped: no staff email addresses"
+        results = await provider.send_batch([OutgoingEmail(to, subject, body) for to in recipients])
+        return _check_batch(results, "Email")
+    to = payload.get("contact_email", payload.get("email", ""))
     success = await provider.send(to=to, subject=subject, body=body)
     if not success:
         raise Exception("Email provider failed")
     return "Email sent"
 
-async def _action_send_sms(action_def: dict, payload: dict) -> str:
+async def _action_send_sms(action_def: dict, payload: dict, recipients: list[str] | None) -> str:
     from app.services.sms_service import get_sms_provider
+    from app.services.interfaces.sms_provider import OutgoingSMS
     provider = get_sms_provider()
-    to = payload.get("contact_phone", payload.get("phone", ""))
     msg = payload.get("message", payload.get("body", ""))
+    if recipients is not None:
+        if not recipients:
+            return "Skipped: no staff phone numbers"
+        results = await provider.send_batch([OutgoingSMS(to, msg) for to in recipients])
+        return _check_batch(results, "SMS")
+    to = payload.get("contact_phone", payload.get("phone", ""))
     success = await provider.send(to=to, message=msg)
     if not success:
         raise Exception("SMS provider failed")
@@ -215,10 +343,14 @@ def _action_create_alert(action_def: dict, payload: dict, workspace_id: int, db:
         workspace_id=workspace_id,
     )
     db.add(alert)
+    record_alert(db, workspace_id)
     db.flush() # Alert execution part of larger transaction? No, db passed is session.
     # We should commit if we want it persisted immediately, or let caller handle.
     # fire_event logs separately. actions might share transaction?
     # db passed from caller (router) is usually a session.
+    publish_after_commit(db, workspace_id, ALERT_CREATED, {
+        "alert_id": alert.id, "title": alert.title, "severity": severity,
+    })
     return f"Alert {alert.title} created"
 
 def _action_create_conversation(action_def: dict, payload: dict, workspace_id: int, db: Session) -> str:
@@ -260,4 +392,8 @@ def _action_create_conversation(action_def: dict, payload: dict, workspace_id: i
     db.add(msg)
     conv.last_message_at = now
     conv.is_read = False
+    db.flush()
+    publish_after_commit(db, workspace_id, INBOX_MESSAGE_CREATED, {
+        "conversation_id": conv.id, "message_id": msg.id,
+    })
     return "Conversation message added"
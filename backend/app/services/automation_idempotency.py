@@ -0,0 +1,68 @@
+"""
+Automation Idempotency – claim-once keys for automation rules.
+
+fire_event() claims "<rule_key>:<entity_id>" with INSERT ... ON CONFLICT DO
+NOTHING in the same transaction as the rule's DB actions.
+A concurrent worker claiming the same key blocks on the uncommitted row and
+then sees the conflict, so a rule runs at most once per entity even across
+processes. Failed runs release their claim so a later event can retry.
+"""
+
+import logging
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import select, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.automation_idempotency import AutomationIdempotency
+
+logger = logging.getLogger(__name__)
+
+
+def claim_key(db: Session, workspace_id: int, unique_key: str, rule_key: str) -> bool:
+    """Insert the key in the caller's transaction. False if it already exists."""
+    now = datetime.now(timezone.utc)
+    stmt = (
+        pg_insert(AutomationIdempotency)
+        .values(
+            workspace_id=workspace_id,
+            unique_key=unique_key,
+            rule_key=rule_key,
+            created_at=now,
+            expires_at=now + timedelta(days=settings.AUTOMATION_IDEMPOTENCY_TTL_DAYS),
+        )
+        .on_conflict_do_nothing(index_elements=["workspace_id", "unique_key"])
+        .returning(AutomationIdempotency.unique_key)
+    )
+    return db.execute(stmt).first() is not None
+
+
+def release_key(db: Session, workspace_id: int, unique_key: str) -> None:
+    """Drop a claim (in the caller's transaction) so the rule may run again."""
+    db.query(AutomationIdempotency).filter(
+        AutomationIdempotency.workspace_id == workspace_id,
+        AutomationIdempotency.unique_key == unique_key,
+    ).delete(synchronize_session=False)
+
+
+def sweep_expired_keys(db: Session, batch_size: int = 5000) -> int:
+    """Delete expired keys in batches, committing each. Returns rows deleted."""
+    total = 0
+    while True:
+        expired = (
+            select(AutomationIdempotency.workspace_id, AutomationIdempotency.unique_key)
+            .where(AutomationIdempotency.expires_at < datetime.now(timezone.utc))
+            .limit(batch_size)
+        )
+        deleted = db.query(AutomationIdempotency).filter(
+            tuple_(AutomationIdempotency.workspace_id, AutomationIdempotency.unique_key).in_(expired)
+        ).delete(synchronize_session=False)
+        db.commit()
+        total += deleted
+        if deleted < batch_size:
+            break
+    if total:
+        logger.info(f"[IDEMPOTENCY] Swept {total} expired keys")
+    return total
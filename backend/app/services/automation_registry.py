@@ -1,13 +1,39 @@
 """
 Automation Rules Registry.
-Central definition of all business automation rules for visibility and documentation.
+Central definition of all business automation rules and their actions.
+
+The rules are compiled once into a trigger → rules dispatch table, so
+fire_event() looks up its rules in constant time no matter how many exist.
+Workspaces may override a built-in rule's actions or add custom rules
+(automation_rule_overrides); each workspace's merged table is compiled on
+first use and cached per process, stamped with a shared version that
+invalidate_workspace() bumps, so edits hot-reload in every worker.
 """
 
+import logging
+import threading
+from typing import Callable
+
+from sqlalchemy.orm import Session
+
+from app.core.cache import VersionedLocalCache, get_version_backend
+from app.models.automation_rule_override import AutomationRuleOverride
+
+logger = logging.getLogger(__name__)
+
+# Action types fire_event knows how to execute
+ACTION_TYPES = frozenset({"send_email", "send_sms", "create_alert", "create_conversation"})
+
+
 class AutomationRule:
-    def __init__(self, key: str, trigger: str, description: str):
+    __slots__ = ("key", "trigger", "description", "actions", "custom")
+
+    def __init__(self, key: str, trigger: str, description: str, actions: list[dict] | None = None, custom: bool = False):
         self.key = key
         self.trigger = trigger
         self.description = description
+        self.actions = tuple(actions or ())
+        self.custom = custom
 
     def dict(self):
         return {
@@ -17,35 +43,163 @@ class AutomationRule:
         }
 
 
+class CompiledRule:
+    """Dispatch-table entry: the rule, its effective actions and enabled check."""
+    __slots__ = ("rule", "actions", "_enabled")
+
+    def __init__(self, rule: AutomationRule, actions: tuple, enabled: Callable[[int, str], bool]):
+        self.rule = rule
+        self.actions = actions
+        self._enabled = enabled
+
+    def is_enabled(self, workspace_id: int) -> bool:
+        return self._enabled(workspace_id, self.rule.key)
+
+
 # Define all system automations here
 AUTOMATION_RULES = [
     AutomationRule(
         key="booking_confirmation",
         trigger="booking.confirmed",
         description="Send confirmation email and system notification when booking is confirmed",
+        actions=[
+            {"type": "send_email", "template": "booking_confirmation"},
+            {"type": "create_conversation", "channel": "system", "subject": "Booking Confirmed"},
+        ],
     ),
     AutomationRule(
         key="new_contact_welcome",
         trigger="contact.created",
         description="Send welcome email to new contact",
+        actions=[
+            {"type": "send_email", "template": "welcome_email", "subject": "Welcome!"},
+        ],
     ),
     AutomationRule(
         key="booking_cancellation",
         trigger="booking.cancelled",
         description="Send cancellation email and update thread when booking is cancelled",
+        actions=[
+            {"type": "send_email", "template": "booking_cancelled"},
+            {"type": "create_conversation", "channel": "system", "subject": "Booking Cancelled"},
+        ],
     ),
     AutomationRule(
         key="form_notification",
         trigger="form.submitted",
         description="Notify staff of new form submission via email and inbox",
+        actions=[
+            {"type": "send_email", "template": "form_notification"},
+            {"type": "create_conversation", "channel": "form", "subject": "New Form Submission"},
+        ],
     ),
     AutomationRule(
         key="inventory_low_alert",
         trigger="inventory.low_stock",
         description="Create critical alert and notify staff when stock falls below threshold",
+        actions=[
+            {"type": "create_alert", "severity": "warning"},
+            {"type": "send_sms", "template": "low_stock_alert", "recipients": "staff"},
+        ],
     ),
 ]
 
+
+def _always_enabled(workspace_id: int, rule_key: str) -> bool:
+    return True
+
+
+def validate_actions(actions: list[dict]) -> None:
+    """Raise ValueError unless every action has a known type."""
+    for action in actions:
+        if not isinstance(action, dict) or action.get("type") not in ACTION_TYPES:
+            raise ValueError(f"Invalid action {action!r}; type must be one of {sorted(ACTION_TYPES)}")
+
+
+class RuleRegistry:
+    """Compiled trigger index over the built-in rules plus workspace overrides."""
+
+    def __init__(self, rules: list[AutomationRule]):
+        self._lock = threading.Lock()
+        self._enabled_check: Callable[[int, str], bool] = _always_enabled
+        # Shared version source, so an override saved on one worker reaches all
+        self._workspace_tables = VersionedLocalCache("automation:rules", backend=get_version_backend())
+        self.version = 0
+        self.reload(rules)
+
+    # ── Compilation ──────────────────────────────────────────────
+
+    def _compile(self, rules) -> dict[str, tuple[CompiledRule, ...]]:
+        index: dict[str, list[CompiledRule]] = {}
+        for rule, actions in rules:
+            index.setdefault(rule.trigger, []).append(CompiledRule(rule, actions, self._enabled_check))
+        return {trigger: tuple(entries) for trigger, entries in index.items()}
+
+    def reload(self, rules: list[AutomationRule] | None = None) -> None:
+        """Recompile the built-in table (and, lazily, every workspace table)."""
+        with self._lock:
+            if rules is not None:
+                self._rules = list(rules)
+            self._by_key = {r.key: r for r in self._rules}
+            self._index = self._compile((r, r.actions) for r in self._rules)
+            self.version += 1
+        logger.info(f"[AUTOMATION] Compiled {len(self._rules)} rules over {len(self._index)} triggers (v{self.version})")
+
+    def set_enabled_check(self, check: Callable[[int, str], bool]) -> None:
+        """Install the per-workspace toggle check used by compiled entries."""
+        self._enabled_check = check
+        self.reload()
+
+    def _workspace_table(self, db: Session, workspace_id: int) -> tuple[int, dict]:
+        overrides = db.query(AutomationRuleOverride).filter(
+            AutomationRuleOverride.workspace_id == workspace_id
+        ).all()
+        if not overrides:
+            return self.version, None  # use the shared table
+        by_key = {o.rule_key: o for o in overrides}
+        merged = []
+        for rule in self._rules:
+            override = by_key.pop(rule.key, None)
+            merged.append((rule, tuple(override.actions) if override else rule.actions))
+        for o in by_key.values():
+            if o.trigger:
+                custom = AutomationRule(o.rule_key, o.trigger, o.description or "", o.actions, custom=True)
+                merged.append((custom, custom.actions))
+        return self.version, self._compile(merged)
+
+    def _table_for(self, workspace_id: int | None, db: Session | None) -> dict:
+        if workspace_id is None or db is None:
+            return self._index
+        version, table = self._workspace_tables.get(workspace_id, lambda: self._workspace_table(db, workspace_id))
+        if version != self.version:
+            # Built-in rules were reloaded in this process since it was compiled
+            self._workspace_tables.discard(workspace_id)
+            version, table = self._workspace_tables.get(workspace_id, lambda: self._workspace_table(db, workspace_id))
+        return self._index if table is None else table
+
+    # ── Lookups ──────────────────────────────────────────────────
+
+    def rules_for(self, trigger: str, workspace_id: int | None = None, db: Session | None = None) -> tuple[CompiledRule, ...]:
+        """Compiled rules listening to `trigger` (with the workspace's overrides)."""
+        return self._table_for(workspace_id, db).get(trigger, ())
+
+    def all_rules(self, workspace_id: int | None = None, db: Session | None = None) -> list[CompiledRule]:
+        """Every compiled rule (with the workspace's overrides)."""
+        return [entry for entries in self._table_for(workspace_id, db).values() for entry in entries]
+
+    def get(self, rule_key: str) -> AutomationRule | None:
+        """Built-in rule by key."""
+        return self._by_key.get(rule_key)
+
+    def invalidate_workspace(self, workspace_id: int) -> None:
+        """Call after committing an override change; every process recompiles."""
+        self._workspace_tables.bump(workspace_id)
+
+
+# ── Singleton instance ────────────────────────────────────────────
+registry = RuleRegistry(AUTOMATION_RULES)
+
+
 def get_rule_by_trigger(trigger: str) -> list[AutomationRule]:
-    """Return all rules listening to a specific trigger."""
-    return [r for r in AUTOMATION_RULES if r.trigger == trigger]
+    """Return all built-in rules listening to a specific trigger."""
+    return [entry.rule for entry in registry.rules_for(trigger)]
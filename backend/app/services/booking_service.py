@@ -4,6 +4,7 @@ from datetime import datetime, timezone, timedelta
 from sqlalchemy.orm import Session
 from fastapi import HTTPException
 
+from app.core.realtime_topics import BOOKING_STATUS_CHANGED, publish_after_commit
 from app.models.booking import Booking
 from app.models.form import Form, FormSubmission
 from app.models.form_field import FormField
@@ -11,6 +12,7 @@ from app.models.contact import Contact
 from app.models.message import Message
 from app.utils.enums import BookingStatus, SenderType, MessageType, AutomationEventType, FieldType
 from app.services.event_dispatcher import dispatch_event
+from app.services.stats_rollup import record_booking_created
 
 logger = logging.getLogger(__name__)
 
@@ -252,23 +254,24 @@ class BookingService:
         )
         db.add(booking)
         db.flush()
+        record_booking_created(db, booking)
+        publish_after_commit(db, form.workspace_id, BOOKING_STATUS_CHANGED, {
+            "booking_id": booking.id, "status": booking.status, "previous_status": None,
+        })
 
-        # ── Dispatch Event ──
-        try:
-            dispatch_event(
-                workspace_id=form.workspace_id,
-                event_type=AutomationEventType.BOOKING_CREATED.value,
-                reference_id=booking.id,
-                db=db,
-                payload={
-                    "contact_email": contact.email,
-                    "contact_name": contact.name if contact else "Unknown",
-                    "date": start_time.strftime("%Y-%m-%d") if start_time else "TBD",
-                    "time": start_time.strftime("%H:%M") if start_time else "TBD",
-                    "booking_title": form.title,
-                }
-            )
-        except Exception as e:
-            logger.error(f"Failed to dispatch booking event: {e}")
+        # ── Dispatch Event (outbox row, committed by the caller) ──
+        dispatch_event(
+            workspace_id=form.workspace_id,
+            event_type=AutomationEventType.BOOKING_CREATED.value,
+            reference_id=booking.id,
+            db=db,
+            payload={
+                "contact_email": contact.email,
+                "contact_name": contact.name if contact else "Unknown",
+                "date": start_time.strftime("%Y-%m-%d") if start_time else "TBD",
+                "time": start_time.strftime("%H:%M") if start_time else "TBD",
+                "booking_title": form.title,
+            }
+        )
 
         return booking
@@ -0,0 +1,68 @@
+"""
+Contact Search – index-backed search for the CRM list and typeahead.
+
+Three match paths, each served by its own index (see the Contact model):
+- Word prefixes on name/email via the `search_vector` tsvector (GIN).
+- Typo-tolerant name matches via pg_trgm similarity (GIN, gin_trgm_ops).
+- Phone-number prefixes on the digits-only `phone_digits` column
+  (btree, text_pattern_ops), used when the term looks like a phone number.
+
+Results are ranked by ts_rank_cd plus trigram similarity on name.
+"""
+
+import re
+
+from sqlalchemy import false, func, literal, or_
+from sqlalchemy.orm import Query
+
+from app.models.contact import Contact
+
+# Terms made only of these characters are treated as phone numbers
+_PHONE_RE = re.compile(r"[\d\s()+.\-]+")
+PHONE_MIN_DIGITS = 3
+# Longer inputs add little selectivity and make tsqueries expensive
+MAX_TOKENS = 8
+
+
+def _tokens(term: str) -> list[str]:
+    """Lowercase word tokens, stripped of tsquery operators."""
+    return re.findall(r"[^\W_]+", term.lower())[:MAX_TOKENS]
+
+
+def phone_digits(term: str) -> str | None:
+    """Digits of a phone-like term, or None if it is not one."""
+    if not _PHONE_RE.fullmatch(term):
+        return None
+    digits = re.sub(r"\D", "", term)
+    return digits if len(digits) >= PHONE_MIN_DIGITS else None
+
+
+def prefix_tsquery(tokens: list[str]):
+    """`tok1:* & tok2:*` – every token must prefix-match some word."""
+    return func.to_tsquery("simple", " & ".join(f"{t}:*" for t in tokens))
+
+
+def apply_search(query: Query, term: str) -> tuple[Query, object]:
+    """
+    Filter `query` (over Contact) to rows matching `term`.
+    Returns the filtered query and a rank expression to order by (desc).
+    """
+    term = term.strip()
+    digits = phone_digits(term)
+    if digits:
+        # Shorter stored numbers are closer to what was typed
+        return (
+            query.filter(Contact.phone_digits.like(f"{digits}%")),
+            -func.length(Contact.phone_digits),
+        )
+
+    tokens = _tokens(term)
+    if not tokens:
+        return query.filter(false()), literal(0)
+
+    tsq = prefix_tsquery(tokens)
+    rank = func.ts_rank_cd(Contact.search_vector, tsq) + func.similarity(Contact.name, term)
+    return (
+        query.filter(or_(Contact.search_vector.op("@@")(tsq), Contact.name.op("%")(term))),
+        rank,
+    )
@@ -0,0 +1,153 @@
+"""
+Dashboard Cache – TTL response cache for /dashboard endpoints.
+
+Entries are keyed by (workspace_id, endpoint, range) plus a per-workspace
+generation number. Any committed change to a workspace's bookings, contacts,
+alerts, inventory, conversations or forms bumps the generation, so stale
+entries are never served even before their TTL runs out, and pushes a
+dashboard.invalidated event so open dashboards refetch instead of polling.
+"""
+
+import logging
+import threading
+from typing import Any, Callable
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.cache import get_cache_backend
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.realtime_topics import DASHBOARD_INVALIDATED, publish
+from app.models.alert import Alert
+from app.models.booking import Booking
+from app.models.contact import Contact
+from app.models.conversation import Conversation
+from app.models.form import Form, FormSubmission
+from app.models.inventory import InventoryItem
+
+logger = logging.getLogger(__name__)
+
+# Models whose writes change dashboard numbers
+TRACKED_MODELS = (Booking, Contact, Alert, InventoryItem, Conversation, Form, FormSubmission)
+
+_DIRTY_KEY = "dashboard_dirty_workspaces"
+
+
+class DashboardCache:
+    """Read-through cache with hit/miss counters per endpoint."""
+
+    def __init__(self, ttl: float = settings.DASHBOARD_CACHE_TTL):
+        self._backend = get_cache_backend()
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._hits: dict[str, int] = {}
+        self._misses: dict[str, int] = {}
+        self._errors = 0
+        self._invalidations = 0
+
+    def _generation_key(self, workspace_id: int) -> str:
+        return f"dash:gen:{workspace_id}"
+
+    def _count(self, counters: dict[str, int], endpoint: str):
+        with self._lock:
+            counters[endpoint] = counters.get(endpoint, 0) + 1
+
+    def get_or_compute(self, workspace_id: int, endpoint: str, range_days: int | None, compute: Callable[[], Any]) -> Any:
+        """Return the cached response, or compute, store and return it."""
+        if self._ttl <= 0:
+            return compute()
+
+        try:
+            generation = self._backend.get_counter(self._generation_key(workspace_id))
+            key = f"dash:{workspace_id}:{generation}:{endpoint}:{range_days or '-'}"
+            cached = self._backend.get(key)
+        except Exception as e:
+            # Cache outages must never take the dashboard down
+            logger.warning(f"[CACHE] Lookup failed, computing directly: {e}")
+            with self._lock:
+                self._errors += 1
+            return compute()
+
+        if cached is not None:
+            self._count(self._hits, endpoint)
+            return cached
+
+        self._count(self._misses, endpoint)
+        value = jsonable_encoder(compute())
+        try:
+            self._backend.set(key, value, self._ttl)
+        except Exception as e:
+            logger.warning(f"[CACHE] Store failed: {e}")
+            with self._lock:
+                self._errors += 1
+        return value
+
+    def invalidate(self, workspace_id: int):
+        """Drop every cached dashboard response for a workspace."""
+        try:
+            self._backend.incr(self._generation_key(workspace_id))
+            with self._lock:
+                self._invalidations += 1
+        except Exception as e:
+            logger.warning(f"[CACHE] Invalidation failed for workspace {workspace_id}: {e}")
+            with self._lock:
+                self._errors += 1
+
+    def stats(self) -> dict:
+        """Hit/miss counters for this process."""
+        with self._lock:
+            hits = sum(self._hits.values())
+            misses = sum(self._misses.values())
+            endpoints = sorted(set(self._hits) | set(self._misses))
+            return {
+                "backend": self._backend.name,
+                "ttl_seconds": self._ttl,
+                "entries": self._backend.size(),
+                "hits": hits,
+                "misses": misses,
+                "hit_ratio": round(hits / (hits + misses), 4) if hits + misses else 0.0,
+                "invalidations": self._invalidations,
+                "errors": self._errors,
+                "by_endpoint": {
+                    ep: {"hits": self._hits.get(ep, 0), "misses": self._misses.get(ep, 0)}
+                    for ep in endpoints
+                },
+            }
+
+
+# ── Singleton instance ────────────────────────────────────────────
+dashboard_cache = DashboardCache()
+
+
+# ── Invalidation hooks ───────────────────────────────────────────
+
+def mark_workspace_dirty(db: Session, workspace_id: int):
+    """
+    Invalidate a workspace's dashboards once `db` commits. Needed for bulk
+    query.update() calls, which the flush hook below cannot see.
+    """
+    db.info.setdefault(_DIRTY_KEY, set()).add(workspace_id)
+
+
+@event.listens_for(SessionLocal, "after_flush")
+def _collect_dirty_workspaces(session: Session, flush_context):
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, TRACKED_MODELS) and obj.workspace_id is not None:
+            mark_workspace_dirty(session, obj.workspace_id)
+
+
+@event.listens_for(SessionLocal, "after_commit")
+def _invalidate_on_commit(session: Session):
+    for workspace_id in session.info.pop(_DIRTY_KEY, ()):
+        dashboard_cache.invalidate(workspace_id)
+        try:
+            publish(workspace_id, DASHBOARD_INVALIDATED)
+        except Exception as e:
+            logger.warning(f"[CACHE] Failed to push invalidation for workspace {workspace_id}: {e}")
+
+
+@event.listens_for(SessionLocal, "after_rollback")
+def _discard_on_rollback(session: Session):
+    session.info.pop(_DIRTY_KEY, None)
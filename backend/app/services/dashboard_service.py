@@ -1,33 +1,225 @@
 """
 Dashboard Aggregation Service — v2 Elite.
 Centralizes all dashboard metrics, single call, range-aware.
+
+Each table's KPIs are computed in one round trip with conditional
+aggregates (COUNT(*) FILTER (WHERE ...)), and the per-table queries run
+concurrently on a small shared thread pool, each on its own session.
+Period-based figures (trend, growth, status breakdown) are read from the
+workspace_daily_stats rollup — at most 2 × range_days small rows.
 """
 
-from sqlalchemy.orm import Session
-from sqlalchemy import func, case
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
 from app.models.booking import Booking
 from app.models.contact import Contact
 from app.models.conversation import Conversation
-from app.models.form import Form, FormSubmission
+from app.models.form import Form
 from app.models.inventory import InventoryItem
 from app.models.alert import Alert
-from app.models.event_log import EventLog
+from app.services.stats_rollup import get_daily_stats
 from app.utils.enums import BookingStatus, AlertSeverity
 
+# Shared across requests so concurrent dashboards can't exhaust the DB pool
+_executor = ThreadPoolExecutor(
+    max_workers=settings.DASHBOARD_QUERY_WORKERS,
+    thread_name_prefix="dashboard-agg",
+)
+
 
 def _now_utc():
     return datetime.now(timezone.utc)
 
 
 def _get_range_bounds(range_days: int):
+    """
+    (now, current_start, prev_start): the current period is the range_days
+    calendar days ending today, the previous one the range_days days before.
+    """
     now = _now_utc()
-    current_start = now - timedelta(days=range_days)
-    prev_start = now - timedelta(days=range_days * 2)
+    current_start = now.date() - timedelta(days=range_days - 1)
+    prev_start = current_start - timedelta(days=range_days)
     return now, current_start, prev_start
 
 
+def _count(*conditions):
+    """COUNT(*) FILTER (WHERE ...) — one column of a single-pass aggregate."""
+    return func.count().filter(*conditions)
+
+
+# ── Per-table aggregates ─────────────────────────────────────────
+# Each function runs on its own session in the pool and returns plain data.
+
+def _contact_stats(db: Session, workspace_id: int) -> dict:
+    row = db.execute(
+        select(func.count().label("total")).where(
+            Contact.workspace_id == workspace_id,
+            Contact.is_deleted == False,
+        )
+    ).one()
+    return row._asdict()
+
+
+def _booking_stats(db: Session, workspace_id: int, today_start) -> dict:
+    row = db.execute(
+        select(
+            func.count().label("total"),
+            _count(
+                Booking.start_time >= today_start,
+                Booking.start_time < today_start + timedelta(days=1),
+                Booking.status != BookingStatus.CANCELLED,
+            ).label("today"),
+            _count(Booking.status == BookingStatus.PENDING).label("pending"),
+            _count(Booking.status.in_([BookingStatus.CONFIRMED, BookingStatus.COMPLETED])).label("converted"),
+        ).where(Booking.workspace_id == workspace_id)
+    ).one()
+    return row._asdict()
+
+
+def _period_stats(db: Session, workspace_id: int, range_start, prev_start) -> dict:
+    """Sum rollup rows into the current and previous periods plus a per-day map."""
+    current_day = range_start
+    current = {"new_contacts": 0, "bookings_created": 0, "submissions": 0}
+    previous = {"new_contacts": 0, "bookings_created": 0}
+    by_status = {st.value: 0 for st in BookingStatus}
+    per_day = {}
+
+    for row in get_daily_stats(db, workspace_id, since=prev_start):
+        if row.day < current_day:
+            previous["new_contacts"] += row.new_contacts
+            previous["bookings_created"] += row.bookings_created
+            continue
+        current["new_contacts"] += row.new_contacts
+        current["bookings_created"] += row.bookings_created
+        current["submissions"] += row.submissions
+        for st in BookingStatus:
+            by_status[st.value] += getattr(row, f"bookings_{st.value}")
+        per_day[str(row.day)] = {
+            "bookings": row.bookings_created - row.bookings_cancelled,
+            "confirmed": row.bookings_confirmed + row.bookings_completed,
+        }
+
+    return {"current": current, "previous": previous, "by_status": by_status, "per_day": per_day}
+
+
+def _alert_stats(db: Session, workspace_id: int) -> dict:
+    unread = (Alert.workspace_id == workspace_id, Alert.is_read == False)
+    row = db.execute(
+        select(
+            func.count().label("unread"),
+            _count(Alert.severity == AlertSeverity.CRITICAL).label("critical"),
+            _count(Alert.severity == AlertSeverity.WARNING).label("warning"),
+        ).where(*unread)
+    ).one()
+
+    # Newest unread alert per title (DISTINCT ON), then the 5 most recent of those
+    newest_per_title = (
+        select(Alert.id, Alert.title, Alert.message, Alert.severity, Alert.is_read, Alert.created_at)
+        .where(*unread)
+        .distinct(Alert.title)
+        .order_by(Alert.title, Alert.created_at.desc())
+        .subquery()
+    )
+    recent = db.execute(
+        select(newest_per_title)
+        .order_by(newest_per_title.c.created_at.desc())
+        .limit(5)
+    ).all()
+
+    stats = row._asdict()
+    stats["recent"] = recent
+    return stats
+
+
+def _conversation_stats(db: Session, workspace_id: int) -> dict:
+    row = db.execute(
+        select(
+            func.count().label("total"),
+            _count(Conversation.is_read == False).label("unanswered"),
+        ).where(Conversation.workspace_id == workspace_id)
+    ).one()
+    return row._asdict()
+
+
+def _form_stats(db: Session, workspace_id: int) -> dict:
+    row = db.execute(
+        select(func.count().label("active_forms")).where(
+            Form.workspace_id == workspace_id,
+            Form.is_active == True,
+        )
+    ).one()
+    return row._asdict()
+
+
+def _inventory_stats(db: Session, workspace_id: int) -> dict:
+    # The dashboard lists every item anyway, so the counts come from the same pass
+    rows = db.execute(
+        select(
+            InventoryItem.id,
+            InventoryItem.name,
+            InventoryItem.sku,
+            InventoryItem.quantity,
+            InventoryItem.unit,
+            InventoryItem.low_stock_threshold,
+        ).where(
+            InventoryItem.workspace_id == workspace_id,
+            InventoryItem.is_deleted == False,
+        ).order_by(InventoryItem.name)
+    ).all()
+
+    low_stock = 0
+    out_of_stock = 0
+    items = []
+    for item in rows:
+        if item.low_stock_threshold is not None and item.quantity <= item.low_stock_threshold:
+            low_stock += 1
+        if item.quantity == 0:
+            out_of_stock += 1
+
+        threshold = item.low_stock_threshold or 0
+        qty = item.quantity or 0
+        if qty == 0:
+            item_status = "out_of_stock"
+        elif threshold > 0 and qty <= threshold:
+            item_status = "low_stock"
+        else:
+            item_status = "healthy"
+        items.append({
+            "id": item.id,
+            "name": item.name,
+            "sku": item.sku,
+            "quantity": qty,
+            "unit": item.unit or "",
+            "threshold": threshold,
+            "status": item_status,
+        })
+
+    return {
+        "total": len(rows),
+        "low_stock": low_stock,
+        "out_of_stock": out_of_stock,
+        "items": items,
+    }
+
+
+def _run_concurrently(bind, tasks: dict) -> dict:
+    """
+    Run {name: (fn, *args)} on the shared pool, one short-lived session each.
+    Sessions never cross threads; the caller's session only lends its engine.
+    """
+    def _call(fn, *args):
+        with Session(bind=bind) as session:
+            return fn(session, *args)
+
+    futures = {name: _executor.submit(_call, fn, *args) for name, (fn, *args) in tasks.items()}
+    return {name: future.result() for name, future in futures.items()}
+
+
 def get_owner_dashboard(workspace_id: int, db: Session, range_days: int = 7) -> dict:
     """
     Aggregates ALL dashboard metrics in a single call.
@@ -37,93 +229,46 @@ def get_owner_dashboard(workspace_id: int, db: Session, range_days: int = 7) ->
     now, range_start, prev_start = _get_range_bounds(range_days)
     today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
 
-    # ── KPI Counts ──────────────────────────────────────────────
-    total_contacts = db.query(func.count(Contact.id)).filter(
-        Contact.workspace_id == workspace_id,
-        Contact.is_deleted == False
-    ).scalar() or 0
-
-    new_contacts_period = db.query(func.count(Contact.id)).filter(
-        Contact.workspace_id == workspace_id,
-        Contact.is_deleted == False,
-        Contact.created_at >= range_start
-    ).scalar() or 0
-
-    new_contacts_prev = db.query(func.count(Contact.id)).filter(
-        Contact.workspace_id == workspace_id,
-        Contact.is_deleted == False,
-        Contact.created_at >= prev_start,
-        Contact.created_at < range_start
-    ).scalar() or 0
-
-    today_bookings = db.query(func.count(Booking.id)).filter(
-        Booking.workspace_id == workspace_id,
-        Booking.start_time >= today_start,
-        Booking.start_time < today_start + timedelta(days=1),
-        Booking.status != BookingStatus.CANCELLED
-    ).scalar() or 0
-
-    pending_bookings = db.query(func.count(Booking.id)).filter(
-        Booking.workspace_id == workspace_id,
-        Booking.status == BookingStatus.PENDING
-    ).scalar() or 0
-
-    unread_alerts = db.query(func.count(Alert.id)).filter(
-        Alert.workspace_id == workspace_id,
-        Alert.is_read == False
-    ).scalar() or 0
-
-    total_bookings = db.query(func.count(Booking.id)).filter(
-        Booking.workspace_id == workspace_id
-    ).scalar() or 0
+    results = _run_concurrently(db.get_bind(), {
+        "contacts": (_contact_stats, workspace_id),
+        "bookings": (_booking_stats, workspace_id, today_start),
+        "periods": (_period_stats, workspace_id, range_start, prev_start),
+        "alerts": (_alert_stats, workspace_id),
+        "conversations": (_conversation_stats, workspace_id),
+        "forms": (_form_stats, workspace_id),
+        "inventory": (_inventory_stats, workspace_id),
+    })
+    contacts = results["contacts"]
+    bookings = results["bookings"]
+    alerts = results["alerts"]
+    conversations = results["conversations"]
+    forms = results["forms"]
+    inventory = results["inventory"]
+    current = results["periods"]["current"]
+    previous = results["periods"]["previous"]
+
+    total_contacts = contacts["total"]
+    critical_alerts = alerts["critical"]
+    warning_alerts = alerts["warning"]
+    pending_bookings = bookings["pending"]
+    confirmed_or_completed = bookings["converted"]
+    low_stock = inventory["low_stock"]
 
     # ── Growth Calculations ──────────────────────────────────────
-    prev_period_bookings = db.query(func.count(Booking.id)).filter(
-        Booking.workspace_id == workspace_id,
-        Booking.created_at >= prev_start,
-        Booking.created_at < range_start
-    ).scalar() or 0
-
-    curr_period_bookings = db.query(func.count(Booking.id)).filter(
-        Booking.workspace_id == workspace_id,
-        Booking.created_at >= range_start
-    ).scalar() or 0
-
     def _growth_pct(current, previous):
         if previous == 0:
             return 100.0 if current > 0 else 0.0
         return round(((current - previous) / previous) * 100, 1)
 
-    booking_growth = _growth_pct(curr_period_bookings, prev_period_bookings)
-    contact_growth = _growth_pct(new_contacts_period, new_contacts_prev)
+    booking_growth = _growth_pct(current["bookings_created"], previous["bookings_created"])
+    contact_growth = _growth_pct(current["new_contacts"], previous["new_contacts"])
 
     # ── Revenue Trend (bookings per day in range) ────────────────
-    daily_booking_rows = db.query(
-        func.date(Booking.created_at).label('day'),
-        func.count(Booking.id).label('bookings'),
-        func.sum(
-            case(
-                (Booking.status == BookingStatus.CONFIRMED, 1),
-                (Booking.status == BookingStatus.COMPLETED, 1),
-                else_=0
-            )
-        ).label('confirmed')
-    ).filter(
-        Booking.workspace_id == workspace_id,
-        Booking.created_at >= range_start,
-        Booking.status != BookingStatus.CANCELLED
-    ).group_by(
-        func.date(Booking.created_at)
-    ).order_by(
-        func.date(Booking.created_at)
-    ).all()
-
     # Fill in missing days with 0s
-    date_map = {str(row.day): {"bookings": row.bookings, "confirmed": row.confirmed or 0}
-                for row in daily_booking_rows}
+    date_map = results["periods"]["per_day"]
     revenue_trend = []
     for i in range(range_days):
-        day = (range_start + timedelta(days=i)).date()
+        day = range_start + timedelta(days=i)
         day_str = str(day)
         day_data = date_map.get(day_str, {"bookings": 0, "confirmed": 0})
         revenue_trend.append({
@@ -134,63 +279,9 @@ def get_owner_dashboard(workspace_id: int, db: Session, range_days: int = 7) ->
             "revenue": day_data["confirmed"] * 150
         })
 
-    # ── Bookings Status Breakdown (for Bar chart) ───────────────
-    status_rows = db.query(
-        Booking.status, func.count(Booking.id)
-    ).filter(
-        Booking.workspace_id == workspace_id,
-        Booking.created_at >= range_start
-    ).group_by(Booking.status).all()
-
-    by_status = {row[0].value: row[1] for row in status_rows}
-    for st in BookingStatus:
-        by_status.setdefault(st.value, 0)
-
     # ── Pipeline / Conversion Funnel ────────────────────────────
-    confirmed_or_completed = db.query(func.count(Booking.id)).filter(
-        Booking.workspace_id == workspace_id,
-        Booking.status.in_([BookingStatus.CONFIRMED, BookingStatus.COMPLETED])
-    ).scalar() or 0
-
     conversion_rate = round((confirmed_or_completed / total_contacts) * 100, 1) if total_contacts > 0 else 0.0
 
-    # ── Recent Alerts (unread only, deduplicated by title) ───────────
-    # Get all unread alerts, then deduplicate keeping the newest per title
-    all_unread = db.query(Alert).filter(
-        Alert.workspace_id == workspace_id,
-        Alert.is_read == False,
-    ).order_by(Alert.created_at.desc()).all()
-
-    # Deduplicate by title — keep only the first (newest) occurrence per title
-    seen_titles = set()
-    recent_alerts = []
-    for a in all_unread:
-        if a.title not in seen_titles:
-            seen_titles.add(a.title)
-            recent_alerts.append(a)
-        if len(recent_alerts) >= 5:
-            break
-
-    critical_alerts = db.query(func.count(Alert.id)).filter(
-        Alert.workspace_id == workspace_id,
-        Alert.is_read == False,
-        Alert.severity == AlertSeverity.CRITICAL
-    ).scalar() or 0
-
-    warning_alerts = db.query(func.count(Alert.id)).filter(
-        Alert.workspace_id == workspace_id,
-        Alert.is_read == False,
-        Alert.severity == AlertSeverity.WARNING
-    ).scalar() or 0
-
-    # ── Inventory Health ─────────────────────────────────────────
-    low_stock = db.query(func.count(InventoryItem.id)).filter(
-        InventoryItem.workspace_id == workspace_id,
-        InventoryItem.is_deleted == False,
-        InventoryItem.low_stock_threshold.isnot(None),
-        InventoryItem.quantity <= InventoryItem.low_stock_threshold
-    ).scalar() or 0
-
     # ── Operational Health Score ─────────────────────────────────
     # Score = 100, deductions based on alerts/pending/conversion
     score = 100
@@ -218,75 +309,15 @@ def get_owner_dashboard(workspace_id: int, db: Session, range_days: int = 7) ->
     else:
         health_status = "critical"
 
-    # ── Unanswered Conversations ─────────────────────────────────
-    unanswered = db.query(func.count(Conversation.id)).filter(
-        Conversation.workspace_id == workspace_id,
-        Conversation.is_read == False
-    ).scalar() or 0
-
-    active_conversations = db.query(func.count(Conversation.id)).filter(
-        Conversation.workspace_id == workspace_id
-    ).scalar() or 0
-
-    # ── Forms Status ─────────────────────────────────────────────
-    active_forms = db.query(func.count(Form.id)).filter(
-        Form.workspace_id == workspace_id,
-        Form.is_active == True
-    ).scalar() or 0
-
-    recent_submissions = db.query(func.count(FormSubmission.id)).filter(
-        FormSubmission.workspace_id == workspace_id,
-        FormSubmission.created_at >= range_start
-    ).scalar() or 0
-
-    # ── Inventory Status (Detailed) ──────────────────────────────
-    total_inventory = db.query(func.count(InventoryItem.id)).filter(
-        InventoryItem.workspace_id == workspace_id,
-        InventoryItem.is_deleted == False
-    ).scalar() or 0
-
-    out_of_stock = db.query(func.count(InventoryItem.id)).filter(
-        InventoryItem.workspace_id == workspace_id,
-        InventoryItem.is_deleted == False,
-        InventoryItem.quantity == 0
-    ).scalar() or 0
-
-    # Fetch actual inventory items for the dashboard list
-    inventory_items_raw = db.query(InventoryItem).filter(
-        InventoryItem.workspace_id == workspace_id,
-        InventoryItem.is_deleted == False
-    ).order_by(InventoryItem.name).all()
-
-    inventory_items_list = []
-    for item in inventory_items_raw:
-        threshold = item.low_stock_threshold or 0
-        qty = item.quantity or 0
-        if qty == 0:
-            item_status = "out_of_stock"
-        elif threshold > 0 and qty <= threshold:
-            item_status = "low_stock"
-        else:
-            item_status = "healthy"
-        inventory_items_list.append({
-            "id": item.id,
-            "name": item.name,
-            "sku": item.sku,
-            "quantity": qty,
-            "unit": item.unit or "",
-            "threshold": threshold,
-            "status": item_status,
-        })
-
-
     return {
         # KPIs
         "kpis": {
-            "today_bookings": today_bookings,
+            "today_bookings": bookings["today"],
             "total_contacts": total_contacts,
             "pending_bookings": pending_bookings,
-            "unread_alerts": unread_alerts,
-            "total_bookings": total_bookings,
-            "unanswered_conversations": unanswered,
+            "unread_alerts": alerts["unread"],
+            "total_bookings": bookings["total"],
+            "unanswered_conversations": conversations["unanswered"],
         },
         # Growth indicators
         "growth": {
@@ -296,12 +327,12 @@ def get_owner_dashboard(workspace_id: int, db: Session, range_days: int = 7) ->
         # Pipeline
         "pipeline": {
             "total_contacts": total_contacts,
-            "new_contacts": new_contacts_period,
+            "new_contacts": current["new_contacts"],
             "confirmed_bookings": confirmed_or_completed,
             "conversion_rate": conversion_rate,
         },
         # Booking status breakdown (for bar chart)
-        "booking_status": by_status,
+        "booking_status": results["periods"]["by_status"],
         # Revenue/booking trend (for line chart)
         "revenue_trend": revenue_trend,
         # Recent alerts list
@@ -314,22 +345,22 @@ def get_owner_dashboard(workspace_id: int, db: Session, range_days: int = 7) ->
                 "is_read": a.is_read,
                 "created_at": a.created_at.isoformat(),
             }
-            for a in recent_alerts
+            for a in alerts["recent"]
         ],
         # Component specifically structured data
         "forms_status": {
-            "active_forms": active_forms,
-            "recent_submissions": recent_submissions,
+            "active_forms": forms["active_forms"],
+            "recent_submissions": current["submissions"],
         },
         "inventory_status": {
-            "total_items": total_inventory,
+            "total_items": inventory["total"],
             "low_stock": low_stock,
-            "out_of_stock": out_of_stock,
-            "items": inventory_items_list,
+            "out_of_stock": inventory["out_of_stock"],
+            "items": inventory["items"],
         },
         "inbox_status": {
-            "unanswered": unanswered,
-            "active_conversations": active_conversations,
+            "unanswered": conversations["unanswered"],
+            "active_conversations": conversations["total"],
         },
         # Health score
         "health": {
@@ -23,6 +23,7 @@ from app.models.message import Message
 from app.models.form import Form
 from app.models.alert import Alert
 from app.models.automation_log import AutomationLog
+from app.services.stats_rollup import rebuild_daily_stats
 from app.utils.enums import (
     ContactSource, ContactType,
     BookingStatus,
@@ -401,4 +402,7 @@ def seed_demo_data(db: Session, workspace_id: int, owner_id: int) -> None:
             {"ts": _days_ago(days_offset), "id": log.id}
         )
 
+    # Seeded rows are backdated, so rebuild the rollups rather than bump them
+    rebuild_daily_stats(db, workspace_id)
+
     db.commit()
@@ -1,16 +1,17 @@
 """
 Event Dispatcher – central event bus for the automation layer.
-All business events go through dispatch_event() which logs and delegates to handlers.
+All business events go through dispatch_event() which enqueues them in the
+transactional outbox (automation_logs). The outbox worker drains the queue
+and calls process_event(), which delegates to the handlers below.
 Controllers NEVER send emails/SMS directly – only dispatch events.
 """
 
 import logging
-from datetime import datetime, timezone
+import random
+from datetime import datetime, timedelta, timezone
 from sqlalchemy.orm import Session
-from app.core.database import SessionLocal
 
-from app.models.automation_log import AutomationLog
-from app.utils.enums import AutomationEventType
+from app.core.config import settings
 from app.models.automation_log import AutomationLog
 from app.models.conversation import Conversation
 from app.models.message import Message
@@ -20,6 +21,7 @@ from app.services.email_service import (
     send_owner_login_email,
     send_workspace_welcome_email,
 )
+from app.tasks.async_executor import async_executor
 
 logger = logging.getLogger(__name__)
 
@@ -32,61 +34,97 @@ def dispatch_event(
     payload: dict = None,
 ) -> AutomationLog:
     """
-    Dispatch an automation event.
+    Enqueue an automation event in the outbox.
 
-    1. Creates an AutomationLog entry
-    2. Calls the appropriate handler
-    3. Updates log status
+    The AutomationLog row is added to the caller's session and flushed, so it
+    is committed atomically with the business change by the caller's
+    db.commit(). Handlers run later on the outbox worker — request latency
+    never depends on email/SMS providers, and queued events survive restarts.
 
     Parameters:
         workspace_id: Workspace scope
         event_type: One of AutomationEventType values
         reference_id: ID of the triggering entity (submission, booking, etc.)
-        db: Database session
-        payload: Optional extra data for the handler
+        db: Database session (caller commits)
+        payload: Optional extra data for the handler (must be JSON-serializable)
 
     Returns:
-        The created AutomationLog entry
+        The pending AutomationLog entry
     """
     log = AutomationLog(
         workspace_id=workspace_id,
         event_type=event_type,
         reference_id=reference_id,
         status="pending",
+        payload=payload or {},
+        attempts=0,
+        next_attempt_at=datetime.now(timezone.utc),
     )
     db.add(log)
-    db.commit()
-    db.refresh(log)
+    db.flush()
+    # Wakes the outbox worker once the surrounding transaction commits
+    db.info["outbox_dirty"] = True
+    return log
 
+
+def process_event(log: AutomationLog, db: Session) -> AutomationLog:
+    """
+    Run the handler for a claimed outbox row and record the outcome.
+
+    Called by the outbox worker. On failure the handler's partial work is
+    rolled back and the row is rescheduled with exponential backoff until
+    OUTBOX_MAX_ATTEMPTS is reached, after which it is marked "error".
+    """
+    handler = EVENT_HANDLERS.get(log.event_type)
     try:
-        handler = EVENT_HANDLERS.get(event_type)
         if handler:
-            handler(workspace_id=workspace_id, reference_id=reference_id, db=db, payload=payload or {})
+            handler(
+                workspace_id=log.workspace_id,
+                reference_id=log.reference_id,
+                db=db,
+                payload=log.payload or {},
+            )
             log.status = "success"
-            logger.info(f"[EVENT] {event_type} handled successfully (ref={reference_id})")
+            log.last_error = None
+            logger.info(f"[EVENT] {log.event_type} handled successfully (ref={log.reference_id})")
         else:
             log.status = "skipped"
-            logger.warning(f"[EVENT] No handler for event: {event_type}")
+            logger.warning(f"[EVENT] No handler for event: {log.event_type}")
     except Exception as e:
-        log.status = "error"
-        logger.error(f"[EVENT] Error handling {event_type}: {e}")
+        db.rollback()
+        log.last_error = str(e)[:1000]
+        if (log.attempts or 0) >= settings.OUTBOX_MAX_ATTEMPTS:
+            log.status = "error"
+            logger.error(f"[EVENT] Giving up on {log.event_type} (ref={log.reference_id}) after {log.attempts} attempts: {e}")
+        else:
+            log.status = "pending"
+            log.next_attempt_at = datetime.now(timezone.utc) + _retry_delay(log.attempts or 1)
+            logger.warning(f"[EVENT] {log.event_type} failed (attempt {log.attempts}), retry scheduled: {e}")
 
+    log.locked_at = None
     db.commit()
     return log
 
 
-def dispatch_event_background(workspace_id: int, event_type: str, reference_id: int, payload: dict = None):
-    """
-    Wrapper for dispatch_event to run as a BackgroundTask.
-    Creates a dedicated database session to safely persist the log.
-    """
-    db = SessionLocal()
-    try:
-        dispatch_event(workspace_id=workspace_id, event_type=event_type, reference_id=reference_id, db=db, payload=payload)
-    except Exception as e:
-        logger.error(f"[BACKGROUND_EVENT] Failed to dispatch {event_type} (ref={reference_id}): {e}")
-    finally:
-        db.close()
+def _retry_delay(attempts: int) -> timedelta:
+    """Exponential backoff with jitter, capped at OUTBOX_RETRY_MAX_SECONDS."""
+    delay = settings.OUTBOX_RETRY_BASE_SECONDS * (2 ** max(attempts - 1, 0))
+    delay = min(delay, settings.OUTBOX_RETRY_MAX_SECONDS)
+    return timedelta(seconds=delay + random.uniform(0, delay * 0.1))
+
+
+def _run_async(coro):
+    """Run a coroutine on the shared executor loop and wait for its result."""
+    return async_executor.run(coro, timeout=settings.ASYNC_EXECUTOR_RESULT_TIMEOUT)
+
+
+def _send_email(to: str, subject: str, body: str) -> None:
+    """Send via the configured provider. Raises so the outbox can retry."""
+    from app.services.email_service import get_email_provider
+
+    provider = get_email_provider()
+    if not _run_async(provider.send(to, subject, body)):
+        raise RuntimeError(f"Email provider failed to send to {to}")
 
 
 # ── Event Handlers ──────────────────────────────────────────────
@@ -94,8 +132,6 @@ def dispatch_event_background(workspace_id: int, event_type: str, reference_id:
 
 def _handle_form_submitted(workspace_id: int, reference_id: int, db: Session, payload: dict):
     """Handle form_submitted: send welcome message to contact."""
-    from app.services.email_service import get_email_provider
-
     contact_email = payload.get("contact_email")
     contact_name = payload.get("contact_name", "there")
     form_title = payload.get("form_title", "Form")
@@ -104,52 +140,43 @@ def _handle_form_submitted(workspace_id: int, reference_id: int, db: Session, pa
         logger.info("[EVENT] form_submitted: no contact email, skipping email send")
         return
 
-    try:
-        provider = get_email_provider()
-        subject = f"Thank you for submitting '{form_title}' – CoreWebOps"
-        body = (
-            f"Hi {contact_name},\n\n"
-            f"We received your submission for '{form_title}'. "
-            f"Our team will review it shortly.\n\n"
-            f"Thank you,\nCoreWebOps"
-        )
-        import asyncio
-        asyncio.run(provider.send(contact_email, subject, body))
-        logger.info(f"[EVENT] Sent welcome email to {contact_email}")
-
-        # Log automated message in conversation
-        # Need to find conversation by contact_email... or better, pass conversation_id or contact_id in payload?
-        # Re-querying by email is safe enough for this flow since we just updated contact
-        from app.models.contact import Contact
-        contact = db.query(Contact).filter(Contact.email == contact_email, Contact.workspace_id == workspace_id).first()
-        if contact:
-            conv = db.query(Conversation).filter(
-                Conversation.contact_id == contact.id,
-                Conversation.workspace_id == workspace_id
-            ).first()
-            if conv:
-                msg = Message(
-                    content="Thank you for your submission. We will contact you soon.",
-                    sender_type=SenderType.SYSTEM,
-                    message_type=MessageType.AUTOMATED,
-                    conversation_id=conv.id,
-                    workspace_id=workspace_id,
-                )
-                db.add(msg)
-                conv.last_message_at = datetime.now(timezone.utc)
-                db.commit()
-                logger.info(f"[EVENT] Logged automated reply in conversation {conv.id}")
-
-    except Exception as e:
-        logger.error(f"[EVENT] Failed to handle form submission automation: {e}")
-        # Ensure we don't crash, but error is logged
+    subject = f"Thank you for submitting '{form_title}' – CoreWebOps"
+    body = (
+        f"Hi {contact_name},\n\n"
+        f"We received your submission for '{form_title}'. "
+        f"Our team will review it shortly.\n\n"
+        f"Thank you,\nCoreWebOps"
+    )
+    # Email first: a provider failure raises and the outbox retries the whole
+    # handler, so the inbox message below is only ever written once.
+    _send_email(contact_email, subject, body)
+    logger.info(f"[EVENT] Sent welcome email to {contact_email}")
 
+    # Log automated message in conversation
+    # Re-querying by email is safe enough for this flow since we just updated contact
+    from app.models.contact import Contact
+    contact = db.query(Contact).filter(Contact.email == contact_email, Contact.workspace_id == workspace_id).first()
+    if contact:
+        conv = db.query(Conversation).filter(
+            Conversation.contact_id == contact.id,
+            Conversation.workspace_id == workspace_id
+        ).first()
+        if conv:
+            msg = Message(
+                content="Thank you for your submission. We will contact you soon.",
+                sender_type=SenderType.SYSTEM,
+                message_type=MessageType.AUTOMATED,
+                conversation_id=conv.id,
+                workspace_id=workspace_id,
+            )
+            db.add(msg)
+            conv.last_message_at = datetime.now(timezone.utc)
+            db.commit()
+            logger.info(f"[EVENT] Logged automated reply in conversation {conv.id}")
 
 
 def _handle_form_approved(workspace_id: int, reference_id: int, db: Session, payload: dict):
     """Handle form_approved: send confirmation message to contact."""
-    from app.services.email_service import get_email_provider
-
     contact_email = payload.get("contact_email")
     contact_name = payload.get("contact_name", "there")
     form_title = payload.get("form_title", "Form")
@@ -158,19 +185,14 @@ def _handle_form_approved(workspace_id: int, reference_id: int, db: Session, pay
         logger.info("[EVENT] form_approved: no contact email, skipping")
         return
 
-    try:
-        provider = get_email_provider()
-        subject = f"Your submission has been approved! – CoreWebOps"
-        body = (
-            f"Hi {contact_name},\n\n"
-            f"Great news! Your submission for '{form_title}' has been approved.\n\n"
-            f"Thank you,\nCoreWebOps"
-        )
-        import asyncio
-        asyncio.get_event_loop().run_until_complete(provider.send(contact_email, subject, body))
-        logger.info(f"[EVENT] Sent approval email to {contact_email}")
-    except Exception as e:
-        logger.error(f"[EVENT] Failed to send approval email: {e}")
+    subject = f"Your submission has been approved! – CoreWebOps"
+    body = (
+        f"Hi {contact_name},\n\n"
+        f"Great news! Your submission for '{form_title}' has been approved.\n\n"
+        f"Thank you,\nCoreWebOps"
+    )
+    _send_email(contact_email, subject, body)
+    logger.info(f"[EVENT] Sent approval email to {contact_email}")
 
 
 def _handle_booking_created(workspace_id: int, reference_id: int, db: Session, payload: dict):
@@ -202,15 +224,24 @@ def _handle_booking_created(workspace_id: int, reference_id: int, db: Session, p
 
 def _handle_booking_confirmed(workspace_id: int, reference_id: int, db: Session, payload: dict):
     """Handle booking_confirmed: send email + inbox message."""
-    from app.services.email_service import get_email_provider
-    
     contact_email = payload.get("contact_email")
     contact_name = payload.get("contact_name", "there")
     date_str = payload.get("date")
     time_str = payload.get("time")
-    
-    # 1. Inbox Message
-    # Need conversation ID.
+
+    # 1. Email (first, so a retried delivery never duplicates the inbox message)
+    if contact_email:
+        subject = f"Appointment Confirmed – {date_str} @ {time_str}"
+        body = (
+            f"Hi {contact_name},\n\n"
+            f"Your appointment has been confirmed for {date_str} at {time_str}.\n\n"
+            f"We look forward to seeing you!\n\n"
+            f"Best regards,\nCoreWebOps"
+        )
+        _send_email(contact_email, subject, body)
+        logger.info(f"[EVENT] Sent booking confirmation email to {contact_email}")
+
+    # 2. Inbox Message
     from app.models.contact import Contact
     contact = db.query(Contact).filter(Contact.email == contact_email, Contact.workspace_id == workspace_id).first()
     if contact:
@@ -230,22 +261,24 @@ def _handle_booking_confirmed(workspace_id: int, reference_id: int, db: Session,
             conv.last_message_at = datetime.now(timezone.utc)
             db.commit()
 
-    # 2. Email
-    if contact_email:
-        try:
-            provider = get_email_provider()
-            subject = f"Appointment Confirmed – {date_str} @ {time_str}"
-            body = (
-                f"Hi {contact_name},\n\n"
-                f"Your appointment has been confirmed for {date_str} at {time_str}.\n\n"
-                f"We look forward to seeing you!\n\n"
-                f"Best regards,\nCoreWebOps"
-            )
-            import asyncio
-            asyncio.run(provider.send(contact_email, subject, body))
-            logger.info(f"[EVENT] Sent booking confirmation email to {contact_email}")
-        except Exception as e:
-            logger.error(f"[EVENT] Failed to send booking email: {e}")
+
+def _handle_booking_reminder(workspace_id: int, reference_id: int, db: Session, payload: dict):
+    """Handle booking_reminder: email the contact ahead of their appointment."""
+    contact_email = payload.get("contact_email")
+    if not contact_email:
+        logger.info(f"[EVENT] booking_reminder ref={reference_id} has no contact email, skipping")
+        return
+    date_str = payload.get("date")
+    time_str = payload.get("time")
+    subject = f"Reminder: Appointment on {date_str} @ {time_str}"
+    body = (
+        f"Hi {payload.get('contact_name', 'there')},\n\n"
+        f"This is a reminder of your appointment on {date_str} at {time_str}.\n\n"
+        f"See you soon!\n\n"
+        f"Best regards,\nCoreWebOps"
+    )
+    _send_email(contact_email, subject, body)
+    logger.info(f"[EVENT] Sent booking reminder email to {contact_email}")
 
 
 def _handle_staff_replied(workspace_id: int, reference_id: int, db: Session, payload: dict):
@@ -260,8 +293,7 @@ def _handle_owner_registered(workspace_id: int, reference_id: int, db: Session,
     from app.models.user import User
     user = db.query(User).filter(User.id == reference_id).first()
     if user:
-        import asyncio
-        asyncio.run(send_owner_signup_email(user))
+        _run_async(send_owner_signup_email(user))
         logger.info(f"[EVENT] Sent owner signup email to {user.email}")
 
 
@@ -270,8 +302,7 @@ def _handle_owner_logged_in(workspace_id: int, reference_id: int, db: Session, p
     from app.models.user import User
     user = db.query(User).filter(User.id == reference_id).first()
     if user:
-        import asyncio
-        asyncio.run(send_owner_login_email(user))
+        _run_async(send_owner_login_email(user))
         logger.info(f"[EVENT] Sent owner login email to {user.email}")
 
 
@@ -283,8 +314,7 @@ def _handle_workspace_activated(workspace_id: int, reference_id: int, db: Sessio
     from app.models.user import User
     user = db.query(User).filter(User.id == reference_id).first()
     if user:
-        import asyncio
-        asyncio.run(send_workspace_welcome_email(user))
+        _run_async(send_workspace_welcome_email(user))
         logger.info(f"[EVENT] Sent workspace welcome email to {user.email}")
 
 
@@ -295,6 +325,7 @@ EVENT_HANDLERS = {
     AutomationEventType.FORM_APPROVED.value: _handle_form_approved,
     AutomationEventType.BOOKING_CREATED.value: _handle_booking_created,
     AutomationEventType.BOOKING_CONFIRMED.value: _handle_booking_confirmed,
+    AutomationEventType.BOOKING_REMINDER.value: _handle_booking_reminder,
     AutomationEventType.STAFF_REPLIED.value: _handle_staff_replied,
     AutomationEventType.OWNER_REGISTERED.value: _handle_owner_registered,
     AutomationEventType.OWNER_LOGGED_IN.value: _handle_owner_logged_in,
@@ -0,0 +1,34 @@
+"""
+Batch send helpers shared by the Email and SMS provider interfaces.
+"""
+
+import asyncio
+from typing import Awaitable, Callable, NamedTuple, Sequence, TypeVar
+
+T = TypeVar("T")
+
+
+class SendResult(NamedTuple):
+    """Outcome of one message in a batch."""
+    to: str
+    success: bool
+    error: str | None = None
+
+
+async def send_bounded(
+    messages: Sequence[T],
+    send_one: Callable[[T], Awaitable[bool]],
+    limit: int,
+) -> list[SendResult]:
+    """Run send_one over messages with at most `limit` in flight, in order."""
+    semaphore = asyncio.Semaphore(max(limit, 1))
+
+    async def _one(message) -> SendResult:
+        async with semaphore:
+            try:
+                ok = await send_one(message)
+                return SendResult(message.to, ok, None if ok else "Provider rejected message")
+            except Exception as exc:
+                return SendResult(message.to, False, str(exc))
+
+    return list(await asyncio.gather(*(_one(m) for m in messages)))
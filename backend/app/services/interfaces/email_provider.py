@@ -4,6 +4,16 @@ Abstract contract for all email providers (Mock, SMTP, SendGrid, etc.).
 """
 
 from abc import ABC, abstractmethod
+from typing import NamedTuple
+
+from app.core.config import settings
+from app.services.interfaces.batch import SendResult, send_bounded
+
+
+class OutgoingEmail(NamedTuple):
+    to: str
+    subject: str
+    body: str
 
 
 class EmailProvider(ABC):
@@ -13,6 +23,17 @@ class EmailProvider(ABC):
         """Send an email. Returns True if successful."""
         pass
 
+    async def send_batch(self, messages: list[OutgoingEmail]) -> list[SendResult]:
+        """
+        Send many emails with bounded parallelism.
+        Returns one SendResult per message, in input order. Never raises.
+        """
+        return await send_bounded(
+            messages,
+            lambda m: self.send(m.to, m.subject, m.body),
+            settings.PROVIDER_BATCH_CONCURRENCY,
+        )
+
     @abstractmethod
     async def health(self) -> bool:
         """Check provider connectivity/availability."""
@@ -4,6 +4,15 @@ Abstract contract for all SMS providers (Mock, Twilio, AWS SNS, etc.).
 """
 
 from abc import ABC, abstractmethod
+from typing import NamedTuple
+
+from app.core.config import settings
+from app.services.interfaces.batch import SendResult, send_bounded
+
+
+class OutgoingSMS(NamedTuple):
+    to: str
+    message: str
 
 
 class SMSProvider(ABC):
@@ -13,6 +22,17 @@ class SMSProvider(ABC):
         """Send an SMS. Returns True if successful."""
         pass
 
+    async def send_batch(self, messages: list[OutgoingSMS]) -> list[SendResult]:
+        """
+        Send many SMS with bounded parallelism.
+        Returns one SendResult per message, in input order. Never raises.
+        """
+        return await send_bounded(
+            messages,
+            lambda m: self.send(m.to, m.message),
+            settings.PROVIDER_BATCH_CONCURRENCY,
+        )
+
     @abstractmethod
     async def health(self) -> bool:
         """Check provider connectivity/availability."""
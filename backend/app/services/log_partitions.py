@@ -0,0 +1,231 @@
+"""
+Log Partitions – monthly partitions, retention and archival for event_logs
+and automation_logs.
+
+Both tables are range-partitioned by month on created_at (event_logs_p202610,
+...) plus a DEFAULT partition as a safety net. ensure_partitions() keeps the
+next LOG_PARTITION_PREMAKE_MONTHS months created so the default stays empty.
+
+Retention is per workspace (workspaces.log_retention_days, falling back to
+LOG_RETENTION_DAYS; rows without a workspace use the default):
+- a month older than every workspace's retention is written to
+  LOG_ARCHIVE_DIR/<table>/<YYYY-MM>.jsonl.gz, then detached and dropped,
+  so most expiry costs no DELETE and no VACUUM;
+- rows past a shorter retention, in months other workspaces still keep,
+  are deleted in batches bounded by created_at so only those partitions
+  are scanned.
+
+Read queries should bound created_at (see retention_start) so Postgres
+prunes the partitions they cannot match.
+"""
+
+import gzip
+import json
+import logging
+import os
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Iterable
+
+from sqlalchemy import func, or_, select, text
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.automation_log import AutomationLog
+from app.models.event_log import EventLog
+from app.models.workspace import Workspace
+
+logger = logging.getLogger(__name__)
+
+PARTITIONED_MODELS = (EventLog, AutomationLog)
+_UNFINISHED = ("pending", "processing")  # outbox rows that must not expire
+
+
+# ── Naming ───────────────────────────────────────────────────────
+
+def month_start(ts: date) -> date:
+    return date(ts.year, ts.month, 1)
+
+
+def add_months(month: date, n: int) -> date:
+    index = month.year * 12 + month.month - 1 + n
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table: str, month: date) -> str:
+    return f"{table}_p{month:%Y%m}"
+
+
+def partition_month(table: str, name: str) -> date | None:
+    """Month covered by a partition named by partition_name(), else None."""
+    suffix = name[len(table) + 2:]
+    if not name.startswith(f"{table}_p") or len(suffix) != 6 or not suffix.isdigit():
+        return None
+    return date(int(suffix[:4]), int(suffix[4:]), 1)
+
+
+def list_partitions(db: Session, table: str) -> dict[date, str]:
+    """Monthly partitions attached to `table`, keyed by month."""
+    names = db.execute(
+        text(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "JOIN pg_class p ON p.oid = i.inhparent "
+            "WHERE p.relname = :table"
+        ),
+        {"table": table},
+    ).scalars()
+    months = {}
+    for name in names:
+        month = partition_month(table, name)
+        if month:
+            months[month] = name
+    return months
+
+
+def ensure_partitions(db: Session, months_ahead: int = settings.LOG_PARTITION_PREMAKE_MONTHS, today: date | None = None) -> list[str]:
+    """Create this month's and the next `months_ahead` partitions. Returns new names."""
+    first = month_start(today or datetime.now(timezone.utc).date())
+    created = []
+    for model in PARTITIONED_MODELS:
+        table = model.__tablename__
+        existing = list_partitions(db, table)
+        for i in range(months_ahead + 1):
+            month = add_months(first, i)
+            if month in existing:
+                continue
+            name = partition_name(table, month)
+            db.execute(text(
+                f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {table} "
+                f"FOR VALUES FROM ('{month} 00:00:00+00') TO ('{add_months(month, 1)} 00:00:00+00')"
+            ))
+            created.append(name)
+    db.commit()
+    if created:
+        logger.info(f"[RETENTION] Created partitions {created}")
+    return created
+
+
+# ── Retention windows ────────────────────────────────────────────
+
+def retention_days(db: Session, workspace_id: int) -> int:
+    days = db.query(Workspace.log_retention_days).filter(Workspace.id == workspace_id).scalar()
+    return days or settings.LOG_RETENTION_DAYS
+
+
+def retention_start(db: Session, workspace_id: int, now: datetime | None = None) -> datetime:
+    """Oldest created_at still kept for the workspace: the lower bound for log queries."""
+    return (now or datetime.now(timezone.utc)) - timedelta(days=retention_days(db, workspace_id))
+
+
+def _retention_groups(db: Session) -> dict[int, list[int | None]]:
+    """Retention days → workspace ids using it (None = rows without a workspace)."""
+    groups: dict[int, list[int | None]] = {settings.LOG_RETENTION_DAYS: [None]}
+    rows = db.query(
+        func.coalesce(Workspace.log_retention_days, settings.LOG_RETENTION_DAYS), Workspace.id
+    ).all()
+    for days, workspace_id in rows:
+        groups.setdefault(days, []).append(workspace_id)
+    return groups
+
+
+def _delete_before(db: Session, model, cutoff: datetime, batch_size: int, *criteria) -> int:
+    total = 0
+    while True:
+        ids = select(model.id).where(model.created_at < cutoff, *criteria).limit(batch_size)
+        deleted = db.query(model).filter(
+            model.created_at < cutoff, model.id.in_(ids)
+        ).delete(synchronize_session=False)
+        db.commit()
+        total += deleted
+        if deleted < batch_size:
+            return total
+
+
+def purge_expired_rows(db: Session, now: datetime, batch_size: int = 5000) -> dict:
+    """Delete rows past a workspace's retention that partition drops won't reach yet."""
+    groups = _retention_groups(db)
+    longest = max(groups)
+    deleted = {model.__tablename__: 0 for model in PARTITIONED_MODELS}
+    for days, workspace_ids in groups.items():
+        if days >= longest:
+            continue  # expires with its partition
+        cutoff = now - timedelta(days=days)
+        for model in PARTITIONED_MODELS:
+            ids = [w for w in workspace_ids if w is not None]
+            scope = model.workspace_id.in_(ids)
+            if None in workspace_ids:
+                scope = or_(scope, model.workspace_id.is_(None))
+            criteria = [scope]
+            if model is AutomationLog:
+                criteria.append(AutomationLog.status.notin_(_UNFINISHED))
+            deleted[model.__tablename__] += _delete_before(db, model, cutoff, batch_size, *criteria)
+    return deleted
+
+
+# ── Archival ─────────────────────────────────────────────────────
+
+def _json_value(value):
+    return value.isoformat() if isinstance(value, (datetime, date)) else str(value)
+
+
+def write_jsonl_gz(path: Path, rows: Iterable[dict]) -> int:
+    """Write rows as gzip-compressed JSON lines, atomically. Returns the row count."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial = path.with_name(path.name + ".part")
+    count = 0
+    with gzip.open(partial, "wt", encoding="utf-8") as out:
+        for row in rows:
+            out.write(json.dumps(row, default=_json_value) + "\n")
+            count += 1
+    os.replace(partial, path)
+    return count
+
+
+def archive_partition(db: Session, table: str, name: str, month: date, archive_dir: str) -> int:
+    """Stream a partition to disk, then detach and drop it. Returns rows archived."""
+    path = Path(archive_dir) / table / f"{month:%Y-%m}.jsonl.gz"
+    result = db.connection().execution_options(stream_results=True, yield_per=1000).execute(
+        text(f"SELECT * FROM {name} ORDER BY id")
+    )
+    rows = write_jsonl_gz(path, (dict(row) for row in result.mappings()))
+    db.execute(text(f"ALTER TABLE {table} DETACH PARTITION {name}"))
+    db.execute(text(f"DROP TABLE {name}"))
+    db.commit()
+    logger.info(f"[RETENTION] Archived {rows} rows of {name} to {path}")
+    return rows
+
+
+def expired_months(partitions: dict[date, str], cutoff: datetime) -> list[date]:
+    """Months whose partition ends at or before `cutoff`, oldest first."""
+    return sorted(m for m in partitions if add_months(m, 1) <= cutoff.date())
+
+
+def archive_expired_partitions(db: Session, now: datetime, archive_dir: str = settings.LOG_ARCHIVE_DIR) -> dict:
+    """Archive and drop every month older than the longest retention in effect."""
+    cutoff = now - timedelta(days=max(_retention_groups(db)))
+    archived = {}
+    for model in PARTITIONED_MODELS:
+        table = model.__tablename__
+        partitions = list_partitions(db, table)
+        for month in expired_months(partitions, cutoff):
+            name = partitions[month]
+            if model is AutomationLog and db.execute(text(
+                f"SELECT 1 FROM {name} WHERE status IN ('pending', 'processing') LIMIT 1"
+            )).first():
+                logger.warning(f"[RETENTION] {name} still has undelivered outbox rows, not archiving")
+                continue
+            archived[name] = archive_partition(db, table, name, month, archive_dir)
+    return archived
+
+
+def apply_retention(db: Session, archive_dir: str = settings.LOG_ARCHIVE_DIR, now: datetime | None = None) -> dict:
+    """Premake partitions, delete per-workspace expired rows, archive expired months."""
+    now = now or datetime.now(timezone.utc)
+    summary = {
+        "partitions_created": ensure_partitions(db, today=now.date()),
+        "rows_deleted": purge_expired_rows(db, now),
+        "partitions_archived": archive_expired_partitions(db, now, archive_dir),
+    }
+    logger.info(f"[RETENTION] {summary}")
+    return summary
@@ -4,7 +4,8 @@ Safe default for local development and testing.
 """
 
 import logging
-from app.services.interfaces.email_provider import EmailProvider
+from app.services.interfaces.batch import SendResult
+from app.services.interfaces.email_provider import EmailProvider, OutgoingEmail
 
 logger = logging.getLogger(__name__)
 
@@ -15,5 +16,9 @@ class MockEmailProvider(EmailProvider):
         logger.info(f"[MOCK EMAIL] To={to}, Subject={subject}")
         return True
 
+    async def send_batch(self, messages: list[OutgoingEmail]) -> list[SendResult]:
+        logger.info(f"[MOCK EMAIL] Batch of {len(messages)}: {', '.join(m.to for m in messages)}")
+        return [SendResult(m.to, True) for m in messages]
+
     async def health(self) -> bool:
         return True
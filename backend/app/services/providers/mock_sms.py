@@ -4,7 +4,8 @@ Safe default for local development and testing.
 """
 
 import logging
-from app.services.interfaces.sms_provider import SMSProvider
+from app.services.interfaces.batch import SendResult
+from app.services.interfaces.sms_provider import SMSProvider, OutgoingSMS
 
 logger = logging.getLogger(__name__)
 
@@ -15,5 +16,9 @@ class MockSMSProvider(SMSProvider):
         logger.info(f"[MOCK SMS] To={to}, Message={message[:80]}")
         return True
 
+    async def send_batch(self, messages: list[OutgoingSMS]) -> list[SendResult]:
+        logger.info(f"[MOCK SMS] Batch of {len(messages)}: {', '.join(m.to for m in messages)}")
+        return [SendResult(m.to, True) for m in messages]
+
     async def health(self) -> bool:
         return True
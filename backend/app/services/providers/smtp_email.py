@@ -1,13 +1,14 @@
 """
 SMTP Email Provider — Phase 4.
-Production-grade email delivery via SMTP_SSL.
+Production-grade email delivery over pooled, persistent aiosmtplib
+connections (see smtp_pool.py) so sends never block the event loop.
 """
 
 import logging
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from app.services.interfaces.email_provider import EmailProvider
+from email.message import EmailMessage
+from app.services.interfaces.batch import SendResult
+from app.services.interfaces.email_provider import EmailProvider, OutgoingEmail
+from app.services.providers.smtp_pool import get_smtp_pool
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
@@ -15,29 +16,39 @@ logger = logging.getLogger(__name__)
 
 class SMTPEmailProvider(EmailProvider):
 
+    @staticmethod
+    def _build(to: str, subject: str, body: str) -> EmailMessage:
+        msg = EmailMessage()
+        msg["From"] = settings.SMTP_FROM or settings.SMTP_USER
+        msg["To"] = to
+        msg["Subject"] = subject
+        msg.set_content(body)
+        return msg
+
     async def send(self, to: str, subject: str, body: str) -> bool:
         try:
-            msg = MIMEMultipart()
-            sender = settings.SMTP_FROM or settings.SMTP_USER
-            msg["From"] = sender
-            msg["To"] = to
-            msg["Subject"] = subject
-            msg.attach(MIMEText(body, "plain"))
-
-            with smtplib.SMTP_SSL(settings.SMTP_HOST, settings.SMTP_PORT) as server:
-                server.login(settings.SMTP_USER, settings.SMTP_PASSWORD)
-                server.sendmail(settings.SMTP_USER, to, msg.as_string())
-
+            await get_smtp_pool().send(self._build(to, subject, body), sender=settings.SMTP_USER or None)
             logger.info(f"[SMTP EMAIL] Sent to {to}: {subject}")
             return True
         except Exception as exc:
             logger.error(f"[SMTP EMAIL] Failed to send to {to}: {exc}")
             return False
 
+    async def send_batch(self, messages: list[OutgoingEmail]) -> list[SendResult]:
+        """Spread the batch over the pool's warm connections."""
+        errors = await get_smtp_pool().send_many(
+            [self._build(m.to, m.subject, m.body) for m in messages],
+            sender=settings.SMTP_USER or None,
+        )
+        results = [SendResult(m.to, err is None, str(err) if err else None) for m, err in zip(messages, errors)]
+        failed = [r for r in results if not r.success]
+        logger.info(f"[SMTP EMAIL] Batch sent {len(results) - len(failed)}/{len(results)}")
+        for r in failed:
+            logger.error(f"[SMTP EMAIL] Failed to send to {r.to}: {r.error}")
+        return results
+
     async def health(self) -> bool:
         try:
-            with smtplib.SMTP_SSL(settings.SMTP_HOST, settings.SMTP_PORT, timeout=5) as server:
-                server.noop()
-            return True
+            return await get_smtp_pool().health()
         except Exception:
             return False
@@ -0,0 +1,196 @@
+"""
+SMTP Connection Pool — persistent, authenticated aiosmtplib connections.
+
+Connections are opened (TLS handshake + login) once and reused across sends.
+At most `size` connections are in use at a time; idle connections older than
+`idle_timeout` are dropped before reuse, since servers close them silently,
+and a send that hits a dropped connection is retried once on a fresh one.
+
+asyncio connections belong to the event loop that opened them, so the pool
+keeps separate connection sets per running loop. Reuse across calls needs a
+long-lived loop; a throwaway asyncio.run() loop only reuses within that call.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+import weakref
+from email.message import EmailMessage
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class _LoopPool:
+    """Idle connections and the concurrency bound for one event loop."""
+
+    def __init__(self, size: int):
+        self.semaphore = asyncio.Semaphore(size)
+        self.idle: list[tuple[object, float]] = []  # (connection, last_used)
+
+
+class SMTPConnectionPool:
+    """Bounded pool of reusable SMTP sessions."""
+
+    def __init__(
+        self,
+        hostname: str,
+        port: int,
+        username: str = "",
+        password: str = "",
+        use_tls: bool = True,
+        size: int = 4,
+        idle_timeout: float = 60.0,
+        timeout: float = 10.0,
+    ):
+        try:
+            import aiosmtplib
+        except ImportError as exc:
+            raise RuntimeError("EMAIL_PROVIDER=smtp requires the 'aiosmtplib' package") from exc
+        self._smtp = aiosmtplib
+        self._hostname = hostname
+        self._port = port
+        self._username = username or None
+        self._password = password or None
+        self._use_tls = use_tls
+        self._size = size
+        self._idle_timeout = idle_timeout
+        self._timeout = timeout
+        self._pools: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopPool]" = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self._opened = 0
+        self._reused = 0
+        self._reconnects = 0
+
+    def _loop_pool(self) -> _LoopPool:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            pool = self._pools.get(loop)
+            if pool is None:
+                pool = self._pools[loop] = _LoopPool(self._size)
+            return pool
+
+    async def _connect(self):
+        conn = self._smtp.SMTP(
+            hostname=self._hostname,
+            port=self._port,
+            username=self._username,
+            password=self._password,
+            use_tls=self._use_tls,
+            timeout=self._timeout,
+        )
+        await conn.connect()  # also STARTTLS (when offered) and login
+        with self._lock:
+            self._opened += 1
+        return conn
+
+    @staticmethod
+    def _discard(conn):
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    async def _checkout(self, pool: _LoopPool):
+        """Most recently used live connection, or a new one."""
+        now = time.monotonic()
+        while pool.idle:
+            conn, last_used = pool.idle.pop()
+            if conn.is_connected and now - last_used < self._idle_timeout:
+                with self._lock:
+                    self._reused += 1
+                return conn
+            self._discard(conn)
+        return await self._connect()
+
+    async def send(self, message: EmailMessage, sender: str | None = None) -> None:
+        """Send one message on a pooled connection. Raises on failure."""
+        pool = self._loop_pool()
+        async with pool.semaphore:
+            conn = await self._checkout(pool)
+            try:
+                try:
+                    await conn.send_message(message, sender=sender)
+                except (self._smtp.SMTPServerDisconnected, ConnectionError):
+                    # Server dropped an idle session under us: retry once
+                    logger.info("[SMTP POOL] Connection dropped by server, reconnecting")
+                    self._discard(conn)
+                    with self._lock:
+                        self._reconnects += 1
+                    conn = await self._connect()
+                    await conn.send_message(message, sender=sender)
+            except BaseException:
+                # Includes cancellation: a half-sent session is never reused
+                self._discard(conn)
+                raise
+            pool.idle.append((conn, time.monotonic()))
+
+    async def send_many(self, messages: list[EmailMessage], sender: str | None = None) -> list[Exception | None]:
+        """
+        Send many messages over at most `size` warm connections.
+        Returns one entry per message: None on success, else the error.
+        """
+        async def _one(message):
+            try:
+                await self.send(message, sender=sender)
+                return None
+            except Exception as exc:
+                return exc
+
+        return await asyncio.gather(*(_one(m) for m in messages))
+
+    async def health(self) -> bool:
+        pool = self._loop_pool()
+        async with pool.semaphore:
+            try:
+                conn = await self._checkout(pool)
+                await conn.noop()
+            except Exception:
+                return False
+            pool.idle.append((conn, time.monotonic()))
+            return True
+
+    async def close(self):
+        """Politely close this loop's idle connections."""
+        pool = self._loop_pool()
+        while pool.idle:
+            conn, _ = pool.idle.pop()
+            try:
+                await conn.quit()
+            except Exception:
+                self._discard(conn)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "size": self._size,
+                "idle": sum(len(p.idle) for p in self._pools.values()),
+                "opened": self._opened,
+                "reused": self._reused,
+                "reconnects": self._reconnects,
+            }
+
+
+# ── Singleton instance ────────────────────────────────────────────
+_pool: SMTPConnectionPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_smtp_pool() -> SMTPConnectionPool:
+    """Process-wide pool built from the SMTP_* settings."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = SMTPConnectionPool(
+                hostname=settings.SMTP_HOST,
+                port=settings.SMTP_PORT,
+                username=settings.SMTP_USER,
+                password=settings.SMTP_PASSWORD,
+                use_tls=settings.SMTP_USE_SSL,
+                size=settings.SMTP_POOL_SIZE,
+                idle_timeout=settings.SMTP_IDLE_TIMEOUT,
+                timeout=settings.SMTP_TIMEOUT,
+            )
+        return _pool
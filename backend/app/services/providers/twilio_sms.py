@@ -4,7 +4,8 @@ Future-ready stub. Activate by setting TWILIO_SID in environment.
 """
 
 import logging
-from app.services.interfaces.sms_provider import SMSProvider
+from app.services.interfaces.batch import SendResult
+from app.services.interfaces.sms_provider import SMSProvider, OutgoingSMS
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
@@ -27,5 +28,14 @@ class TwilioSMSProvider(SMSProvider):
             logger.error(f"[TWILIO SMS] Failed: {exc}")
             return False
 
+    async def send_batch(self, messages: list[OutgoingSMS]) -> list[SendResult]:
+        if not settings.TWILIO_SID:
+            logger.warning("[TWILIO SMS] Not configured — TWILIO_SID is empty")
+            return [SendResult(m.to, False, "Twilio not configured") for m in messages]
+        # Twilio has no multi-recipient message API; fan out with bounded parallelism
+        results = await super().send_batch(messages)
+        logger.info(f"[TWILIO SMS] Batch sent {sum(r.success for r in results)}/{len(results)}")
+        return results
+
     async def health(self) -> bool:
         return bool(settings.TWILIO_SID)
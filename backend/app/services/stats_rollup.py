@@ -0,0 +1,158 @@
+"""
+Stats Rollup Service – incremental maintenance of workspace_daily_stats.
+
+Write paths call the record_*() helpers inside their own transaction, so a
+rollup row changes atomically with the entity it counts. Each helper is a
+single INSERT ... ON CONFLICT DO UPDATE that adds deltas to the (workspace,
+day) row. rebuild_daily_stats() recomputes rows from the raw tables and is
+used by the backfill job to repair drift.
+"""
+
+import logging
+from datetime import date, datetime, timezone
+
+from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.models.workspace_daily_stats import WorkspaceDailyStats
+from app.utils.enums import BookingStatus
+
+logger = logging.getLogger(__name__)
+
+
+def _today() -> date:
+    return datetime.now(timezone.utc).date()
+
+
+def _day_of(ts: datetime | None) -> date:
+    """UTC calendar day of a timestamp; unflushed rows default to today."""
+    if ts is None:
+        return _today()
+    if ts.tzinfo is not None:
+        ts = ts.astimezone(timezone.utc)
+    return ts.date()
+
+
+def _status_column(status: BookingStatus | str) -> str:
+    return f"bookings_{BookingStatus(status).value}"
+
+
+def _bump(db: Session, workspace_id: int, day: date, **deltas: int) -> None:
+    """Add deltas to the (workspace_id, day) row, creating it if missing."""
+    stmt = pg_insert(WorkspaceDailyStats).values(workspace_id=workspace_id, day=day, **deltas)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["workspace_id", "day"],
+        set_={
+            **{col: getattr(WorkspaceDailyStats, col) + stmt.excluded[col] for col in deltas},
+            "updated_at": datetime.now(timezone.utc),
+        },
+    )
+    db.execute(stmt)
+
+
+# ── Write-path hooks ─────────────────────────────────────────────
+
+def record_contact_created(db: Session, workspace_id: int, count: int = 1) -> None:
+    """A contact (or `count` imported contacts) was created today."""
+    _bump(db, workspace_id, _today(), new_contacts=count)
+
+
+def record_contact_deleted(db: Session, contact) -> None:
+    """A contact was soft-deleted; it no longer counts on its creation day."""
+    _bump(db, contact.workspace_id, _day_of(contact.created_at), new_contacts=-1)
+
+
+def record_booking_created(db: Session, booking) -> None:
+    """A booking was created today with its initial status."""
+    _bump(db, booking.workspace_id, _today(), bookings_created=1, **{_status_column(booking.status): 1})
+
+
+def record_booking_status_change(db: Session, booking, old_status: BookingStatus) -> None:
+    """Move a booking between status buckets on its creation day."""
+    if BookingStatus(old_status) == BookingStatus(booking.status):
+        return
+    _bump(
+        db,
+        booking.workspace_id,
+        _day_of(booking.created_at),
+        **{_status_column(old_status): -1, _status_column(booking.status): 1},
+    )
+
+
+def record_submission(db: Session, workspace_id: int) -> None:
+    """A form submission was received today."""
+    _bump(db, workspace_id, _today(), submissions=1)
+
+
+def record_alert(db: Session, workspace_id: int, count: int = 1) -> None:
+    """An alert (or `count` alerts) was raised today."""
+    _bump(db, workspace_id, _today(), alerts=count)
+
+
+# ── Reads ────────────────────────────────────────────────────────
+
+def get_daily_stats(db: Session, workspace_id: int, since: date) -> list[WorkspaceDailyStats]:
+    """Rollup rows for a workspace from `since` (inclusive), oldest first."""
+    return (
+        db.query(WorkspaceDailyStats)
+        .filter(
+            WorkspaceDailyStats.workspace_id == workspace_id,
+            WorkspaceDailyStats.day >= since,
+        )
+        .order_by(WorkspaceDailyStats.day)
+        .all()
+    )
+
+
+# ── Backfill ─────────────────────────────────────────────────────
+
+_STATUS_SUMS = ",\n".join(
+    f"            (status::text = '{st.name}')::int AS bookings_{st.value}" for st in BookingStatus
+)
+_STATUS_COLS = [f"bookings_{st.value}" for st in BookingStatus]
+_ZERO_STATUS = ", ".join(f"0 AS {c}" for c in _STATUS_COLS)
+_ALL_COLS = ["new_contacts", "bookings_created", *_STATUS_COLS, "submissions", "alerts"]
+
+REBUILD_SQL = f"""
+    INSERT INTO workspace_daily_stats (workspace_id, day, {", ".join(_ALL_COLS)}, updated_at)
+    SELECT workspace_id, day, {", ".join(f"SUM({c})" for c in _ALL_COLS)}, now()
+    FROM (
+        SELECT workspace_id, (created_at AT TIME ZONE 'UTC')::date AS day,
+            1 AS new_contacts, 0 AS bookings_created, {_ZERO_STATUS}, 0 AS submissions, 0 AS alerts
+        FROM contacts WHERE is_deleted = false
+        UNION ALL
+        SELECT workspace_id, (created_at AT TIME ZONE 'UTC')::date,
+            0, 1,
+{_STATUS_SUMS},
+            0, 0
+        FROM bookings
+        UNION ALL
+        SELECT workspace_id, (created_at AT TIME ZONE 'UTC')::date,
+            0, 0, {_ZERO_STATUS}, 1, 0
+        FROM form_submissions
+        UNION ALL
+        SELECT workspace_id, (created_at AT TIME ZONE 'UTC')::date,
+            0, 0, {_ZERO_STATUS}, 0, 1
+        FROM alerts
+    ) src
+    WHERE (CAST(:workspace_id AS integer) IS NULL OR workspace_id = :workspace_id)
+    GROUP BY workspace_id, day
+"""
+
+
+def rebuild_daily_stats(db: Session, workspace_id: int | None = None) -> int:
+    """
+    Recompute rollup rows from the raw tables (one workspace, or all).
+    Runs in the caller's transaction; caller commits. Returns rows written.
+    """
+    params = {"workspace_id": workspace_id}
+    db.execute(
+        text("DELETE FROM workspace_daily_stats "
+             "WHERE CAST(:workspace_id AS integer) IS NULL OR workspace_id = :workspace_id"),
+        params,
+    )
+    result = db.execute(text(REBUILD_SQL), params)
+    scope = f"workspace {workspace_id}" if workspace_id else "all workspaces"
+    logger.info(f"[ROLLUP] Rebuilt {result.rowcount} daily stat rows for {scope}")
+    return result.rowcount
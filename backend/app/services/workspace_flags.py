@@ -0,0 +1,66 @@
+"""
+Workspace Flags – persisted rule toggles and feature flags with a
+per-process read-through cache.
+
+All of a workspace's flags load in one query on first use and are served
+from memory afterwards. Reads recheck the workspace's shared version counter
+(a primary-key lookup, or one Redis GET) at most every CACHE_VERSION_TTL
+seconds, so an automation event checking many rules and actions costs at
+most one lookup. set_flag() commits and then bumps the counter: this worker
+reloads immediately, the others within CACHE_VERSION_TTL.
+"""
+
+import logging
+from datetime import datetime, timezone
+
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.core.cache import VersionedLocalCache, get_version_backend
+from app.core.database import SessionLocal
+from app.models.workspace_flag import WorkspaceFlag
+
+logger = logging.getLogger(__name__)
+
+RULE = "rule"
+FEATURE = "feature"
+
+# Version stamps live in Redis or the database, never in one worker's memory
+_cache = VersionedLocalCache("flags", backend=get_version_backend())
+
+
+def _load(workspace_id: int) -> dict[tuple[str, str], bool]:
+    db = SessionLocal()
+    try:
+        rows = db.query(WorkspaceFlag.kind, WorkspaceFlag.key, WorkspaceFlag.enabled).filter(
+            WorkspaceFlag.workspace_id == workspace_id
+        ).all()
+        return {(kind, key): enabled for kind, key, enabled in rows}
+    finally:
+        db.close()
+
+
+def get_flags(workspace_id: int) -> dict[tuple[str, str], bool]:
+    """Explicitly set flags for a workspace: {(kind, key): enabled}."""
+    return _cache.get(workspace_id, lambda: _load(workspace_id))
+
+
+def is_rule_enabled(workspace_id: int, rule_key: str) -> bool:
+    return get_flags(workspace_id).get((RULE, rule_key), True)  # default: enabled
+
+
+def is_feature_enabled(workspace_id: int, feature: str) -> bool:
+    return get_flags(workspace_id).get((FEATURE, feature), True)  # default: enabled
+
+
+def set_flag(db: Session, workspace_id: int, kind: str, key: str, enabled: bool) -> None:
+    """Persist a flag, commit, and invalidate every process's cached copy."""
+    stmt = pg_insert(WorkspaceFlag).values(workspace_id=workspace_id, kind=kind, key=key, enabled=enabled)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["workspace_id", "kind", "key"],
+        set_={"enabled": enabled, "updated_at": datetime.now(timezone.utc)},
+    )
+    db.execute(stmt)
+    db.commit()
+    _cache.bump(workspace_id)
+    logger.info(f"[FLAGS] Workspace {workspace_id} {kind}:{key} -> {'on' if enabled else 'off'}")
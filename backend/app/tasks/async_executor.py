@@ -0,0 +1,175 @@
+"""
+Async Executor – one long-lived event loop for running coroutines from sync code.
+
+Sync call sites (outbox handlers, sync FastAPI routes running in the
+threadpool) hand coroutines to a single background loop instead of building
+and tearing down a loop per call with asyncio.run(). Loop-bound resources
+such as the pooled SMTP connections therefore survive between sends.
+
+At most ASYNC_EXECUTOR_MAX_PENDING coroutines may be queued or running.
+When full, submit() blocks for up to ASYNC_EXECUTOR_SUBMIT_TIMEOUT seconds
+and then raises ExecutorBusyError, so producers slow down instead of
+growing an unbounded backlog. stats() reports queue depth and wait times.
+"""
+
+import asyncio
+import concurrent.futures
+import logging
+import threading
+import time
+from typing import Any, Coroutine
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class ExecutorBusyError(RuntimeError):
+    """The executor queue stayed full for the whole submit timeout."""
+
+
+class AsyncExecutor:
+    """Background thread that owns an event loop and runs submitted coroutines."""
+
+    def __init__(
+        self,
+        max_pending: int = settings.ASYNC_EXECUTOR_MAX_PENDING,
+        submit_timeout: float = settings.ASYNC_EXECUTOR_SUBMIT_TIMEOUT,
+    ):
+        self._max_pending = max(1, max_pending)
+        self._submit_timeout = submit_timeout
+        self._slots = threading.BoundedSemaphore(self._max_pending)
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._pending = 0
+        self._peak_pending = 0
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+        self._waited = 0
+        self._wait_seconds = 0.0
+
+    # ── Lifecycle ─────────────────────────────────────────────────
+
+    def start(self):
+        """Start the loop thread (idempotent)."""
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return
+            loop = asyncio.new_event_loop()
+            ready = threading.Event()
+
+            def _run():
+                asyncio.set_event_loop(loop)
+                loop.call_soon(ready.set)
+                loop.run_forever()
+                loop.close()
+
+            self._loop = loop
+            self._thread = threading.Thread(target=_run, name="async-executor", daemon=True)
+            self._thread.start()
+            ready.wait()
+        logger.info(f"[EXECUTOR] Started, max {self._max_pending} pending")
+
+    def stop(self, timeout: float = 10.0):
+        """Let in-flight coroutines finish (up to `timeout`), then stop the loop."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if not loop or not thread:
+            return
+
+        async def _drain():
+            tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+            if tasks:
+                _, still_running = await asyncio.wait(tasks, timeout=timeout)
+                for task in still_running:
+                    task.cancel()
+                if still_running:
+                    logger.warning(f"[EXECUTOR] Cancelled {len(still_running)} task(s) at shutdown")
+
+        try:
+            asyncio.run_coroutine_threadsafe(_drain(), loop).result(timeout + 1)
+        except Exception as e:
+            logger.error(f"[EXECUTOR] Drain failed: {e}")
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout)
+        logger.info("[EXECUTOR] Stopped")
+
+    # ── Submission ────────────────────────────────────────────────
+
+    def submit(self, coro: Coroutine) -> concurrent.futures.Future:
+        """
+        Schedule `coro` on the executor loop from any thread.
+        Blocks while the queue is full; raises ExecutorBusyError on timeout.
+        """
+        if self._thread is None or not self._thread.is_alive():
+            self.start()
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError("submit() called from the executor loop; await the coroutine instead")
+
+        if not self._slots.acquire(blocking=False):
+            started = time.monotonic()
+            acquired = self._slots.acquire(timeout=self._submit_timeout)
+            with self._lock:
+                self._waited += 1
+                self._wait_seconds += time.monotonic() - started
+                if not acquired:
+                    self._rejected += 1
+            if not acquired:
+                coro.close()
+                raise ExecutorBusyError(f"Async executor queue full ({self._max_pending} pending)")
+
+        with self._lock:
+            self._submitted += 1
+            self._pending += 1
+            self._peak_pending = max(self._peak_pending, self._pending)
+
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        future.add_done_callback(self._on_done)
+        return future
+
+    def run(self, coro: Coroutine, timeout: float | None = None) -> Any:
+        """
+        Submit `coro` and block until it returns (re-raising its exception).
+        On timeout the coroutine is cancelled before TimeoutError is raised,
+        so a caller that retries never races its own first attempt.
+        """
+        future = self.submit(coro)
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise
+
+    def _on_done(self, future: concurrent.futures.Future):
+        self._slots.release()
+        with self._lock:
+            self._pending -= 1
+            if future.cancelled() or future.exception() is not None:
+                self._failed += 1
+            else:
+                self._completed += 1
+
+    def stats(self) -> dict:
+        """Queue depth and backpressure counters for this process."""
+        with self._lock:
+            return {
+                "running": bool(self._thread and self._thread.is_alive()),
+                "pending": self._pending,
+                "max_pending": self._max_pending,
+                "peak_pending": self._peak_pending,
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "failed": self._failed,
+                "rejected": self._rejected,
+                "submit_waits": self._waited,
+                "submit_wait_ms_total": int(self._wait_seconds * 1000),
+            }
+
+
+# ── Singleton instance ────────────────────────────────────────────
+async_executor = AsyncExecutor()
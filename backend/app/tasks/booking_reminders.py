@@ -0,0 +1,94 @@
+"""
+Booking Reminders – enqueues a reminder for confirmed bookings starting soon.
+
+Each booking is reminded once: its "booking_reminder:<id>" key is claimed in
+automation_idempotency in the same transaction as the outbox event, so
+overlapping scans never send twice. The email goes out via the outbox.
+
+Usage:
+    python -m app.tasks.booking_reminders
+"""
+
+import logging
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import and_, func
+from sqlalchemy.orm import Session, joinedload
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+import app.models  # noqa: F401  (register all mappers)
+from app.models.automation_idempotency import AutomationIdempotency
+from app.models.booking import Booking
+from app.services.automation_idempotency import claim_key
+from app.services.event_dispatcher import dispatch_event
+from app.utils.enums import AutomationEventType, BookingStatus
+
+logger = logging.getLogger(__name__)
+
+REMINDER_KEY_PREFIX = "booking_reminder"
+
+
+def queue_booking_reminders(db: Session, now: datetime | None = None, lead_hours: int = settings.BOOKING_REMINDER_LEAD_HOURS) -> int:
+    """Enqueue reminders for bookings starting within `lead_hours` (caller commits)."""
+    now = now or datetime.now(timezone.utc)
+    already_claimed = (
+        db.query(AutomationIdempotency.unique_key)
+        .filter(and_(
+            AutomationIdempotency.workspace_id == Booking.workspace_id,
+            AutomationIdempotency.unique_key == func.concat(f"{REMINDER_KEY_PREFIX}:", Booking.id),
+        ))
+        .exists()
+    )
+    bookings = (
+        db.query(Booking)
+        .options(joinedload(Booking.contact))
+        .filter(
+            Booking.status == BookingStatus.CONFIRMED,
+            Booking.start_time > now,
+            Booking.start_time <= now + timedelta(hours=lead_hours),
+            ~already_claimed,
+        )
+        .all()
+    )
+
+    queued = 0
+    for booking in bookings:
+        if not claim_key(db, booking.workspace_id, f"{REMINDER_KEY_PREFIX}:{booking.id}", REMINDER_KEY_PREFIX):
+            continue
+        dispatch_event(
+            workspace_id=booking.workspace_id,
+            event_type=AutomationEventType.BOOKING_REMINDER.value,
+            reference_id=booking.id,
+            db=db,
+            payload={
+                "contact_email": booking.contact.email if booking.contact else None,
+                "contact_name": booking.contact.name if booking.contact else "there",
+                "date": booking.start_time.strftime("%Y-%m-%d"),
+                "time": booking.start_time.strftime("%H:%M"),
+                "booking_title": booking.title,
+            },
+        )
+        queued += 1
+    return queued
+
+
+def run_booking_reminders() -> int:
+    """Queue due reminders in one transaction. Returns how many were queued."""
+    db = SessionLocal()
+    try:
+        queued = queue_booking_reminders(db)
+        db.commit()
+        if queued:
+            logger.info(f"[REMINDERS] Queued {queued} booking reminder(s)")
+        return queued
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    print(f"Queued {run_booking_reminders()} booking reminders")
@@ -0,0 +1,31 @@
+"""
+Idempotency Sweeper – deletes expired automation_idempotency keys.
+
+Usage:
+    python -m app.tasks.idempotency_sweeper
+"""
+
+import logging
+
+from app.core.database import SessionLocal
+import app.models  # noqa: F401  (register all mappers)
+from app.services.automation_idempotency import sweep_expired_keys
+
+logger = logging.getLogger(__name__)
+
+
+def run_sweep() -> int:
+    """Sweep expired keys. Returns the number of rows deleted."""
+    db = SessionLocal()
+    try:
+        return sweep_expired_keys(db)
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    print(f"Deleted {run_sweep()} expired idempotency keys")
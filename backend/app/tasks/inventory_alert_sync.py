@@ -0,0 +1,46 @@
+"""
+Inventory Alert Sync – reconciles low-stock alerts for every workspace.
+
+Usage:
+    python -m app.tasks.inventory_alert_sync
+"""
+
+import logging
+
+from app.core.database import SessionLocal
+import app.models  # noqa: F401  (register all mappers)
+from app.models.inventory import InventoryItem
+from app.services.alert_service import sync_workspace_inventory_alerts
+
+logger = logging.getLogger(__name__)
+
+
+def run_inventory_sync() -> dict:
+    """Sync each workspace with thresholded items, committing per workspace."""
+    db = SessionLocal()
+    try:
+        workspace_ids = [
+            ws_id for (ws_id,) in db.query(InventoryItem.workspace_id)
+            .filter(
+                InventoryItem.is_deleted == False,
+                InventoryItem.low_stock_threshold.isnot(None),
+            )
+            .distinct()
+        ]
+        totals = {"workspaces": len(workspace_ids), "created": 0, "dismissed": 0, "deduplicated": 0}
+        for workspace_id in workspace_ids:
+            diff = sync_workspace_inventory_alerts(db, workspace_id)
+            db.commit()
+            for key in ("created", "dismissed", "deduplicated"):
+                totals[key] += diff[key]
+        return totals
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    print(run_inventory_sync())
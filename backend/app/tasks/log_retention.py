@@ -0,0 +1,39 @@
+"""
+Log Retention – partition upkeep, per-workspace retention and archival for
+event_logs and automation_logs (see services/log_partitions.py).
+Outbox rows still pending or processing are never touched.
+
+Usage:
+    python -m app.tasks.log_retention
+    python -m app.tasks.log_retention --archive-dir /var/lib/cwo/archive
+"""
+
+import argparse
+import logging
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+import app.models  # noqa: F401  (register all mappers)
+from app.services.log_partitions import apply_retention
+
+logger = logging.getLogger(__name__)
+
+
+def run_log_retention(archive_dir: str = settings.LOG_ARCHIVE_DIR) -> dict:
+    """Apply the retention policy. Returns what was created, deleted and archived."""
+    db = SessionLocal()
+    try:
+        return apply_retention(db, archive_dir)
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="Apply event/automation log retention")
+    parser.add_argument("--archive-dir", default=settings.LOG_ARCHIVE_DIR, help="Where expired partitions are written")
+    args = parser.parse_args()
+    print(run_log_retention(args.archive_dir))
@@ -0,0 +1,139 @@
+"""
+Outbox Worker – drains pending automation events from automation_logs.
+
+A small pool of threads per process claims due rows with
+SELECT ... FOR UPDATE SKIP LOCKED (so gunicorn workers never process the
+same event twice) and hands each one to event_dispatcher.process_event().
+Rows left in "processing" by a crashed worker are reclaimed after
+OUTBOX_LOCK_TIMEOUT, so queued events survive restarts.
+"""
+
+import logging
+import threading
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import and_, event, or_
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.automation_log import AutomationLog
+from app.services.event_dispatcher import process_event
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxWorker:
+    """Thread pool that polls the outbox and processes events in batches."""
+
+    def __init__(
+        self,
+        workers: int = settings.OUTBOX_WORKERS,
+        batch_size: int = settings.OUTBOX_BATCH_SIZE,
+        poll_interval: float = settings.OUTBOX_POLL_INTERVAL,
+    ):
+        self._workers = max(1, workers)
+        self._batch_size = batch_size
+        self._poll_interval = poll_interval
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._threads: list[threading.Thread] = []
+
+    def start(self):
+        """Start the worker threads (idempotent)."""
+        if self._threads:
+            return
+        self._stopping.clear()
+        for i in range(self._workers):
+            thread = threading.Thread(target=self._run, name=f"outbox-worker-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        logger.info(f"[OUTBOX] Started {self._workers} worker(s), batch size {self._batch_size}")
+
+    def stop(self, timeout: float = 10.0):
+        """Signal all threads to finish their current batch and exit."""
+        self._stopping.set()
+        self._wakeup.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+        logger.info("[OUTBOX] Stopped")
+
+    def notify(self):
+        """Wake idle workers immediately (called after an enqueueing commit)."""
+        self._wakeup.set()
+
+    def _run(self):
+        while not self._stopping.is_set():
+            try:
+                processed = self.drain_once()
+            except Exception as e:
+                logger.error(f"[OUTBOX] Drain failed: {e}")
+                processed = 0
+
+            # Full batch → keep draining; otherwise sleep until poll or notify
+            if processed < self._batch_size:
+                self._wakeup.wait(self._poll_interval)
+                self._wakeup.clear()
+
+    def drain_once(self) -> int:
+        """Claim and process one batch. Returns the number of rows handled."""
+        db = SessionLocal()
+        try:
+            batch = self._claim_batch(db)
+            for log in batch:
+                try:
+                    process_event(log, db)
+                except Exception as e:
+                    # process_event already records handler failures; this only
+                    # catches DB errors while saving the outcome. The row stays
+                    # "processing" and is reclaimed after OUTBOX_LOCK_TIMEOUT.
+                    db.rollback()
+                    logger.error(f"[OUTBOX] Could not record outcome for log {log.id}: {e}")
+            return len(batch)
+        finally:
+            db.close()
+
+    def _claim_batch(self, db: Session) -> list[AutomationLog]:
+        now = datetime.now(timezone.utc)
+        stale_before = now - timedelta(seconds=settings.OUTBOX_LOCK_TIMEOUT)
+
+        batch = (
+            db.query(AutomationLog)
+            .filter(
+                or_(
+                    and_(
+                        AutomationLog.status == "pending",
+                        or_(
+                            AutomationLog.next_attempt_at.is_(None),
+                            AutomationLog.next_attempt_at <= now,
+                        ),
+                    ),
+                    and_(
+                        AutomationLog.status == "processing",
+                        AutomationLog.locked_at < stale_before,
+                    ),
+                )
+            )
+            .order_by(AutomationLog.id)
+            .limit(self._batch_size)
+            .with_for_update(skip_locked=True)
+            .all()
+        )
+        for log in batch:
+            log.status = "processing"
+            log.locked_at = now
+            log.attempts = (log.attempts or 0) + 1
+        db.commit()
+        return batch
+
+
+# ── Singleton instance ────────────────────────────────────────────
+outbox_worker = OutboxWorker()
+
+
+@event.listens_for(SessionLocal, "after_commit")
+def _wake_outbox_on_commit(session: Session):
+    """dispatch_event() flags the session; wake the pool once it commits."""
+    if session.info.pop("outbox_dirty", False):
+        outbox_worker.notify()
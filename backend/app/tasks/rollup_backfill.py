@@ -0,0 +1,38 @@
+"""
+Rollup Backfill – rebuilds workspace_daily_stats from the raw tables.
+
+Usage:
+    python -m app.tasks.rollup_backfill               # all workspaces
+    python -m app.tasks.rollup_backfill --workspace 3
+"""
+
+import argparse
+import logging
+
+from app.core.database import SessionLocal
+import app.models  # noqa: F401  (register all mappers)
+from app.services.stats_rollup import rebuild_daily_stats
+
+logger = logging.getLogger(__name__)
+
+
+def run_backfill(workspace_id: int | None = None) -> int:
+    """Rebuild rollups in one transaction. Returns the number of rows written."""
+    db = SessionLocal()
+    try:
+        rows = rebuild_daily_stats(db, workspace_id)
+        db.commit()
+        return rows
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="Rebuild workspace_daily_stats rollups")
+    parser.add_argument("--workspace", type=int, default=None, help="Only rebuild this workspace")
+    args = parser.parse_args()
+    print(f"Rebuilt {run_backfill(args.workspace)} rollup rows")
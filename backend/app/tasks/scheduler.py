@@ -1,4 +1,380 @@
-"""Scheduler – stub for Phase 3."""
+"""
+Scheduler – periodic jobs run by one elected worker.
 
+Every process runs the scheduler loop, but only the one holding the Postgres
+session-level advisory lock SCHEDULER_LOCK_KEY is leader and runs jobs. The
+others retry the lock every tick, so if the leader dies (its connection and
+therefore its lock go away) another worker takes over within a tick.
 
-# Scheduled task support will be added in Phase 3.
+Jobs fire on a fixed interval or a 5-field cron expression (UTC). Each next
+run is pushed back by up to `jitter` seconds so jobs don't all fire in the
+same tick. A job already running `max_concurrency` times is skipped for that
+slot rather than queued. Every run and skip is recorded in event_logs as a
+"scheduled_job" row without a workspace.
+"""
+
+import json
+import logging
+import random
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable
+
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.core.database import SessionLocal, engine
+from app.models.event_log import EventLog
+
+logger = logging.getLogger(__name__)
+
+SCHEDULER_LOCK_KEY = zlib.crc32(b"core-web-ops:scheduler")
+SCHEDULED_JOB_EVENT = "scheduled_job"
+
+
+# ── Schedules ────────────────────────────────────────────────────
+
+class CronSchedule:
+    """Minimal 5-field cron: minute hour day-of-month month day-of-week (UTC)."""
+
+    _RANGES = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 7))
+
+    def __init__(self, expression: str):
+        fields = expression.split()
+        if len(fields) != 5:
+            raise ValueError(f"Cron expression {expression!r} must have 5 fields")
+        self.expression = expression
+        self.minutes, self.hours, self.days, self.months, weekdays = (
+            self._parse(field, lo, hi) for field, (lo, hi) in zip(fields, self._RANGES)
+        )
+        self.weekdays = frozenset(d % 7 for d in weekdays)  # 0 and 7 are both Sunday
+        self._any_day = fields[2] == "*"
+        self._any_weekday = fields[4] == "*"
+
+    @staticmethod
+    def _parse(field: str, lo: int, hi: int) -> frozenset[int]:
+        values = set()
+        for part in field.split(","):
+            step = 1
+            if "/" in part:
+                part, raw_step = part.split("/", 1)
+                step = int(raw_step)
+                if step < 1:
+                    raise ValueError(f"Invalid cron step in {field!r}")
+            if part == "*":
+                start, end = lo, hi
+            elif "-" in part:
+                start, end = (int(v) for v in part.split("-", 1))
+            else:
+                start = int(part)
+                end = hi if step > 1 else start  # "5/15" runs from 5 to the end
+            if start < lo or end > hi or start > end:
+                raise ValueError(f"Cron field {field!r} outside {lo}-{hi}")
+            values.update(range(start, end + 1, step))
+        return frozenset(values)
+
+    def _day_matches(self, dt: datetime) -> bool:
+        dom = dt.day in self.days
+        dow = (dt.weekday() + 1) % 7 in self.weekdays  # cron counts from Sunday
+        if self._any_day:
+            return dow
+        if self._any_weekday:
+            return dom
+        return dom or dow  # both restricted: either may match, as in cron
+
+    def next_after(self, dt: datetime) -> datetime:
+        """First matching minute strictly after `dt`."""
+        t = dt.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        for _ in range(100_000):
+            if t.month not in self.months:
+                t = (t.replace(day=1, hour=0, minute=0) + timedelta(days=32)).replace(day=1)
+            elif not self._day_matches(t):
+                t = t.replace(hour=0, minute=0) + timedelta(days=1)
+            elif t.hour not in self.hours:
+                t = t.replace(minute=0) + timedelta(hours=1)
+            elif t.minute not in self.minutes:
+                t += timedelta(minutes=1)
+            else:
+                return t
+        raise ValueError(f"Cron expression {self.expression!r} never fires")
+
+
+class Job:
+    """A registered job and its run state in this process."""
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable[[], Any],
+        interval: float | None = None,
+        cron: str | None = None,
+        jitter: float = 0.0,
+        max_concurrency: int = 1,
+    ):
+        if (interval is None) == (cron is None):
+            raise ValueError(f"Job {name!r} needs exactly one of interval or cron")
+        self.name = name
+        self.func = func
+        self.interval = interval
+        self.cron = CronSchedule(cron) if cron else None
+        self.jitter = jitter
+        self.max_concurrency = max(1, max_concurrency)
+        self.running = 0
+        self.next_run: datetime | None = None
+        self.last_run_at: datetime | None = None
+        self.last_status: str | None = None
+        self.last_ms: int | None = None
+
+    @property
+    def schedule(self) -> str:
+        return self.cron.expression if self.cron else f"every {self.interval:g}s"
+
+    def schedule_next(self, now: datetime) -> datetime:
+        base = now + timedelta(seconds=self.interval) if self.interval is not None else self.cron.next_after(now)
+        self.next_run = base + timedelta(seconds=random.uniform(0, self.jitter)) if self.jitter else base
+        return self.next_run
+
+
+# ── Scheduler ────────────────────────────────────────────────────
+
+class Scheduler:
+    """Leader-elected loop that runs due jobs on a small thread pool."""
+
+    def __init__(
+        self,
+        tick: float = settings.SCHEDULER_TICK_SECONDS,
+        workers: int = settings.SCHEDULER_WORKERS,
+        lock_key: int = SCHEDULER_LOCK_KEY,
+    ):
+        self._tick = tick
+        self._workers = max(1, workers)
+        self._lock_key = lock_key
+        self._lock = threading.Lock()
+        self._jobs: dict[str, Job] = {}
+        self._stopping = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._pool: ThreadPoolExecutor | None = None
+        self._leader_conn = None
+
+    def add_job(
+        self,
+        name: str,
+        func: Callable[[], Any],
+        *,
+        interval: float | None = None,
+        cron: str | None = None,
+        jitter: float = 0.0,
+        max_concurrency: int = 1,
+    ) -> Job:
+        """Register a job. Its return value is stored as the run's result."""
+        job = Job(name, func, interval=interval, cron=cron, jitter=jitter, max_concurrency=max_concurrency)
+        with self._lock:
+            if name in self._jobs:
+                raise ValueError(f"Job {name!r} is already registered")
+            self._jobs[name] = job
+            if self.is_leader:
+                job.schedule_next(datetime.now(timezone.utc))
+        return job
+
+    @property
+    def is_leader(self) -> bool:
+        return self._leader_conn is not None
+
+    # ── Lifecycle ─────────────────────────────────────────────────
+
+    def start(self):
+        """Start the scheduler thread (idempotent)."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stopping.clear()
+        self._pool = ThreadPoolExecutor(max_workers=self._workers, thread_name_prefix="scheduler-job")
+        self._thread = threading.Thread(target=self._run, name="scheduler", daemon=True)
+        self._thread.start()
+        logger.info(f"[SCHEDULER] Started with {len(self._jobs)} job(s)")
+
+    def stop(self, timeout: float = 10.0):
+        """Stop ticking, wait for running jobs, then give up leadership."""
+        self._stopping.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+        if self._pool:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+        self._release_leadership()
+        logger.info("[SCHEDULER] Stopped")
+
+    def _run(self):
+        while not self._stopping.is_set():
+            try:
+                if self._ensure_leadership():
+                    self._dispatch_due(datetime.now(timezone.utc))
+            except Exception as e:
+                logger.error(f"[SCHEDULER] Tick failed: {e}")
+            self._stopping.wait(self._tick)
+
+    # ── Leader election ───────────────────────────────────────────
+
+    def _ensure_leadership(self) -> bool:
+        """Keep (or try to take) the advisory lock. True while leader."""
+        if self._leader_conn is not None:
+            try:
+                self._leader_conn.execute(text("SELECT 1"))
+                self._leader_conn.commit()
+                return True
+            except Exception as e:
+                logger.warning(f"[SCHEDULER] Lost leadership: {e}")
+                self._leader_conn.invalidate()  # never return a lock-holding connection to the pool
+                self._leader_conn.close()
+                self._leader_conn = None
+                return False
+
+        conn = engine.connect()
+        try:
+            acquired = conn.execute(text("SELECT pg_try_advisory_lock(:key)"), {"key": self._lock_key}).scalar()
+            conn.commit()
+        except Exception:
+            conn.close()
+            raise
+        if not acquired:
+            conn.close()
+            return False
+
+        self._leader_conn = conn
+        now = datetime.now(timezone.utc)
+        with self._lock:
+            for job in self._jobs.values():
+                job.schedule_next(now)
+        logger.info(f"[SCHEDULER] Elected leader, {len(self._jobs)} job(s) scheduled")
+        return True
+
+    def _release_leadership(self):
+        conn, self._leader_conn = self._leader_conn, None
+        if conn is None:
+            return
+        try:
+            conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": self._lock_key})
+            conn.commit()
+        except Exception as e:
+            logger.warning(f"[SCHEDULER] Could not release leader lock: {e}")
+            conn.invalidate()
+        conn.close()
+
+    # ── Running jobs ──────────────────────────────────────────────
+
+    def _dispatch_due(self, now: datetime) -> None:
+        skipped = []
+        with self._lock:
+            for job in self._jobs.values():
+                if job.next_run is None or job.next_run > now:
+                    continue
+                scheduled_for = job.next_run
+                job.schedule_next(now)
+                if job.running >= job.max_concurrency:
+                    skipped.append((job, scheduled_for))
+                    continue
+                job.running += 1
+                self._pool.submit(self._execute, job, scheduled_for)
+
+        for job, scheduled_for in skipped:
+            logger.warning(f"[SCHEDULER] Skipping {job.name}: {job.running} run(s) still in progress")
+            self._record(job, "skipped", 0, f"max_concurrency={job.max_concurrency} reached", scheduled_for)
+
+    def run_now(self, name: str) -> str:
+        """Run a job inline, outside its schedule (CLI/admin). Returns the status."""
+        job = self._jobs[name]
+        now = datetime.now(timezone.utc)
+        with self._lock:
+            at_capacity = job.running >= job.max_concurrency
+            if not at_capacity:
+                job.running += 1
+        if at_capacity:
+            self._record(job, "skipped", 0, f"max_concurrency={job.max_concurrency} reached", now)
+            return "skipped"
+        return self._execute(job, now)
+
+    def _execute(self, job: Job, scheduled_for: datetime) -> str:
+        started = time.monotonic()
+        try:
+            result = job.func()
+            status, detail = "success", None if result is None else json.dumps(result, default=str)
+        except Exception as e:
+            status, detail = "error", str(e)
+            logger.error(f"[SCHEDULER] Job {job.name} failed: {e}")
+        finally:
+            elapsed_ms = int((time.monotonic() - started) * 1000)
+            with self._lock:
+                job.running -= 1
+                job.last_run_at = datetime.now(timezone.utc)
+                job.last_ms = elapsed_ms
+
+        job.last_status = status
+        logger.info(f"[SCHEDULER] Job {job.name} {status} in {elapsed_ms}ms")
+        self._record(job, status, elapsed_ms, detail, scheduled_for)
+        return status
+
+    def _record(self, job: Job, status: str, execution_ms: int, detail: str | None, scheduled_for: datetime) -> None:
+        """Persist one run to event_logs; never raises."""
+        db = SessionLocal()
+        try:
+            db.add(EventLog(
+                event_type=SCHEDULED_JOB_EVENT,
+                source=f"scheduler:{job.name}",
+                triggered_by="scheduler",
+                status=status,
+                payload={"job": job.name, "scheduled_for": scheduled_for.isoformat()},
+                result=detail[:1000] if detail else None,
+                workspace_id=None,
+                execution_ms=execution_ms,
+            ))
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.error(f"[SCHEDULER] Could not record run of {job.name}: {e}")
+        finally:
+            db.close()
+
+    def stats(self) -> dict:
+        """Leadership and per-job state in this process."""
+        with self._lock:
+            return {
+                "running": bool(self._thread and self._thread.is_alive()),
+                "leader": self.is_leader,
+                "jobs": [
+                    {
+                        "name": job.name,
+                        "schedule": job.schedule,
+                        "max_concurrency": job.max_concurrency,
+                        "running": job.running,
+                        "next_run": job.next_run.isoformat() if job.next_run else None,
+                        "last_run_at": job.last_run_at.isoformat() if job.last_run_at else None,
+                        "last_status": job.last_status,
+                        "last_ms": job.last_ms,
+                    }
+                    for job in self._jobs.values()
+                ],
+            }
+
+
+# ── Singleton instance ────────────────────────────────────────────
+scheduler = Scheduler()
+
+
+def register_default_jobs(target: Scheduler = scheduler) -> None:
+    """Register the built-in periodic jobs (idempotent)."""
+    if "inventory_alert_sync" in target._jobs:
+        return
+    from app.tasks.booking_reminders import run_booking_reminders
+    from app.tasks.idempotency_sweeper import run_sweep
+    from app.tasks.inventory_alert_sync import run_inventory_sync
+    from app.tasks.log_retention import run_log_retention
+    from app.tasks.rollup_backfill import run_backfill
+
+    target.add_job("inventory_alert_sync", run_inventory_sync, interval=settings.INVENTORY_SYNC_INTERVAL, jitter=30)
+    target.add_job("booking_reminders", run_booking_reminders, interval=settings.BOOKING_REMINDER_INTERVAL, jitter=30)
+    target.add_job("log_retention", run_log_retention, cron=settings.LOG_RETENTION_CRON, jitter=120)
+    target.add_job("rollup_refresh", run_backfill, cron=settings.ROLLUP_REFRESH_CRON, jitter=120)
+    target.add_job("idempotency_sweep", run_sweep, cron="0 4 * * *", jitter=120)
@@ -135,4 +135,5 @@ class AutomationEventType(str, enum.Enum):
     BOOKING_CREATED = "booking_created"
     BOOKING_CONFIRMED = "booking_confirmed"
     BOOKING_CANCELLED = "booking_cancelled"
+    BOOKING_REMINDER = "booking_reminder"
     STAFF_REPLIED = "staff_replied"
@@ -0,0 +1,109 @@
+"""
+Keyset (cursor) pagination for list endpoints.
+
+Pages are keyed on the endpoint's sort columns plus the primary key, so
+fetching page 10,000 costs the same as page 1 (given a composite index on
+the workspace filter followed by the sort keys). The cursor is an opaque
+base64 token; list endpoints return it in the X-Next-Cursor response header
+(bodies stay plain arrays for existing clients). Passing `skip` without a
+cursor still works for backward compatibility.
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import NamedTuple
+
+from fastapi import HTTPException, Response, status
+from sqlalchemy import and_, false, or_, true, tuple_
+from sqlalchemy.orm import Query
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class SortKey(NamedTuple):
+    """One sort column. Nullable keys sort NULLs last."""
+    column: object
+    descending: bool = True
+    nullable: bool = False
+
+
+def encode_cursor(values: list) -> str:
+    raw = json.dumps([v.isoformat() if isinstance(v, datetime) else v for v in values])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, keys: list[SortKey]) -> list:
+    """Decode a cursor back into typed values; 400 on anything malformed."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list) or len(values) != len(keys):
+            raise ValueError("cursor does not match sort keys")
+        return [
+            datetime.fromisoformat(v) if v is not None and key.column.type.python_type is datetime else v
+            for key, v in zip(keys, values)
+        ]
+    except (ValueError, TypeError, UnicodeDecodeError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+
+def _equal(key: SortKey, value):
+    return key.column.is_(None) if value is None else key.column == value
+
+
+def _after(key: SortKey, value):
+    """Rows strictly after `value` in this key's sort order."""
+    if value is None:
+        return false()  # NULLs sort last; nothing comes after them
+    beyond = key.column < value if key.descending else key.column > value
+    return or_(beyond, key.column.is_(None)) if key.nullable else beyond
+
+
+def _seek(keys: list[SortKey], values: list):
+    """Filter for rows strictly after `values` in the order given by `keys`."""
+    uniform = len({k.descending for k in keys}) == 1 and not any(k.nullable for k in keys)
+    if uniform and None not in values:
+        # One direction throughout: a row-value comparison, which the planner
+        # turns into a single range scan on a matching composite index
+        columns, bound = tuple_(*[k.column for k in keys]), tuple_(*values)
+        return columns < bound if keys[0].descending else columns > bound
+    # Lexicographic "row after (v1, v2, ...)" honouring each key's direction
+    clauses = []
+    for i, key in enumerate(keys):
+        prefix = [_equal(keys[j], values[j]) for j in range(i)]
+        clauses.append(and_(true(), *prefix, _after(key, values[i])))
+    return or_(*clauses)
+
+
+def _order_by(key: SortKey):
+    ordered = key.column.desc() if key.descending else key.column.asc()
+    return ordered.nullslast() if key.nullable else ordered
+
+
+def keyset_paginate(
+    query: Query,
+    keys: list[SortKey],
+    limit: int,
+    response: Response,
+    cursor: str | None = None,
+    skip: int = 0,
+) -> list:
+    """
+    Order `query` by `keys` (the last key must be unique, e.g. the id),
+    seek past `cursor` (or offset by `skip` when no cursor is given) and
+    return one page. Sets X-Next-Cursor when more rows exist.
+    """
+    query = query.order_by(*[_order_by(k) for k in keys])
+
+    if cursor:
+        query = query.filter(_seek(keys, decode_cursor(cursor, keys)))
+    elif skip:
+        query = query.offset(skip)
+
+    rows = query.limit(limit + 1).all()
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor([getattr(last, k.column.key) for k in keys])
+    return rows
@@ -0,0 +1,67 @@
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from app.services import alert_service
+from app.services.alert_service import plan_inventory_sync, sync_workspace_inventory_alerts
+from app.utils.enums import AlertSeverity
+
+
+def _item(name, quantity, threshold, unit=None):
+    return SimpleNamespace(name=name, quantity=quantity, unit=unit, low_stock_threshold=threshold)
+
+
+def _alert(id, name):
+    return SimpleNamespace(id=id, title=f"Low Stock: {name}")
+
+
+class TestInventorySyncPlan(unittest.TestCase):
+    def test_diff(self):
+        items = [
+            _item("Gloves", 2, 5, unit="boxes"),   # low, no alert -> create
+            _item("Masks", 1, 10),                  # low, duplicated alerts -> keep newest
+            _item("Soap", 50, 10),                  # recovered -> dismiss
+            _item("Towels", 20, 5),                 # fine, no alert -> nothing
+        ]
+        alerts = [_alert(9, "Masks"), _alert(7, "Soap"), _alert(4, "Masks"), _alert(2, "Masks")]
+
+        plan = plan_inventory_sync(items, alerts)
+
+        self.assertEqual([c["title"] for c in plan.create], ["Low Stock: Gloves"])
+        self.assertEqual(plan.create[0]["message"], "Gloves is down to 2 boxes (threshold: 5).")
+        self.assertEqual(plan.create[0]["severity"], AlertSeverity.WARNING)
+        self.assertEqual(plan.delete, [4, 2])
+        self.assertEqual(plan.dismiss, [7])
+        self.assertEqual(plan.unchanged, 1)
+
+    def test_shared_name_stays_alerted_while_any_item_is_low(self):
+        items = [_item("Tape", 1, 5), _item("Tape", 30, 5)]
+        plan = plan_inventory_sync(items, [_alert(3, "Tape")])
+        self.assertEqual((plan.create, plan.dismiss, plan.delete, plan.unchanged), ([], [], [], 1))
+
+    def test_in_sync_is_a_no_op(self):
+        plan = plan_inventory_sync([_item("Gloves", 2, 5)], [_alert(1, "Gloves")])
+        self.assertEqual((plan.create, plan.dismiss, plan.delete), ([], [], []))
+
+
+
+class TestInventorySync(unittest.TestCase):
+    @patch.object(alert_service, "mark_workspace_dirty")
+    @patch.object(alert_service, "record_alert")
+    @patch.object(alert_service, "publish_after_commit")
+    def test_created_alerts_are_published(self, publish, _record, _dirty):
+        db = MagicMock()
+        db.query.return_value.filter.return_value.all.return_value = [_item("Gloves", 2, 5)]
+        db.query.return_value.filter.return_value.order_by.return_value.all.return_value = []
+        db.execute.return_value.all.return_value = [(41, "Low Stock: Gloves", AlertSeverity.WARNING)]
+
+        diff = sync_workspace_inventory_alerts(db, 3)
+
+        self.assertEqual(diff["created"], 1)
+        publish.assert_called_once_with(db, 3, alert_service.ALERT_CREATED, {
+            "alert_id": 41, "title": "Low Stock: Gloves", "severity": AlertSeverity.WARNING,
+        })
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import asyncio
+import threading
+import time
+import unittest
+from app.tasks.async_executor import AsyncExecutor, ExecutorBusyError
+
+class TestAsyncExecutor(unittest.TestCase):
+    def setUp(self):
+        self.executor = AsyncExecutor(max_pending=2, submit_timeout=0.05)
+        self.addCleanup(self.executor.stop)
+
+    def test_runs_on_one_shared_loop(self):
+        async def loop_id():
+            return id(asyncio.get_running_loop())
+
+        first = self.executor.run(loop_id(), timeout=1)
+        second = self.executor.run(loop_id(), timeout=1)
+
+        self.assertEqual(first, second)
+        self.assertEqual(self.executor.stats()["submitted"], 2)
+
+    def test_exceptions_propagate(self):
+        async def boom():
+            raise ValueError("nope")
+
+        with self.assertRaises(ValueError):
+            self.executor.run(boom(), timeout=1)
+
+    def test_timeout_cancels_the_coroutine(self):
+        finished = threading.Event()
+
+        async def slow_send():
+            await asyncio.sleep(0.3)
+            finished.set()
+
+        with self.assertRaises(TimeoutError):
+            self.executor.run(slow_send(), timeout=0.05)
+        # A retry after the timeout must not race a send that still goes out
+        self.assertFalse(finished.wait(0.5))
+
+    def test_full_queue_applies_backpressure(self):
+        gate = threading.Event()
+
+        async def blocked():
+            await asyncio.get_running_loop().run_in_executor(None, gate.wait)
+
+        futures = [self.executor.submit(blocked()) for _ in range(2)]
+        with self.assertRaises(ExecutorBusyError):
+            self.executor.submit(blocked())
+        gate.set()
+        for f in futures:
+            f.result(1)
+        deadline = time.monotonic() + 1
+        while self.executor.stats()["pending"] and time.monotonic() < deadline:
+            time.sleep(0.01)  # done-callbacks run just after result() wakes
+
+        stats = self.executor.stats()
+        self.assertEqual(stats["rejected"], 1)
+        self.assertEqual(stats["submit_waits"], 1)
+        self.assertEqual(stats["peak_pending"], 2)
+        self.assertEqual(stats["pending"], 0)
+
+if __name__ == "__main__":
+    unittest.main()
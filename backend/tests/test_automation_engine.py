@@ -0,0 +1,120 @@
+import asyncio
+import unittest
+from unittest.mock import MagicMock, patch
+from app.services import automation_engine
+from app.services.automation_registry import AUTOMATION_RULES, AutomationRule, RuleRegistry
+
+class TestFireEventPlanner(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+
+        def fake_db_action(action_def, payload, workspace_id, db):
+            self.calls.append(("start", action_def["name"]))
+            if action_def.get("fail"):
+                raise RuntimeError(f"{action_def['name']} failed")
+            self.calls.append(("end", action_def["name"]))
+
+        async def fake_io_action(action_def, payload, recipients):
+            self.calls.append(("start", action_def["name"]))
+            await asyncio.sleep(action_def.get("delay", 0.1))
+            if action_def.get("fail"):
+                raise RuntimeError(f"{action_def['name']} failed")
+            self.calls.append(("end", action_def["name"]))
+
+        self.log = MagicMock()
+        patches = [
+            patch.object(automation_engine, "_execute_db_action", fake_db_action),
+            patch.object(automation_engine, "_execute_io_action", fake_io_action),
+            patch.object(automation_engine, "_log_event", self.log),
+            patch.object(automation_engine, "is_feature_enabled", return_value=True),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    def _fire(self, actions, payload=None, db=None):
+        rules = RuleRegistry([AutomationRule(key, "evt", key, acts) for key, acts in actions.items()])
+        with patch.object(automation_engine.registry, "rules_for", side_effect=lambda trigger, ws, db: rules.rules_for(trigger)):
+            asyncio.run(automation_engine.fire_event("evt", 1, payload or {}, db or MagicMock()))
+        return {c.args[3]: {"result": c.args[4], **c.kwargs} for c in self.log.call_args_list}
+
+    def test_io_actions_overlap_and_db_actions_stay_ordered(self):
+        logs = self._fire({
+            "r1": [{"type": "send_email", "name": "mail1"}, {"type": "create_alert", "name": "db1"},
+                   {"type": "create_conversation", "name": "db2"}],
+            "r2": [{"type": "send_sms", "name": "sms"}],
+        })
+
+        self.assertEqual(self.calls[:2], [("start", "db1"), ("end", "db1")])
+        self.assertEqual(self.calls[2], ("start", "db2"))
+        # Both sends started before either finished
+        starts = [i for i, c in enumerate(self.calls) if c in (("start", "mail1"), ("start", "sms"))]
+        ends = [i for i, c in enumerate(self.calls) if c in (("end", "mail1"), ("end", "sms"))]
+        self.assertLess(max(starts), min(ends))
+        self.assertLess(logs["r1"]["execution_ms"], 190)
+        self.assertEqual(logs["r1"]["status"], "success")
+
+    def test_db_phase_commits_before_sends_start(self):
+        db = MagicMock()
+        db.commit.side_effect = lambda: self.calls.append(("commit",))
+        self._fire({"r1": [{"type": "create_alert", "name": "db"}, {"type": "send_sms", "name": "sms"}]}, db=db)
+
+        # Row locks taken by DB actions are released before any await on a provider
+        self.assertEqual(self.calls, [("start", "db"), ("end", "db"), ("commit",),
+                                      ("start", "sms"), ("end", "sms"), ("commit",)])
+
+    @patch.object(automation_engine.settings, "AUTOMATION_ACTION_TIMEOUT", 0.05)
+    def test_slow_action_times_out(self):
+        logs = self._fire({
+            "r1": [{"type": "send_email", "name": "slow", "delay": 1}],
+            "r2": [{"type": "create_alert", "name": "db", "fail": True}],
+        })
+
+        self.assertEqual(logs["r1"]["status"], "error")
+        self.assertIn("send_email timed out", logs["r1"]["result"])
+        self.assertEqual(logs["r2"]["failed_action_count"], 1)
+
+    @patch.object(automation_engine, "release_key")
+    @patch.object(automation_engine, "claim_key", side_effect=lambda db, ws, key, rule: rule == "r1")
+    def test_idempotency_claims_and_releases_failed_runs(self, claim, release):
+        db = MagicMock()
+        db.query.return_value.filter.return_value.first.return_value = None  # no manual override
+        logs = self._fire({
+            "r1": [{"type": "create_alert", "name": "db", "fail": True}],
+            "r2": [{"type": "create_alert", "name": "db"}],
+        }, payload={"booking_id": 7}, db=db)
+
+        self.assertEqual([c.args[2] for c in claim.call_args_list], ["r1:7", "r2:7"])
+        self.assertEqual(list(logs), ["r1"])  # r2 already claimed -> skipped
+        release.assert_called_once_with(db, 1, "r1:7")
+
+    def test_disabled_rules_and_features_skip_work(self):
+        db = MagicMock()
+        with patch.object(automation_engine, "is_feature_enabled", side_effect=lambda ws, f: f != "auto_thread_creation"):
+            rules = RuleRegistry([
+                AutomationRule("off", "evt", "", [{"type": "create_alert", "name": "never"}]),
+                AutomationRule("on", "evt", "", [{"type": "create_alert", "name": "alert"},
+                                                 {"type": "create_conversation", "name": "thread"}]),
+            ])
+            rules.set_enabled_check(lambda ws, key: key != "off")
+            with patch.object(automation_engine.registry, "rules_for", side_effect=lambda t, ws, db: rules.rules_for(t)):
+                asyncio.run(automation_engine.fire_event("evt", 1, {"booking_id": 3}, db))
+
+        self.assertEqual(self.calls, [("start", "alert"), ("end", "alert")])
+        self.assertEqual([c.args[3] for c in self.log.call_args_list], ["on"])
+
+    @patch.object(automation_engine, "claim_key", return_value=False)
+    def test_low_stock_payload_is_deduped_per_item(self, claim):
+        from app.api.inventory import _low_stock_payload
+        item = MagicMock(id=12, quantity=1, unit="boxes", low_stock_threshold=5)
+        item.name = "Gloves"
+        rules = RuleRegistry(AUTOMATION_RULES)
+        with patch.object(automation_engine.registry, "rules_for", side_effect=lambda t, ws, db: rules.rules_for(t)):
+            asyncio.run(automation_engine.fire_event("inventory.low_stock", 1, _low_stock_payload(item), MagicMock()))
+
+        claim.assert_called_once()
+        self.assertEqual(claim.call_args.args[2], "inventory_low_alert:12")
+        self.assertEqual(self.calls, [])  # already claimed -> no second alert or SMS
+
+if __name__ == "__main__":
+    unittest.main()
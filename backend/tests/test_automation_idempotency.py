@@ -0,0 +1,22 @@
+import unittest
+from unittest.mock import MagicMock
+from sqlalchemy.dialects import postgresql
+from app.services.automation_idempotency import claim_key
+
+class TestAutomationIdempotency(unittest.TestCase):
+    def test_claim_is_insert_on_conflict_do_nothing(self):
+        db = MagicMock()
+        db.execute.return_value.first.return_value = None
+
+        self.assertFalse(claim_key(db, 1, "booking_confirmation:9", "booking_confirmation"))
+
+        sql = str(db.execute.call_args[0][0].compile(dialect=postgresql.dialect()))
+        self.assertIn("INSERT INTO automation_idempotency", sql)
+        self.assertIn("ON CONFLICT (workspace_id, unique_key) DO NOTHING", sql)
+        self.assertIn("RETURNING", sql)
+
+        db.execute.return_value.first.return_value = ("booking_confirmation:9",)
+        self.assertTrue(claim_key(db, 1, "booking_confirmation:9", "booking_confirmation"))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from app.core.cache import DatabaseVersionBackend, InMemoryCacheBackend, VersionedLocalCache
+from app.services.automation_registry import AutomationRule, RuleRegistry, validate_actions
+
+class TestRuleRegistry(unittest.TestCase):
+    def setUp(self):
+        self.registry = RuleRegistry([
+            AutomationRule("a", "booking.confirmed", "A", [{"type": "send_email"}]),
+            AutomationRule("b", "booking.confirmed", "B", [{"type": "create_alert"}]),
+            AutomationRule("c", "form.submitted", "C", [{"type": "send_sms"}]),
+        ])
+        self.registry._workspace_tables = VersionedLocalCache("test", backend=InMemoryCacheBackend())
+        self.overrides = []
+        self.db = MagicMock()
+        self.db.query.return_value.filter.return_value.all.side_effect = lambda: list(self.overrides)
+
+    def test_trigger_index(self):
+        self.assertEqual([e.rule.key for e in self.registry.rules_for("booking.confirmed")], ["a", "b"])
+        self.assertEqual(self.registry.rules_for("nothing"), ())
+        with self.assertRaises(AttributeError):
+            self.registry.get("a").extra = 1  # __slots__
+
+    def test_workspace_overrides_and_hot_reload(self):
+        self.assertEqual(self.registry.rules_for("form.submitted", 1, self.db)[0].actions, ({"type": "send_sms"},))
+
+        self.overrides = [
+            SimpleNamespace(rule_key="c", trigger=None, description=None, actions=[{"type": "send_email"}]),
+            SimpleNamespace(rule_key="mine", trigger="form.submitted", description="Custom", actions=[{"type": "create_alert"}]),
+        ]
+        # Cached until the workspace is invalidated
+        self.assertEqual(len(self.registry.rules_for("form.submitted", 1, self.db)), 1)
+        self.registry.invalidate_workspace(1)
+
+        entries = self.registry.rules_for("form.submitted", 1, self.db)
+        self.assertEqual([e.rule.key for e in entries], ["c", "mine"])
+        self.assertEqual(entries[0].actions, ({"type": "send_email"},))
+        self.assertTrue(entries[1].rule.custom)
+        # Other workspaces keep the built-in table
+        self.overrides = []
+        self.assertEqual(self.registry.rules_for("form.submitted", 2, self.db)[0].actions, ({"type": "send_sms"},))
+
+    def test_override_saved_on_one_worker_reaches_another(self):
+        shared = InMemoryCacheBackend()  # stands in for the cache_versions table
+        other = RuleRegistry(self.registry._rules)
+        self.registry._workspace_tables = VersionedLocalCache("rules", backend=shared, version_ttl=0)
+        other._workspace_tables = VersionedLocalCache("rules", backend=shared, version_ttl=0)
+        self.assertEqual(len(other.rules_for("form.submitted", 1, self.db)), 1)
+
+        self.overrides = [SimpleNamespace(rule_key="mine", trigger="form.submitted", description="", actions=[{"type": "create_alert"}])]
+        self.registry.invalidate_workspace(1)
+        self.assertEqual(len(other.rules_for("form.submitted", 1, self.db)), 2)
+
+    def test_default_version_source_is_not_process_local(self):
+        self.assertIsInstance(RuleRegistry([])._workspace_tables._backend, DatabaseVersionBackend)
+
+    def test_enabled_check_is_compiled_in(self):
+        self.registry.set_enabled_check(lambda ws, key: key != "b")
+        entries = self.registry.rules_for("booking.confirmed")
+        self.assertEqual([e.is_enabled(1) for e in entries], [True, False])
+
+    def test_validate_actions(self):
+        with self.assertRaises(ValueError):
+            validate_actions([{"type": "launch_rocket"}])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,44 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+from app.api.bookings import _list_window, list_bookings
+from app.core.config import settings
+
+class TestBookingListWindow(unittest.TestCase):
+    def test_missing_bounds_default_to_a_bounded_window(self):
+        start, end = _list_window(None, None)
+
+        self.assertEqual(end - start, timedelta(days=settings.BOOKINGS_CALENDAR_MAX_DAYS))
+        self.assertLess(start, datetime.now(timezone.utc) - timedelta(days=settings.BOOKINGS_LIST_LOOKBACK_DAYS - 1))
+
+    def test_one_bound_fills_the_other(self):
+        start = datetime(2026, 1, 1)
+        self.assertEqual(_list_window(start, None)[1] - _list_window(start, None)[0],
+                         timedelta(days=settings.BOOKINGS_CALENDAR_MAX_DAYS))
+        end = datetime(2026, 6, 1, tzinfo=timezone.utc)
+        self.assertEqual(_list_window(None, end)[1], end)
+
+    def test_span_is_capped(self):
+        with self.assertRaises(HTTPException) as ctx:
+            _list_window(datetime(2020, 1, 1), datetime(2026, 1, 1))
+        self.assertEqual(ctx.exception.status_code, 400)
+
+    def test_default_list_includes_unscheduled_bookings(self):
+        db = MagicMock()
+        query = db.query.return_value
+        query.filter.return_value = query
+        query.options.return_value.order_by.return_value.all.return_value = []
+
+        list_bookings(start_date=None, end_date=None, status=None, current_user=MagicMock(workspace_id=1), db=db)
+
+        sql = " ".join(
+            str(clause.compile(dialect=postgresql.dialect()))
+            for call in query.filter.call_args_list for clause in call.args
+        )
+        self.assertIn("bookings.start_time IS NULL OR bookings.start_time >=", sql)
+        self.assertNotIn("end_time", sql)  # rows without an end_time stay listed
+
+if __name__ == "__main__":
+    unittest.main()
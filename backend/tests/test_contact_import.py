@@ -0,0 +1,63 @@
+import io
+import unittest
+from unittest.mock import MagicMock, patch
+from app.services import contact_import
+from app.services.contact_import import iter_csv, iter_ndjson, import_contacts
+
+class TestContactImport(unittest.TestCase):
+    def test_csv_rows_are_cleaned(self):
+        raw = io.BytesIO(b"\xef\xbb\xbfName,Email,Phone\n,Ann@Example.com,\nBob,,555\n")
+        rows = list(iter_csv(raw))
+
+        self.assertEqual([r[0] for r in rows], [2, 3])
+        values = contact_import._clean(rows[0][1])
+        self.assertEqual(values["email"], "ann@example.com")
+        self.assertEqual(values["name"], "ann")
+
+    def test_ndjson_reports_bad_lines(self):
+        raw = io.BytesIO(b'{"name": "Ann"}\n\nnot json\n[1]\n')
+        rows = list(iter_ndjson(raw))
+
+        self.assertEqual([(r[0], r[2] is None) for r in rows], [(1, True), (3, False), (4, False)])
+
+    @patch.object(contact_import, "mark_workspace_dirty")
+    @patch.object(contact_import, "record_contact_created")
+    @patch.object(contact_import, "_existing_keys", return_value=({"old@example.com"}, set()))
+    def test_import_batches_dedupes_and_summarises(self, _existing, record, _dirty):
+        rows = [
+            (2, {"name": "A", "email": "old@example.com"}, None),
+            (3, {"name": "B", "email": "new@example.com"}, None),
+            (4, {"name": "B again", "email": "NEW@example.com"}, None),
+            (5, {"phone": "555"}, None),
+            (6, {"name": "C", "phone": "556"}, None),
+        ]
+        db = MagicMock()
+
+        events = list(import_contacts(db, 1, iter(rows), batch_size=2))
+
+        self.assertEqual(events[0], {"type": "progress", "processed": 2, "inserted": 1, "duplicates": 1, "errors": 0})
+        self.assertEqual(events[1]["type"], "error")
+        self.assertEqual(events[1]["row"], 5)
+        self.assertEqual(events[-1], {"type": "summary", "processed": 5, "inserted": 2, "duplicates": 2, "errors": 1})
+        self.assertEqual(db.commit.call_count, 2)
+        record.assert_called_with(db, 1, count=1)
+
+    @patch.object(contact_import, "mark_workspace_dirty")
+    @patch.object(contact_import, "record_contact_created")
+    @patch.object(contact_import, "_existing_keys", return_value=({"old@example.com"}, set()))
+    def test_failed_batch_errors_only_attempted_rows(self, _existing, _record, _dirty):
+        rows = [
+            (2, {"name": "A", "email": "old@example.com"}, None),
+            (3, {"name": "B", "email": "new@example.com"}, None),
+        ]
+        db = MagicMock()
+        db.execute.side_effect = RuntimeError("boom")
+
+        events = list(import_contacts(db, 1, iter(rows), batch_size=2))
+
+        self.assertEqual([e["row"] for e in events if e["type"] == "error"], [3])
+        self.assertEqual(events[-1], {"type": "summary", "processed": 2, "inserted": 0, "duplicates": 1, "errors": 1})
+        db.rollback.assert_called_once()
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,36 @@
+import unittest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Query
+from app.models.contact import Contact
+from app.services.contact_search import apply_search, phone_digits
+
+class TestContactSearch(unittest.TestCase):
+    def _compile(self, term):
+        query, rank = apply_search(Query(Contact), term)
+        compiled = query.order_by(rank.desc()).statement.compile(dialect=postgresql.dialect())
+        return str(compiled), list(compiled.params.values())
+
+    def test_phone_like_terms(self):
+        self.assertEqual(phone_digits("+1 (555) 01"), "155501")
+        self.assertIsNone(phone_digits("55"))
+        self.assertIsNone(phone_digits("ann 555"))
+
+    def test_phone_search_uses_digit_prefix(self):
+        sql, params = self._compile("(555) 12")
+        self.assertIn("contacts.phone_digits LIKE", sql)
+        self.assertIn("55512%", params)
+        self.assertNotIn("ILIKE", sql)
+
+    def test_text_search_uses_prefix_tsquery_and_trigram(self):
+        sql, params = self._compile("Ann Lee's")
+        self.assertIn("contacts.search_vector @@ to_tsquery(", sql)
+        self.assertIn("contacts.name %%", sql)
+        self.assertIn("ts_rank_cd", sql)
+        self.assertIn("ann:* & lee:* & s:*", params)
+        self.assertIn("Ann Lee's", params)
+
+    def test_punctuation_only_matches_nothing(self):
+        self.assertIn("false", self._compile("&|!")[0].lower())
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+from unittest.mock import MagicMock
+from app.core.cache import InMemoryCacheBackend
+from app.services.dashboard_cache import DashboardCache
+
+class TestDashboardCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = DashboardCache(ttl=60)
+        self.cache._backend = InMemoryCacheBackend(max_entries=10)
+
+    def test_hit_after_miss(self):
+        compute = MagicMock(return_value={"total": 3})
+
+        first = self.cache.get_or_compute(1, "contacts", None, compute)
+        second = self.cache.get_or_compute(1, "contacts", None, compute)
+
+        self.assertEqual(first, {"total": 3})
+        self.assertEqual(second, {"total": 3})
+        compute.assert_called_once()
+        stats = self.cache.stats()
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 1)
+
+    def test_keyed_by_range_and_workspace(self):
+        compute = MagicMock(return_value={})
+
+        self.cache.get_or_compute(1, "owner-overview", 7, compute)
+        self.cache.get_or_compute(1, "owner-overview", 30, compute)
+        self.cache.get_or_compute(2, "owner-overview", 7, compute)
+
+        self.assertEqual(compute.call_count, 3)
+
+    def test_invalidate_only_affects_workspace(self):
+        compute = MagicMock(return_value={})
+        self.cache.get_or_compute(1, "alerts", None, compute)
+        self.cache.get_or_compute(2, "alerts", None, compute)
+
+        self.cache.invalidate(1)
+        self.cache.get_or_compute(1, "alerts", None, compute)
+        self.cache.get_or_compute(2, "alerts", None, compute)
+
+        self.assertEqual(compute.call_count, 3)
+
+    def test_backend_failure_falls_back_to_compute(self):
+        self.cache._backend = MagicMock()
+        self.cache._backend.get_counter.side_effect = ConnectionError("down")
+
+        result = self.cache.get_or_compute(1, "inventory", None, lambda: {"ok": True})
+
+        self.assertEqual(result, {"ok": True})
+        self.assertEqual(self.cache.stats()["errors"], 1)
+
+    def test_lru_eviction(self):
+        backend = InMemoryCacheBackend(max_entries=2)
+        backend.set("a", 1, ttl=60)
+        backend.set("b", 2, ttl=60)
+        backend.get("a")
+        backend.set("c", 3, ttl=60)
+
+        self.assertEqual(backend.get("a"), 1)
+        self.assertIsNone(backend.get("b"))
+
+if __name__ == "__main__":
+    unittest.main()
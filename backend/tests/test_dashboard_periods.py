@@ -0,0 +1,31 @@
+import unittest
+from datetime import date, datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from app.services import dashboard_service
+from app.utils.enums import BookingStatus
+
+
+def _row(day, bookings):
+    counts = {f"bookings_{st.value}": 0 for st in BookingStatus}
+    return SimpleNamespace(day=day, new_contacts=0, bookings_created=bookings, submissions=0, **counts)
+
+
+class TestDashboardPeriods(unittest.TestCase):
+    @patch.object(dashboard_service, "_now_utc", return_value=datetime(2026, 10, 17, 15, tzinfo=timezone.utc))
+    def test_current_and_previous_periods_are_equal_length(self, _now):
+        _, current_start, prev_start = dashboard_service._get_range_bounds(7)
+        self.assertEqual(current_start, date(2026, 10, 11))  # 11th..17th: 7 days incl. today
+        self.assertEqual(prev_start, date(2026, 10, 4))      # 4th..10th: 7 days
+
+        # One booking every day: both periods must hold exactly 7
+        rows = [_row(date(2026, 10, d), 1) for d in range(4, 18)]
+        with patch.object(dashboard_service, "get_daily_stats", return_value=rows):
+            periods = dashboard_service._period_stats(None, 1, current_start, prev_start)
+        self.assertEqual(periods["current"]["bookings_created"], 7)
+        self.assertEqual(periods["previous"]["bookings_created"], 7)
+
+
+if __name__ == "__main__":
+    unittest.main()
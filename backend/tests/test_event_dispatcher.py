@@ -1,26 +1,34 @@
 import unittest
 from unittest.mock import MagicMock, patch
 from sqlalchemy.orm import Session
-from app.services.event_dispatcher import dispatch_event, EVENT_HANDLERS
+from app.core.config import settings
+from app.services.event_dispatcher import dispatch_event, process_event
 from app.utils.enums import AutomationEventType
 from app.models.automation_log import AutomationLog
 
 class TestEventDispatcher(unittest.TestCase):
     def setUp(self):
         self.mock_db = MagicMock(spec=Session)
+        self.mock_db.info = {}
         self.workspace_id = 1
         self.reference_id = 100
 
-    @patch("app.services.event_dispatcher.EVENT_HANDLERS")
-    def test_dispatch_event_success(self, mock_handlers):
-        # Setup mock handler
-        mock_handler = MagicMock()
-        mock_handlers.get.return_value = mock_handler
+    def _claimed_log(self, event_type, attempts=1, payload=None):
+        return AutomationLog(
+            workspace_id=self.workspace_id,
+            event_type=event_type,
+            reference_id=self.reference_id,
+            status="processing",
+            payload=payload or {},
+            attempts=attempts,
+        )
 
+    @patch("app.services.event_dispatcher.EVENT_HANDLERS")
+    def test_dispatch_event_enqueues(self, mock_handlers):
         # Call dispatch
         event_type = AutomationEventType.FORM_SUBMITTED.value
         payload = {"email": "test@example.com"}
-        
+
         log = dispatch_event(
             workspace_id=self.workspace_id,
             event_type=event_type,
@@ -29,10 +37,28 @@ class TestEventDispatcher(unittest.TestCase):
             payload=payload
         )
 
-        # Verify DB interaction
-        self.mock_db.add.assert_called_once()
-        self.mock_db.commit.assert_called()
-        self.mock_db.refresh.assert_called()
+        # Row is added to the caller's transaction, not committed
+        self.mock_db.add.assert_called_once_with(log)
+        self.mock_db.flush.assert_called_once()
+        self.mock_db.commit.assert_not_called()
+        self.assertTrue(self.mock_db.info["outbox_dirty"])
+
+        # Handler runs later on the outbox worker
+        mock_handlers.get.assert_not_called()
+        self.assertEqual(log.status, "pending")
+        self.assertEqual(log.payload, payload)
+        self.assertIsNotNone(log.next_attempt_at)
+
+    @patch("app.services.event_dispatcher.EVENT_HANDLERS")
+    def test_process_event_success(self, mock_handlers):
+        # Setup mock handler
+        mock_handler = MagicMock()
+        mock_handlers.get.return_value = mock_handler
+
+        payload = {"email": "test@example.com"}
+        log = self._claimed_log(AutomationEventType.FORM_SUBMITTED.value, payload=payload)
+
+        process_event(log, self.mock_db)
 
         # Verify Handler Called
         mock_handler.assert_called_once_with(
@@ -44,39 +70,42 @@ class TestEventDispatcher(unittest.TestCase):
 
         # Verify Log Status
         self.assertEqual(log.status, "success")
+        self.assertIsNone(log.locked_at)
+        self.mock_db.commit.assert_called()
 
     @patch("app.services.event_dispatcher.EVENT_HANDLERS")
-    def test_dispatch_event_no_handler(self, mock_handlers):
+    def test_process_event_no_handler(self, mock_handlers):
         # Setup no handler
         mock_handlers.get.return_value = None
 
-        # Call dispatch
-        event_type = "unknown_event"
-        
-        log = dispatch_event(
-            workspace_id=self.workspace_id,
-            event_type=event_type,
-            reference_id=self.reference_id,
-            db=self.mock_db
-        )
+        log = process_event(self._claimed_log("unknown_event"), self.mock_db)
 
         # Verify Log Status
         self.assertEqual(log.status, "skipped")
 
     @patch("app.services.event_dispatcher.EVENT_HANDLERS")
-    def test_dispatch_event_error(self, mock_handlers):
+    def test_process_event_error_is_retried(self, mock_handlers):
         # Setup handler that raises exception
-        mock_handler = MagicMock(side_effect=Exception("Boom"))
-        mock_handlers.get.return_value = mock_handler
+        mock_handlers.get.return_value = MagicMock(side_effect=Exception("Boom"))
 
-        # Call dispatch
-        event_type = AutomationEventType.FORM_SUBMITTED.value
-        
-        log = dispatch_event(
-            workspace_id=self.workspace_id,
-            event_type=event_type,
-            reference_id=self.reference_id,
-            db=self.mock_db
+        log = process_event(
+            self._claimed_log(AutomationEventType.FORM_SUBMITTED.value, attempts=1),
+            self.mock_db,
+        )
+
+        # Rescheduled with backoff
+        self.mock_db.rollback.assert_called_once()
+        self.assertEqual(log.status, "pending")
+        self.assertEqual(log.last_error, "Boom")
+        self.assertIsNotNone(log.next_attempt_at)
+
+    @patch("app.services.event_dispatcher.EVENT_HANDLERS")
+    def test_process_event_error_gives_up(self, mock_handlers):
+        mock_handlers.get.return_value = MagicMock(side_effect=Exception("Boom"))
+
+        log = process_event(
+            self._claimed_log(AutomationEventType.FORM_SUBMITTED.value, attempts=settings.OUTBOX_MAX_ATTEMPTS),
+            self.mock_db,
         )
 
         # Verify Log Status
@@ -0,0 +1,55 @@
+import gzip
+import json
+import tempfile
+import unittest
+from datetime import date, datetime, timezone
+from pathlib import Path
+
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateTable
+
+from app.models.event_log import EventLog
+from app.services.log_partitions import (
+    add_months,
+    expired_months,
+    partition_month,
+    partition_name,
+    write_jsonl_gz,
+)
+
+
+class TestLogPartitions(unittest.TestCase):
+    def test_partition_names_round_trip(self):
+        self.assertEqual(partition_name("event_logs", date(2026, 3, 1)), "event_logs_p202603")
+        self.assertEqual(partition_month("event_logs", "event_logs_p202603"), date(2026, 3, 1))
+        self.assertIsNone(partition_month("event_logs", "event_logs_default"))
+        self.assertIsNone(partition_month("event_logs", "automation_logs_p202603"))
+
+    def test_add_months_crosses_years(self):
+        self.assertEqual(add_months(date(2026, 11, 1), 2), date(2027, 1, 1))
+        self.assertEqual(add_months(date(2026, 1, 1), -1), date(2025, 12, 1))
+
+    def test_only_fully_expired_months_are_archived(self):
+        partitions = {date(2026, m, 1): f"event_logs_p2026{m:02d}" for m in (6, 7, 8)}
+        cutoff = datetime(2026, 8, 1, tzinfo=timezone.utc)
+        self.assertEqual(expired_months(partitions, cutoff), [date(2026, 6, 1), date(2026, 7, 1)])
+
+    def test_archive_is_gzip_jsonl(self):
+        rows = [{"id": 1, "created_at": datetime(2026, 6, 2, tzinfo=timezone.utc), "payload": {"a": 1}}]
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "event_logs" / "2026-06.jsonl.gz"
+            self.assertEqual(write_jsonl_gz(path, iter(rows)), 1)
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                line = json.loads(f.readline())
+            self.assertEqual(line["created_at"], "2026-06-02T00:00:00+00:00")
+            self.assertEqual(line["payload"], {"a": 1})
+            self.assertEqual([p.name for p in path.parent.iterdir()], ["2026-06.jsonl.gz"])
+
+    def test_model_is_range_partitioned(self):
+        ddl = str(CreateTable(EventLog.__table__).compile(dialect=postgresql.dialect()))
+        self.assertIn("PARTITION BY RANGE (created_at)", ddl)
+        self.assertIn("PRIMARY KEY (id, created_at)", ddl)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+from app.models.alert import Alert
+from app.models.conversation import Conversation
+from app.models.form import Form
+from app.utils.pagination import SortKey, encode_cursor, decode_cursor, keyset_paginate, NEXT_CURSOR_HEADER
+
+class TestPagination(unittest.TestCase):
+    def setUp(self):
+        self.keys = [SortKey(Alert.is_read, descending=False), SortKey(Alert.created_at), SortKey(Alert.id)]
+
+    def _query(self, rows):
+        query = MagicMock()
+        query.order_by.return_value = query
+        query.filter.return_value = query
+        query.offset.return_value = query
+        query.limit.return_value = query
+        query.all.return_value = rows
+        return query
+
+    def test_cursor_round_trip(self):
+        ts = datetime(2026, 3, 1, 12, 30, 15, 123456, tzinfo=timezone.utc)
+        cursor = encode_cursor([False, ts, 42])
+        self.assertEqual(decode_cursor(cursor, self.keys), [False, ts, 42])
+
+    def test_invalid_cursor_is_400(self):
+        with self.assertRaises(HTTPException) as ctx:
+            decode_cursor("not-a-cursor", self.keys)
+        self.assertEqual(ctx.exception.status_code, 400)
+
+    def test_next_cursor_only_when_more_rows(self):
+        rows = [MagicMock(is_read=False, created_at=datetime(2026, 3, i, tzinfo=timezone.utc), id=i) for i in range(1, 4)]
+        response = MagicMock(headers={})
+
+        page = keyset_paginate(self._query(rows), self.keys, 2, response)
+
+        self.assertEqual(len(page), 2)
+        self.assertEqual(decode_cursor(response.headers[NEXT_CURSOR_HEADER], self.keys)[2], 2)
+
+        response = MagicMock(headers={})
+        keyset_paginate(self._query(rows[:2]), self.keys, 2, response)
+        self.assertNotIn(NEXT_CURSOR_HEADER, response.headers)
+
+    def test_cursor_seeks_instead_of_offset(self):
+        query = self._query([])
+        cursor = encode_cursor([None, 7])
+        keys = [SortKey(Conversation.last_message_at, nullable=True), SortKey(Conversation.id)]
+
+        keyset_paginate(query, keys, 10, MagicMock(headers={}), cursor=cursor, skip=50)
+
+        query.offset.assert_not_called()
+        clause = query.filter.call_args[0][0]
+        sql = str(clause.compile(dialect=postgresql.dialect()))
+        self.assertIn("conversations.last_message_at IS NULL", sql)
+        self.assertIn("conversations.id <", sql)
+
+    def test_single_direction_keys_seek_by_row_value(self):
+        query = self._query([])
+        ts = datetime(2026, 3, 1, tzinfo=timezone.utc)
+        keys = [SortKey(Form.created_at), SortKey(Form.id)]
+
+        keyset_paginate(query, keys, 10, MagicMock(headers={}), cursor=encode_cursor([ts, 7]))
+
+        clause = query.filter.call_args[0][0]
+        sql = str(clause.compile(dialect=postgresql.dialect()))
+        self.assertIn("(forms.created_at, forms.id) < (", sql)
+        self.assertNotIn(" OR ", sql)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+import asyncio
+import unittest
+from unittest.mock import MagicMock, patch
+from app.services import automation_engine
+from app.services.automation_registry import registry
+from app.services.interfaces.sms_provider import SMSProvider, OutgoingSMS
+from app.services.providers.mock_sms import MockSMSProvider
+
+class FlakySMS(SMSProvider):
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+
+    async def send(self, to, message):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        if to == "boom":
+            raise RuntimeError("carrier down")
+        return to != "bad"
+
+    async def health(self):
+        return True
+
+class TestProviderBatch(unittest.TestCase):
+    @patch("app.services.interfaces.sms_provider.settings")
+    def test_default_batch_is_bounded_and_ordered(self, settings):
+        settings.PROVIDER_BATCH_CONCURRENCY = 3
+        provider = FlakySMS()
+        numbers = [f"+1555{i}" for i in range(8)] + ["bad", "boom"]
+
+        results = asyncio.run(provider.send_batch([OutgoingSMS(n, "hi") for n in numbers]))
+
+        self.assertEqual([r.to for r in results], numbers)
+        self.assertTrue(all(r.success for r in results[:8]))
+        self.assertEqual(results[8].error, "Provider rejected message")
+        self.assertEqual(results[9].error, "carrier down")
+        self.assertEqual(provider.peak, 3)
+
+    def test_low_stock_sms_fans_out_to_staff(self):
+        db = MagicMock()
+        db.query.return_value.filter.return_value.distinct.return_value.all.return_value = [("+1555001",), ("+1555002",)]
+        provider = MockSMSProvider()
+
+        with patch("app.services.sms_service.get_sms_provider", return_value=provider), \
+             patch.object(provider, "send_batch", wraps=provider.send_batch) as send_batch:
+            action = registry.get("inventory_low_alert").actions[1]
+            recipients = automation_engine._io_recipients(action, 1, db)
+            result = asyncio.run(automation_engine._action_send_sms(action, {"message": "Low"}, recipients))
+
+        self.assertEqual(result, "SMS sent to 2 recipients")
+        sent = send_batch.call_args[0][0]
+        self.assertEqual([m.to for m in sent], ["+1555001", "+1555002"])
+
+if __name__ == "__main__":
+    unittest.main()
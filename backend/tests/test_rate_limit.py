@@ -0,0 +1,109 @@
+import asyncio
+import threading
+import unittest
+from unittest.mock import patch
+
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from app.core import rate_limit as rl
+from app.core.rate_limit import (
+    InMemoryRateLimitBackend,
+    RateLimiter,
+    RateLimitPolicy,
+    rate_limit,
+)
+
+
+class TestGcra(unittest.TestCase):
+    def test_burst_then_steady_rate(self):
+        backend = InMemoryRateLimitBackend()
+        # 3 per 3s: burst of 3, then one per second
+        decisions = [backend.hit("k", 1.0, 3, now=0.0) for _ in range(4)]
+        self.assertEqual([d.allowed for d in decisions], [True, True, True, False])
+        self.assertEqual([d.remaining for d in decisions[:3]], [2, 1, 0])
+        self.assertAlmostEqual(decisions[3].retry_after, 1.0)
+
+        self.assertFalse(backend.hit("k", 1.0, 3, now=0.9).allowed)
+        self.assertTrue(backend.hit("k", 1.0, 3, now=1.0).allowed)
+        self.assertTrue(backend.hit("other", 1.0, 3, now=1.0).allowed)
+
+    def test_denied_hits_do_not_extend_the_wait(self):
+        backend = InMemoryRateLimitBackend()
+        backend.hit("k", 1.0, 1, now=0.0)
+        for t in (0.1, 0.2, 0.3):
+            self.assertFalse(backend.hit("k", 1.0, 1, now=t).allowed)
+        self.assertTrue(backend.hit("k", 1.0, 1, now=1.0).allowed)
+
+    def test_idle_keys_are_swept_and_size_is_bounded(self):
+        backend = InMemoryRateLimitBackend(max_keys=3)
+        for i in range(10):
+            backend.hit(f"ip{i}", 1.0, 5, now=0.0)
+        self.assertEqual(backend.size(), 3)
+
+        backend.hit("late", 1.0, 5, now=100.0)  # the others have gone idle
+        backend.hit("late", 1.0, 5, now=100.0)
+        self.assertEqual(backend.size(), 1)
+
+
+class FailingBackend(InMemoryRateLimitBackend):
+    def hit(self, key, interval, burst, now=None):
+        raise ConnectionError("redis down")
+
+
+class TestRateLimiter(unittest.TestCase):
+    def test_policies_are_counted_separately(self):
+        limiter = RateLimiter(InMemoryRateLimitBackend())
+        strict = RateLimitPolicy("strict", 1, 60)
+        loose = RateLimitPolicy("loose", 5, 60)
+        self.assertTrue(limiter.hit(strict, "1.2.3.4").allowed)
+        self.assertFalse(limiter.hit(strict, "1.2.3.4").allowed)
+        self.assertTrue(limiter.hit(loose, "1.2.3.4").allowed)
+        self.assertEqual(limiter.stats()["by_policy"], {
+            "loose": {"allowed": 1, "limited": 0},
+            "strict": {"allowed": 1, "limited": 1},
+        })
+
+    def test_backend_failure_fails_open(self):
+        limiter = RateLimiter(FailingBackend())
+        self.assertTrue(limiter.hit(RateLimitPolicy("p", 1, 60), "k").allowed)
+        self.assertEqual(limiter.stats()["errors"], 1)
+
+    def test_dependency_returns_429_with_retry_after(self):
+        original = rl.rate_limiter
+        rl.rate_limiter = RateLimiter(InMemoryRateLimitBackend())
+        try:
+            app = FastAPI()
+
+            @app.get("/ping", dependencies=[Depends(rate_limit(RateLimitPolicy("ping", 2, 60)))])
+            def ping():
+                return {"ok": True}
+
+            client = TestClient(app)
+            codes = [client.get("/ping").status_code for _ in range(3)]
+            self.assertEqual(codes, [200, 200, 429])
+            self.assertEqual(client.get("/ping").headers["Retry-After"], "30")
+        finally:
+            rl.rate_limiter = original
+
+    def test_chat_check_runs_backend_off_the_event_loop(self):
+        from app.core import websocket_manager as wsm
+        threads = []
+
+        class RecordingBackend(InMemoryRateLimitBackend):
+            def hit(self, key, interval, burst, now=None):
+                threads.append(threading.current_thread())
+                return super().hit(key, interval, burst, now)
+
+        async def check():
+            return await wsm.ws_manager.check_rate_limit(7), threading.current_thread()
+
+        with patch.object(wsm, "rate_limiter", RateLimiter(RecordingBackend())):
+            allowed, loop_thread = asyncio.run(check())
+
+        self.assertTrue(allowed)
+        self.assertNotEqual(threads, [loop_thread])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+import asyncio
+import json
+import threading
+import unittest
+from unittest import mock
+
+from app.core.database import SessionLocal
+from app.core.realtime_topics import (
+    ALERT_CREATED,
+    BOOKING_STATUS_CHANGED,
+    publish_after_commit,
+)
+from app.core.websocket_manager import WebSocketManager, ws_manager
+from app.core.ws_backplane import InMemoryBackplane
+from app.utils.enums import BookingStatus
+
+
+class FakeSocket:
+    def __init__(self):
+        self.sent = []
+
+    async def send_text(self, text):
+        self.sent.append(json.loads(text))
+
+
+class TestPublishAfterCommit(unittest.TestCase):
+    def test_events_go_out_on_commit_only(self):
+        db = SessionLocal()
+        with mock.patch.object(ws_manager, "broadcast_threadsafe") as broadcast:
+            publish_after_commit(db, 1, BOOKING_STATUS_CHANGED, {
+                "booking_id": 7, "status": BookingStatus.CONFIRMED, "previous_status": BookingStatus.PENDING,
+            })
+            broadcast.assert_not_called()
+            db.commit()
+        db.close()
+        broadcast.assert_called_once_with(1, BOOKING_STATUS_CHANGED, {
+            "booking_id": 7, "status": "confirmed", "previous_status": "pending",
+        })
+
+    def test_rollback_discards_events(self):
+        db = SessionLocal()
+        db.begin()  # a write path is always inside its transaction
+        with mock.patch.object(ws_manager, "broadcast_threadsafe") as broadcast:
+            publish_after_commit(db, 1, ALERT_CREATED, {"alert_id": 1, "title": "t", "severity": "info"})
+            db.rollback()
+            db.commit()
+        db.close()
+        broadcast.assert_not_called()
+
+    def test_payload_is_checked_against_topic(self):
+        db = SessionLocal()
+        with self.assertRaises(ValueError):
+            publish_after_commit(db, 1, "alert.deleted", {})
+        with self.assertRaises(ValueError):
+            publish_after_commit(db, 1, ALERT_CREATED, {"alert_id": 1})
+        db.close()
+
+
+class TestBroadcastThreadsafe(unittest.TestCase):
+    def test_sync_thread_reaches_sockets_on_serving_loop(self):
+        async def scenario():
+            manager = WebSocketManager(InMemoryBackplane())
+            await manager.start()
+            socket = FakeSocket()
+            await manager.connect(1, 10, "Ann", socket)
+
+            worker = threading.Thread(
+                target=manager.broadcast_threadsafe, args=(1, "alert.created", {"alert_id": 3})
+            )
+            worker.start()
+            await asyncio.to_thread(worker.join)
+            await asyncio.sleep(0.01)
+            await manager.stop()
+            return socket
+
+        socket = asyncio.run(scenario())
+        self.assertEqual(socket.sent, [{"type": "alert.created", "payload": {"alert_id": 3}}])
+
+    def test_noop_when_not_serving(self):
+        manager = WebSocketManager(InMemoryBackplane())
+        manager.broadcast_threadsafe(1, "alert.created", {"alert_id": 3})  # must not raise
+
+
+if __name__ == "__main__":
+    unittest.main()
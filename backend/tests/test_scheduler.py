@@ -0,0 +1,100 @@
+import unittest
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+from app.tasks.scheduler import CronSchedule, Job, Scheduler
+
+
+def _utc(*args):
+    return datetime(*args, tzinfo=timezone.utc)
+
+
+class TestCronSchedule(unittest.TestCase):
+    def test_next_after(self):
+        daily = CronSchedule("15 3 * * *")
+        self.assertEqual(daily.next_after(_utc(2026, 10, 17, 3, 14, 59)), _utc(2026, 10, 17, 3, 15))
+        self.assertEqual(daily.next_after(_utc(2026, 10, 17, 3, 15)), _utc(2026, 10, 18, 3, 15))
+
+        every_ten = CronSchedule("*/10 * * * *")
+        self.assertEqual(every_ten.next_after(_utc(2026, 12, 31, 23, 55)), _utc(2027, 1, 1, 0, 0))
+
+        # 2026-10-17 is a Saturday; "1-5" is Monday to Friday
+        weekdays = CronSchedule("0 9 * * 1-5")
+        self.assertEqual(weekdays.next_after(_utc(2026, 10, 17, 12, 0)), _utc(2026, 10, 19, 9, 0))
+
+    def test_invalid_expressions(self):
+        for expression in ("* * * *", "60 * * * *", "*/0 * * * *", "5-1 * * * *"):
+            with self.assertRaises(ValueError):
+                CronSchedule(expression)
+        with self.assertRaises(ValueError):
+            CronSchedule("0 0 31 2 *").next_after(_utc(2026, 1, 1))
+
+
+class TestScheduler(unittest.TestCase):
+    def test_job_needs_exactly_one_schedule(self):
+        with self.assertRaises(ValueError):
+            Job("x", lambda: None)
+        with self.assertRaises(ValueError):
+            Job("x", lambda: None, interval=60, cron="* * * * *")
+
+    def test_interval_jitter_bounds(self):
+        job = Job("x", lambda: None, interval=60, jitter=10)
+        now = _utc(2026, 10, 17, 12, 0)
+        for _ in range(20):
+            delay = (job.schedule_next(now) - now).total_seconds()
+            self.assertTrue(60 <= delay <= 70)
+
+    def test_follower_does_not_run_jobs(self):
+        sched = Scheduler(tick=0.01)
+        conn = MagicMock()
+        conn.execute.return_value.scalar.return_value = False
+        with patch("app.tasks.scheduler.engine") as engine:
+            engine.connect.return_value = conn
+            self.assertFalse(sched._ensure_leadership())
+        conn.close.assert_called_once()
+        self.assertFalse(sched.is_leader)
+
+    def test_leader_schedules_jobs_and_drops_dead_connection(self):
+        sched = Scheduler(tick=0.01)
+        job = sched.add_job("sync", lambda: None, interval=60)
+        conn = MagicMock()
+        conn.execute.return_value.scalar.return_value = True
+        with patch("app.tasks.scheduler.engine") as engine:
+            engine.connect.return_value = conn
+            self.assertTrue(sched._ensure_leadership())
+        self.assertIsNotNone(job.next_run)
+
+        conn.execute.side_effect = Exception("connection reset")
+        self.assertFalse(sched._ensure_leadership())
+        conn.invalidate.assert_called_once()
+        self.assertFalse(sched.is_leader)
+
+    def test_max_concurrency_skips_due_run(self):
+        sched = Scheduler(tick=0.01)
+        sched._pool = MagicMock()
+        job = sched.add_job("sync", lambda: None, interval=60, max_concurrency=1)
+        job.next_run = _utc(2026, 10, 17, 12, 0)
+        job.running = 1
+
+        with patch.object(sched, "_record") as record:
+            sched._dispatch_due(_utc(2026, 10, 17, 12, 1))
+
+        sched._pool.submit.assert_not_called()
+        self.assertEqual(record.call_args[0][1], "skipped")
+        self.assertGreater(job.next_run, _utc(2026, 10, 17, 12, 1))
+
+    def test_run_records_status(self):
+        sched = Scheduler(tick=0.01)
+        sched.add_job("ok", lambda: {"created": 2}, interval=60)
+        sched.add_job("boom", MagicMock(side_effect=RuntimeError("db down")), interval=60)
+
+        with patch.object(sched, "_record") as record:
+            self.assertEqual(sched.run_now("ok"), "success")
+            self.assertEqual(record.call_args[0][3], '{"created": 2}')
+            self.assertEqual(sched.run_now("boom"), "error")
+            self.assertEqual(record.call_args[0][3], "db down")
+        self.assertEqual(sched._jobs["boom"].running, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
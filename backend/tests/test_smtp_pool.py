@@ -0,0 +1,92 @@
+import asyncio
+import unittest
+from email.message import EmailMessage
+from unittest.mock import patch
+import aiosmtplib
+from app.services.providers.smtp_pool import SMTPConnectionPool
+
+class FakeSMTP:
+    instances = []
+    active = 0
+    peak = 0
+
+    def __init__(self, **kwargs):
+        self.is_connected = False
+        self.sent = []
+        self.drop_next = False
+        FakeSMTP.instances.append(self)
+
+    async def connect(self):
+        self.is_connected = True
+
+    async def send_message(self, message, sender=None):
+        if self.drop_next:
+            self.is_connected = False
+            raise aiosmtplib.SMTPServerDisconnected("gone")
+        FakeSMTP.active += 1
+        FakeSMTP.peak = max(FakeSMTP.peak, FakeSMTP.active)
+        await asyncio.sleep(0.01)
+        FakeSMTP.active -= 1
+        self.sent.append(message["To"])
+
+    def close(self):
+        self.is_connected = False
+
+def _message(to):
+    msg = EmailMessage()
+    msg["To"] = to
+    msg.set_content("hi")
+    return msg
+
+class TestSMTPConnectionPool(unittest.TestCase):
+    def setUp(self):
+        FakeSMTP.instances, FakeSMTP.active, FakeSMTP.peak = [], 0, 0
+        patcher = patch.object(aiosmtplib, "SMTP", FakeSMTP)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.pool = SMTPConnectionPool("smtp.test", 465, size=2, idle_timeout=60)
+
+    def test_connections_are_reused(self):
+        async def run():
+            for i in range(3):
+                await self.pool.send(_message(f"u{i}@x.com"))
+        asyncio.run(run())
+
+        self.assertEqual(len(FakeSMTP.instances), 1)
+        self.assertEqual(self.pool.stats()["reused"], 2)
+
+    def test_batch_is_bounded_by_pool_size(self):
+        results = asyncio.run(self.pool.send_many([_message(f"u{i}@x.com") for i in range(10)]))
+
+        self.assertEqual(results, [None] * 10)
+        self.assertEqual(FakeSMTP.peak, 2)
+        self.assertLessEqual(len(FakeSMTP.instances), 2)
+
+    def test_reconnects_after_drop_and_idle_timeout(self):
+        async def run():
+            await self.pool.send(_message("a@x.com"))
+            FakeSMTP.instances[0].drop_next = True
+            await self.pool.send(_message("b@x.com"))
+            self.pool._idle_timeout = 0
+            await self.pool.send(_message("c@x.com"))
+        asyncio.run(run())
+
+        self.assertEqual(len(FakeSMTP.instances), 3)
+        self.assertEqual(FakeSMTP.instances[1].sent, ["b@x.com"])
+        self.assertEqual(self.pool.stats()["reconnects"], 1)
+
+    def test_cancelled_send_discards_connection(self):
+        async def run():
+            task = asyncio.ensure_future(self.pool.send(_message("a@x.com")))
+            await asyncio.sleep(0.001)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+            return list(self.pool._loop_pool().idle)
+        idle = asyncio.run(run())
+
+        self.assertEqual(idle, [])
+        self.assertFalse(FakeSMTP.instances[0].is_connected)
+
+if __name__ == "__main__":
+    unittest.main()
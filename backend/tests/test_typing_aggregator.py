@@ -0,0 +1,110 @@
+import asyncio
+import json
+import unittest
+
+from app.core.typing_aggregator import TypingAggregator
+from app.core.websocket_manager import WebSocketManager
+from app.core.ws_backplane import InMemoryBackplane, InMemoryHub
+
+
+class Recorder:
+    """Loops published messages straight back into the aggregator."""
+
+    def __init__(self):
+        self.published = []
+        self.emitted = []
+        self.aggregator = TypingAggregator(self.publish, self.emit, interval=0.5, ttl=6.0)
+
+    async def publish(self, message):
+        self.published.append(message)
+        self.aggregator.apply(message, now=self.now)
+
+    async def emit(self, workspace_id, users):
+        self.emitted.append((workspace_id, [u["user_id"] for u in users]))
+
+    def flush(self, now):
+        self.now = now
+        asyncio.run(self.aggregator.flush(now=now))
+
+
+class FakeSocket:
+    def __init__(self):
+        self.sent = []
+
+    async def send_text(self, text):
+        self.sent.append(json.loads(text))
+
+
+class TestTypingAggregator(unittest.TestCase):
+    def test_one_frame_per_interval_with_everyone_typing(self):
+        r = Recorder()
+        r.aggregator.update(1, 10, "Ann", True)
+        r.aggregator.update(1, 11, "Ben", True)
+        r.aggregator.update(1, 10, "Ann", True)
+        r.flush(0.0)
+        self.assertEqual(len(r.published), 1)
+        self.assertEqual(r.emitted, [(1, [10, 11])])
+
+    def test_repeated_start_and_net_zero_changes_emit_nothing(self):
+        r = Recorder()
+        r.aggregator.update(1, 10, "Ann", True)
+        r.flush(0.0)
+        r.aggregator.update(1, 10, "Ann", True)    # refresh, still fresh
+        r.aggregator.update(1, 12, "Cat", True)    # start + stop in one interval
+        r.aggregator.update(1, 12, "Cat", False)
+        r.flush(0.5)
+        self.assertEqual(len(r.published), 1)
+        self.assertEqual(r.emitted, [(1, [10])])
+
+    def test_stop_clears_and_stale_state_expires(self):
+        r = Recorder()
+        r.aggregator.update(1, 10, "Ann", True)
+        r.aggregator.update(2, 20, "Zed", True)
+        r.flush(0.0)
+        r.aggregator.update(1, 10, "Ann", False)
+        r.flush(1.0)
+        r.flush(6.0)  # Zed never refreshed
+        self.assertEqual(r.emitted[2:], [(1, []), (2, [])])
+
+    def test_refresh_keeps_user_typing(self):
+        r = Recorder()
+        r.aggregator.update(1, 10, "Ann", True)
+        r.flush(0.0)
+        r.aggregator.update(1, 10, "Ann", True)
+        r.flush(3.0)  # client refresh cadence, older than ttl/3: republished
+        r.flush(8.5)  # expiry was pushed out to 9.0
+        self.assertEqual(r.emitted, [(1, [10])])
+        self.assertEqual(len(r.published), 2)
+
+
+class TestTypingAcrossWorkers(unittest.TestCase):
+    def test_frame_lists_typists_from_every_worker(self):
+        async def scenario():
+            hub = InMemoryHub()
+            worker_a = WebSocketManager(InMemoryBackplane(hub))
+            worker_b = WebSocketManager(InMemoryBackplane(hub))
+            await worker_a.start()
+            await worker_b.start()
+
+            ann, ben = FakeSocket(), FakeSocket()
+            await worker_a.connect(1, 10, "Ann", ann)
+            await worker_b.connect(1, 11, "Ben", ben)
+            worker_a.set_typing(1, 10, "Ann", True)
+            worker_b.set_typing(1, 11, "Ben", True)
+            for worker in (worker_a, worker_b):
+                await worker._typing.flush()
+            for worker in (worker_a, worker_b):
+                await worker._typing.flush()
+            await asyncio.sleep(0.01)
+            await worker_a.stop()
+            await worker_b.stop()
+            return ann, ben
+
+        ann, ben = asyncio.run(scenario())
+        for socket in (ann, ben):
+            frames = [f["payload"]["users"] for f in socket.sent if f["type"] == "typing"]
+            self.assertEqual([u["user_id"] for u in frames[-1]], [10, 11])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+from unittest.mock import MagicMock, patch
+from app.core.cache import DatabaseVersionBackend, InMemoryCacheBackend, VersionedLocalCache, get_version_backend
+from app.core.config import settings
+from app.services import workspace_flags
+
+class TestWorkspaceFlags(unittest.TestCase):
+    def setUp(self):
+        self.rows = {}
+        self.loads = 0
+
+        def load(ws):
+            self.loads += 1
+            return dict(self.rows)
+
+        patches = [
+            patch.object(workspace_flags, "_cache", VersionedLocalCache("flags", backend=InMemoryCacheBackend())),
+            patch.object(workspace_flags, "_load", load),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    def test_read_through_until_version_bump(self):
+        self.assertTrue(workspace_flags.is_rule_enabled(1, "booking_confirmation"))
+        self.rows[("rule", "booking_confirmation")] = False
+        self.assertTrue(workspace_flags.is_rule_enabled(1, "booking_confirmation"))  # cached
+        self.assertEqual(self.loads, 1)
+
+        workspace_flags.set_flag(MagicMock(), 1, "rule", "booking_confirmation", False)
+
+        self.assertFalse(workspace_flags.is_rule_enabled(1, "booking_confirmation"))
+        self.assertTrue(workspace_flags.is_feature_enabled(1, "customer_emails"))
+        self.assertEqual(self.loads, 2)
+
+    def test_version_stamps_are_shared_without_redis(self):
+        # The in-process memory backend would let workers diverge forever
+        with patch.object(settings, "CACHE_BACKEND", "memory"):
+            self.assertIsInstance(get_version_backend(), DatabaseVersionBackend)
+
+    def test_burst_of_reads_costs_one_version_lookup(self):
+        backend = InMemoryCacheBackend()
+        backend.get_counter = MagicMock(return_value=0)
+        with patch.object(workspace_flags, "_cache", VersionedLocalCache("flags", backend=backend, version_ttl=60)):
+            for rule in ("a", "b", "c"):
+                workspace_flags.is_rule_enabled(1, rule)
+                workspace_flags.is_feature_enabled(1, rule)
+
+        backend.get_counter.assert_called_once()
+        self.assertEqual(self.loads, 1)
+
+    def test_expired_stamp_is_rechecked(self):
+        backend = InMemoryCacheBackend()
+        with patch.object(workspace_flags, "_cache", VersionedLocalCache("flags", backend=backend, version_ttl=0)):
+            workspace_flags.is_rule_enabled(1, "a")
+            backend.incr("flags:ver:1")  # another worker saved a flag
+            workspace_flags.is_rule_enabled(1, "a")
+
+        self.assertEqual(self.loads, 2)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import asyncio
+import json
+import unittest
+
+from app.core.websocket_manager import WebSocketManager
+from app.core.ws_backplane import FragmentAssembler, InMemoryBackplane, InMemoryHub, split_fragments
+
+
+class FakeSocket:
+    def __init__(self):
+        self.sent = []
+
+    async def send_text(self, text):
+        self.sent.append(json.loads(text))
+
+
+class TestFragments(unittest.TestCase):
+    def test_small_payload_is_one_fragment(self):
+        fragments = split_fragments('{"a":1}')
+        self.assertEqual(len(fragments), 1)
+        self.assertEqual(FragmentAssembler().feed(fragments[0]), '{"a":1}')
+
+    def test_large_payload_round_trips(self):
+        raw = '{"content":"' + "héllo wörld " * 2000 + '"}'
+        fragments = split_fragments(raw, limit=1000)
+        self.assertGreater(len(fragments), 1)
+        self.assertTrue(all(len(f.split(" ", 3)[3].encode()) <= 1000 for f in fragments))
+
+        assembler = FragmentAssembler()
+        results = [assembler.feed(f) for f in fragments]
+        self.assertEqual(results[:-1], [None] * (len(fragments) - 1))
+        self.assertEqual(results[-1], raw)
+
+
+class TestBackplaneFanOut(unittest.TestCase):
+    def test_broadcast_reaches_sockets_on_every_worker(self):
+        async def scenario():
+            hub = InMemoryHub()
+            worker_a = WebSocketManager(InMemoryBackplane(hub))
+            worker_b = WebSocketManager(InMemoryBackplane(hub))
+            await worker_a.start()
+            await worker_b.start()
+
+            sender, on_a, on_b, other_ws = FakeSocket(), FakeSocket(), FakeSocket(), FakeSocket()
+            await worker_a.connect(1, 10, "Sender", sender)
+            await worker_a.connect(1, 11, "Ann", on_a)
+            await worker_b.connect(1, 12, "Ben", on_b)
+            await worker_b.connect(2, 13, "Other", other_ws)
+
+            await worker_a.broadcast(1, "new_message", {"id": 5}, exclude_user_id=10)
+            await worker_b.send_to_user(1, 11, "ping", {})
+            await asyncio.sleep(0.01)  # let the writer tasks drain
+            await worker_a.stop()
+            await worker_b.stop()
+            return sender, on_a, on_b, other_ws
+
+        sender, on_a, on_b, other_ws = asyncio.run(scenario())
+        self.assertEqual(sender.sent, [])
+        self.assertEqual(on_a.sent, [{"type": "new_message", "payload": {"id": 5}}, {"type": "ping", "payload": {}}])
+        self.assertEqual(on_b.sent, [{"type": "new_message", "payload": {"id": 5}}])
+        self.assertEqual(other_ws.sent, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import asyncio
+import unittest
+from unittest.mock import patch
+
+from app.core import websocket_manager
+from app.core.websocket_manager import SLOW_CONSUMER_CLOSE_CODE, WebSocketManager
+from app.core.ws_backplane import InMemoryBackplane
+
+
+class FastSocket:
+    def __init__(self):
+        self.sent = []
+        self.closed = None
+
+    async def send_text(self, text):
+        self.sent.append(text)
+
+    async def close(self, code=1000, reason=""):
+        self.closed = code
+
+
+class StalledSocket(FastSocket):
+    async def send_text(self, text):
+        await asyncio.Event().wait()  # never completes
+
+
+class TestConcurrentBroadcast(unittest.TestCase):
+    def _manager(self, queue_size):
+        manager = WebSocketManager(InMemoryBackplane())
+        manager._queue_size = queue_size
+        return manager
+
+    def test_stalled_client_does_not_block_others_and_is_dropped(self):
+        async def scenario():
+            manager = self._manager(queue_size=3)
+            stalled, fast = StalledSocket(), FastSocket()
+            await manager.connect(1, 1, "Slow", stalled)
+            await manager.connect(1, 2, "Fast", fast)
+
+            for i in range(5):
+                await asyncio.wait_for(manager.broadcast(1, "tick", {"i": i}), timeout=1)
+            await asyncio.sleep(0.01)
+            return manager, stalled, fast
+
+        manager, stalled, fast = asyncio.run(scenario())
+        self.assertEqual(len(fast.sent), 5)
+        self.assertEqual(stalled.closed, SLOW_CONSUMER_CLOSE_CODE)
+        stats = manager.get_stats()
+        self.assertEqual(stats["slow_consumers_dropped"], 1)
+        self.assertEqual([c["user_id"] for c in stats["workspaces"][1]], [2])
+        self.assertEqual(stats["workspaces"][1][0]["sent"], 5)
+
+    def test_frame_is_serialized_once_per_broadcast(self):
+        async def scenario():
+            manager = self._manager(queue_size=10)
+            sockets = [FastSocket() for _ in range(20)]
+            for i, sock in enumerate(sockets):
+                await manager.connect(1, i, f"U{i}", sock)
+            with patch.object(websocket_manager, "_frame", wraps=websocket_manager._frame) as frame:
+                await manager.broadcast(1, "new_message", {"id": 1})
+            await asyncio.sleep(0.01)
+            return frame.call_count, sockets
+
+        calls, sockets = asyncio.run(scenario())
+        self.assertEqual(calls, 1)
+        self.assertTrue(all(s.sent == ['{"type":"new_message","payload":{"id":1}}'] for s in sockets))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,6 +3,10 @@ import api from './axios'
 export const listBookings = (status = '', skip = 0, limit = 50) =>
   api.get('/bookings', { params: { status: status || undefined, skip, limit } })
 
+// Bookings starting inside [start, end) — the backend caps the window size
+export const getCalendarBookings = (start, end, view = 'rows') =>
+  api.get('/bookings/calendar', { params: { start, end, view } })
+
 export const getBooking = (id) => api.get(`/bookings/${id}`)
 
 export const createBooking = (data) => api.post('/bookings', data)
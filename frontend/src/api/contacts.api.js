@@ -10,3 +10,6 @@ export const createContact = (data) => api.post('/contacts', data)
 export const updateContact = (id, data) => api.put(`/contacts/${id}`, data)
 
 export const deleteContact = (id) => api.delete(`/contacts/${id}`)
+
+export const typeaheadContacts = (q, limit = 10) =>
+  api.get('/contacts/typeahead', { params: { q, limit } })
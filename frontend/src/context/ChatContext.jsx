@@ -4,14 +4,21 @@
  * Replaces the old polling-based ChatContext.
  * Provides: useChat() → {
  *   isOpen, setIsOpen, messages, sendMessage,
- *   unreadCount, typingUsers, isConnected, markAllRead
+ *   unreadCount, typingUsers, isConnected, markAllRead, subscribe
  * }
+ * and useRealtimeTopics(topics, handler) for the workspace topics pushed on
+ * the same socket (inbox.message_created, alert.created,
+ * booking.status_changed, dashboard.invalidated).
  *
  * Connection strategy:
  *  - Connect when user is authenticated
  *  - Exponential backoff reconnect (1s → 2s → 5s → 10s, max 5 attempts)
  *  - Reconnect on network online event
  *  - Cleanup on unmount / logout
+ *
+ * Typing: the server coalesces typing_start/typing_stop and sends one
+ * "typing" frame with everyone currently typing. Entries expire server-side
+ * unless refreshed, so typing_start is repeated while the user keeps typing.
  */
 
 import {
@@ -38,6 +45,8 @@ function getWsUrl() {
 
 const RECONNECT_DELAYS = [1000, 2000, 5000, 10000, 10000]
 const MAX_RECONNECT_ATTEMPTS = 5
+const TYPING_IDLE_MS = 2000 // send typing_stop after this long without input
+const TYPING_REFRESH_MS = 3000 // re-send typing_start (server expiry is 6s, re-publishes refreshes older than 2s)
 
 export function ChatProvider({ children }) {
   const { user } = useAuth()
@@ -56,6 +65,9 @@ export function ChatProvider({ children }) {
   const reconnectTimer = useRef(null)
   const typingTimer = useRef(null)
   const isTyping = useRef(false)
+  const typingSentAt = useRef(0)
+  const userIdRef = useRef(user?.id)
+  const topicListeners = useRef(new Map()) // topic → Set<handler>
   const isOpenRef = useRef(isOpen)
   const messageIdsRef = useRef(new Set())
 
@@ -64,6 +76,10 @@ export function ChatProvider({ children }) {
     isOpenRef.current = isOpen
   }, [isOpen])
 
+  useEffect(() => {
+    userIdRef.current = user?.id
+  }, [user])
+
   // ── Initial Load (REST, then WS takes over) ──────────────────
   const loadInitialMessages = useCallback(async () => {
     if (!user || initialLoaded) return
@@ -167,15 +183,9 @@ export function ChatProvider({ children }) {
         setTypingUsers((prev) => prev.filter((u) => u.user_id !== payload.sender_id))
         break
 
-      case 'typing_start':
-        setTypingUsers((prev) => {
-          if (prev.some((u) => u.user_id === payload.user_id)) return prev
-          return [...prev, { user_id: payload.user_id, user_name: payload.user_name }]
-        })
-        break
-
-      case 'typing_stop':
-        setTypingUsers((prev) => prev.filter((u) => u.user_id !== payload.user_id))
+      case 'typing':
+        // Full snapshot of who is typing (includes us when we are)
+        setTypingUsers(payload.users.filter((u) => u.user_id !== userIdRef.current))
         break
 
       case 'error':
@@ -183,6 +193,8 @@ export function ChatProvider({ children }) {
         break
 
       default:
+        // Workspace topics (alert.created, dashboard.invalidated, ...)
+        topicListeners.current.get(type)?.forEach((handler) => handler(payload))
         break
     }
   }, [])
@@ -233,8 +245,10 @@ export function ChatProvider({ children }) {
 
   // ── Typing Indicators ────────────────────────────────────────
   const sendTypingStart = useCallback(() => {
-    if (isTyping.current) return
+    const now = Date.now()
+    if (isTyping.current && now - typingSentAt.current < TYPING_REFRESH_MS) return
     isTyping.current = true
+    typingSentAt.current = now
     if (wsRef.current?.readyState === WebSocket.OPEN) {
       wsRef.current.send(JSON.stringify({ type: 'typing_start' }))
     }
@@ -252,9 +266,16 @@ export function ChatProvider({ children }) {
   const handleTyping = useCallback(() => {
     sendTypingStart()
     clearTimeout(typingTimer.current)
-    typingTimer.current = setTimeout(sendTypingStop, 2000)
+    typingTimer.current = setTimeout(sendTypingStop, TYPING_IDLE_MS)
   }, [sendTypingStart, sendTypingStop])
 
+  // ── Realtime Topics ──────────────────────────────────────────
+  const subscribe = useCallback((topic, handler) => {
+    if (!topicListeners.current.has(topic)) topicListeners.current.set(topic, new Set())
+    topicListeners.current.get(topic).add(handler)
+    return () => topicListeners.current.get(topic)?.delete(handler)
+  }, [])
+
   // ── Mark Read ────────────────────────────────────────────────
   const markAllRead = useCallback(() => {
     setUnreadCount(0)
@@ -318,8 +339,11 @@ export function ChatProvider({ children }) {
 
       // Actions
       markAllRead,
+
+      // Realtime topics
+      subscribe,
     }),
-    [isOpen, unreadCount, messages, typingUsers, isConnected, sendMessage, handleTyping, markAllRead]
+    [isOpen, unreadCount, messages, typingUsers, isConnected, sendMessage, handleTyping, markAllRead, subscribe]
   )
 
   return <ChatContext.Provider value={value}>{children}</ChatContext.Provider>
@@ -332,3 +356,35 @@ export const useChat = () => {
   }
   return context
 }
+
+/**
+ * Call `handler(topic, payload)` when any of `topics` arrives over the socket.
+ * Bursts (e.g. a bulk import) are coalesced into one call per `debounceMs`,
+ * with the latest event. Returns whether the socket is connected, so callers
+ * can fall back to polling while it is not.
+ */
+export function useRealtimeTopics(topics, handler, debounceMs = 500) {
+  const { subscribe, isConnected } = useChat()
+  const handlerRef = useRef(handler)
+  const topicKey = topics.join(',')
+
+  useEffect(() => {
+    handlerRef.current = handler
+  }, [handler])
+
+  useEffect(() => {
+    let timer = null
+    const unsubscribers = topicKey.split(',').map((topic) =>
+      subscribe(topic, (payload) => {
+        clearTimeout(timer)
+        timer = setTimeout(() => handlerRef.current(topic, payload), debounceMs)
+      })
+    )
+    return () => {
+      clearTimeout(timer)
+      unsubscribers.forEach((unsubscribe) => unsubscribe())
+    }
+  }, [subscribe, topicKey, debounceMs])
+
+  return isConnected
+}
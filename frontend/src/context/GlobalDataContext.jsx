@@ -1,5 +1,6 @@
 import { createContext, useContext, useState, useEffect, useCallback } from 'react'
 import { useAuth } from '../hooks/useAuth'
+import { useRealtimeTopics } from './ChatContext'
 import { getUnreadCount } from '../api/inbox.api'
 import { getAlertCount } from '../api/alerts.api'
 
@@ -28,7 +29,14 @@ export function GlobalDataProvider({ children }) {
     }
   }, [user])
 
-  // Polling for inbox/alert counts (30s)
+  // Counts change with new messages/alerts and with anything that invalidates
+  // the dashboard (read/dismiss included) — refetch on those pushes
+  const isConnected = useRealtimeTopics(
+    ['inbox.message_created', 'alert.created', 'dashboard.invalidated'],
+    fetchCounts
+  )
+
+  // Initial load; poll (30s) only while the realtime socket is down
   useEffect(() => {
     if (!user) {
       setInboxUnread(0)
@@ -42,10 +50,13 @@ export function GlobalDataProvider({ children }) {
       setLoading(false)
     }
     init()
+  }, [user, fetchCounts])
 
+  useEffect(() => {
+    if (!user || isConnected) return
     const interval = setInterval(fetchCounts, 30000)
     return () => clearInterval(interval)
-  }, [user, fetchCounts])
+  }, [user, isConnected, fetchCounts])
 
   const value = {
     inboxUnread,
@@ -1,23 +1,22 @@
-import { useState, useEffect } from 'react'
+import { useState, useCallback } from 'react'
 import Sidebar from '../../components/layout/Sidebar'
 import Topbar from '../../components/layout/Topbar'
 import FullCalendar from '@fullcalendar/react'
 import dayGridPlugin from '@fullcalendar/daygrid'
 import timeGridPlugin from '@fullcalendar/timegrid'
 import interactionPlugin from '@fullcalendar/interaction'
-import { listBookings } from '../../api/booking.api'
+import { getCalendarBookings } from '../../api/booking.api'
 import { PlusIcon } from '@heroicons/react/24/outline'
 
 function CalendarPage() {
-  const [events, setEvents] = useState([])
   const [loading, setLoading] = useState(true)
 
-  const fetchEvents = async () => {
+  // FullCalendar asks for exactly the visible range whenever the view changes
+  const fetchEvents = useCallback(async (info, successCallback, failureCallback) => {
     try {
       setLoading(true)
-      // Fetch all bookings (could filter by date range in future)
-      const res = await listBookings()
-      
+      const res = await getCalendarBookings(info.startStr, info.endStr)
+
       // Transform to FullCalendar format
       const calendarEvents = res.data.map(b => ({
         id: b.id.toString(),
@@ -32,16 +31,13 @@ function CalendarPage() {
           contactId: b.contact_id
         }
       }))
-      setEvents(calendarEvents)
+      successCallback(calendarEvents)
     } catch (err) {
       console.error("Failed to load calendar events", err)
+      failureCallback(err)
     } finally {
       setLoading(false)
     }
-  }
-
-  useEffect(() => {
-    fetchEvents()
   }, [])
 
   const getStatusColor = (status) => {
@@ -108,7 +104,7 @@ function CalendarPage() {
                    center: 'title',
                    right: 'dayGridMonth,timeGridWeek,timeGridDay'
                  }}
-                 events={events}
+                 events={fetchEvents}
                  eventClick={handleEventClick}
                  height="100%"
                  slotMinTime="06:00:00"
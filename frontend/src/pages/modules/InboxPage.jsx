@@ -21,6 +21,7 @@ import {
   PlusIcon
 } from '@heroicons/react/24/outline'
 import toast from 'react-hot-toast'
+import { useRealtimeTopics } from '../../context/ChatContext'
 
 function InboxPage() {
   const [conversations, setConversations] = useState([])
@@ -47,11 +48,24 @@ function InboxPage() {
     }
   }, [])
 
+  const isConnected = useRealtimeTopics(['inbox.message_created'], async (_topic, payload) => {
+    fetchConversations()
+    if (payload.conversation_id === selected) {
+      const res = await getConversation(selected)
+      setDetail(res.data)
+    }
+  })
+
   useEffect(() => {
     fetchConversations()
+  }, [fetchConversations])
+
+  // Poll only while the realtime socket is down
+  useEffect(() => {
+    if (isConnected) return
     const interval = setInterval(fetchConversations, 15000)
     return () => clearInterval(interval)
-  }, [fetchConversations])
+  }, [isConnected, fetchConversations])
 
   useEffect(() => {
     if (detail) scrollToBottom()
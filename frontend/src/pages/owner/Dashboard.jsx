@@ -5,6 +5,7 @@ import Sidebar from '../../components/layout/Sidebar'
 import Topbar from '../../components/layout/Topbar'
 import { useRole } from '../../hooks/useRole'
 import { useAuth } from '../../hooks/useAuth'
+import { useRealtimeTopics } from '../../context/ChatContext'
 import { getOwnerOverview } from '../../api/dashboard.api'
 import { DASHBOARD_CONFIG } from '../../config/dashboard.config'
 import { DEMO_DATA } from '../../config/demoData'
@@ -171,12 +172,24 @@ function Dashboard() {
     }
   }, [isDemo])
 
+  // Server pushes dashboard.invalidated after any relevant write
+  const isConnected = useRealtimeTopics(
+    ['dashboard.invalidated'],
+    () => isOwner && fetchData(range),
+    1000
+  )
+
   useEffect(() => {
     if (!isOwner) { setLoading(false); return }
     fetchData(range)
+  }, [isOwner, range, fetchData])
+
+  // Poll only while the realtime socket is down
+  useEffect(() => {
+    if (!isOwner || isConnected) return
     const id = setInterval(() => fetchData(range), DASHBOARD_CONFIG.autoRefreshInterval)
     return () => clearInterval(id)
-  }, [isOwner, range, fetchData])
+  }, [isOwner, isConnected, range, fetchData])
 
   if (!isOwner) return <AccessDenied />
   if (loading) return <DashboardSkeleton />